@@ -0,0 +1,33 @@
+# alembic/versions/0001_keyset_pagination_index.py
+"""keyset pagination index on processing_jobs
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_created_id "
+            "ON processing_jobs (created_at DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_created_id")
@@ -0,0 +1,53 @@
+# alembic/versions/0002_processing_job_stats_mv.py
+"""materialized view with daily processing_jobs statistics
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # total_time_ms/timed_count permitem recompor a média ponderada em qualquer período
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_processing_job_daily_stats AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            job_type,
+            status,
+            COALESCE(error_code, '') AS error_code,
+            count(*) AS job_count,
+            count(processing_time_ms) AS timed_count,
+            sum(processing_time_ms) AS total_time_ms,
+            avg(processing_time_ms) AS avg_processing_time_ms,
+            avg(input_size_bytes) AS avg_input_size_bytes
+        FROM processing_jobs
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+    # Índice único exigido pelo REFRESH CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_job_daily_stats_key "
+        "ON mv_processing_job_daily_stats (day, job_type, status, error_code)"
+    )
+    op.execute(
+        "CREATE INDEX idx_mv_job_daily_stats_day_type "
+        "ON mv_processing_job_daily_stats (day, job_type)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_processing_job_daily_stats")
@@ -0,0 +1,39 @@
+# alembic/versions/0003_processing_jobs_composite_indexes.py
+"""composite indexes for CRUDProcessingJob predicates
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "idx_pj_status_created": "processing_jobs (status, created_at DESC)",
+    "idx_pj_session_created": "processing_jobs (session_id, created_at DESC)",
+    "idx_pj_type_created": "processing_jobs (job_type, created_at DESC)",
+    "idx_pj_processing_started": "processing_jobs (started_at) WHERE status = 'processing'",
+}
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
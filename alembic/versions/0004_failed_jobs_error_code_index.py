@@ -0,0 +1,34 @@
+# alembic/versions/0004_failed_jobs_error_code_index.py
+"""partial index for failed jobs error codes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Permite index-only scan no agrupamento de erros por período
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pj_failed_error_code "
+            "ON processing_jobs (created_at, error_code) "
+            "WHERE status = 'failed' AND error_code IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_pj_failed_error_code")
@@ -0,0 +1,46 @@
+# alembic/versions/0005_trigram_search_indexes.py
+"""pg_trgm GIN indexes for CRUDBase.search
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# Colunas textuais pesquisadas com ILIKE '%termo%'
+TRGM_INDEXES = {
+    "idx_pj_input_filename_trgm": ("processing_jobs", "input_filename"),
+    "idx_pj_error_message_trgm": ("processing_jobs", "error_message"),
+    "idx_ocr_results_full_text_trgm": ("ocr_results", "full_text"),
+    "idx_barcode_results_data_trgm": ("barcode_results", "barcode_data"),
+    "idx_qrcode_results_data_trgm": ("qrcode_results", "qr_data"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for name, (table, column) in TRGM_INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING GIN ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        for name in TRGM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
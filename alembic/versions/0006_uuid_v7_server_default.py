@@ -0,0 +1,61 @@
+# alembic/versions/0006_uuid_v7_server_default.py
+"""server-side UUIDv7 primary key defaults
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# Tabelas com UUIDMixin
+UUID_TABLES = (
+    "processing_jobs",
+    "ocr_results",
+    "barcode_results",
+    "qrcode_results",
+    "user_sessions",
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    
+    for table in UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table in UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+    
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
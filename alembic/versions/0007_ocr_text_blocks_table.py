@@ -0,0 +1,75 @@
+# alembic/versions/0007_ocr_text_blocks_table.py
+"""ocr_text_blocks child table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+# Resultados OCR migrados por lote no backfill
+BACKFILL_BATCH_SIZE = 10_000
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "ocr_text_blocks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True,
+                  server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("ocr_result_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("ocr_results.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("block_index", sa.Integer(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=True),
+        sa.Column("confidence", sa.Float(), nullable=True),
+        sa.Column("bbox", sa.JSON(), nullable=True),
+        comment="Blocos de texto individuais dos resultados OCR",
+    )
+    op.create_index("idx_ocr_text_blocks_result_index", "ocr_text_blocks", ["ocr_result_id", "block_index"])
+    op.create_index("ix_ocr_text_blocks_job_id", "ocr_text_blocks", ["job_id"])
+    
+    # Backfill a partir do JSON text_blocks, em lotes de resultados (keyset por id)
+    conn = op.get_bind()
+    select_batch = sa.text(
+        "SELECT id FROM ocr_results "
+        "WHERE text_blocks IS NOT NULL AND id > :last_id "
+        "ORDER BY id LIMIT :batch_size"
+    )
+    insert_blocks = sa.text(
+        "INSERT INTO ocr_text_blocks (ocr_result_id, job_id, block_index, text, confidence, bbox) "
+        "SELECT r.id, r.job_id, b.ord - 1, b.elem->>'text', (b.elem->>'confidence')::float, b.elem->'bbox' "
+        "FROM ocr_results r "
+        "CROSS JOIN LATERAL json_array_elements(r.text_blocks) WITH ORDINALITY AS b(elem, ord) "
+        "WHERE r.id = ANY(:ids)"
+    ).bindparams(sa.bindparam("ids", type_=postgresql.ARRAY(postgresql.UUID(as_uuid=False))))
+    
+    last_id = "00000000-0000-0000-0000-000000000000"
+    while True:
+        ids = [str(row_id) for row_id in conn.execute(
+            select_batch, {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+        ).scalars()]
+        if not ids:
+            break
+        conn.execute(insert_blocks, {"ids": ids})
+        last_id = ids[-1]
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_ocr_text_blocks_job_id", table_name="ocr_text_blocks")
+    op.drop_index("idx_ocr_text_blocks_result_index", table_name="ocr_text_blocks")
+    op.drop_table("ocr_text_blocks")
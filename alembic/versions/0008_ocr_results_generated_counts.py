@@ -0,0 +1,61 @@
+# alembic/versions/0008_ocr_results_generated_counts.py
+"""ocr_results total_characters/total_words as generated columns
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# Mesmas expressões de OCRResult (app/models/database/ocr_result.py)
+TOTAL_CHARACTERS_EXPR = "COALESCE(char_length(full_text), 0)"
+TOTAL_WORDS_EXPR = (
+    "CASE WHEN full_text IS NULL OR btrim(full_text) = '' THEN 0 "
+    "ELSE array_length(regexp_split_to_array(btrim(full_text), '\\s+'), 1) END"
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # PostgreSQL < 17 não converte coluna comum em gerada: remove e recria
+    op.drop_column("ocr_results", "total_words")
+    op.drop_column("ocr_results", "total_characters")
+    
+    op.add_column("ocr_results", sa.Column(
+        "total_characters", sa.Integer(),
+        sa.Computed(TOTAL_CHARACTERS_EXPR, persisted=True),
+        nullable=False, comment="Número total de caracteres extraídos"
+    ))
+    op.add_column("ocr_results", sa.Column(
+        "total_words", sa.Integer(),
+        sa.Computed(TOTAL_WORDS_EXPR, persisted=True),
+        nullable=False, comment="Número total de palavras extraídas"
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_column("ocr_results", "total_words")
+    op.drop_column("ocr_results", "total_characters")
+    
+    op.add_column("ocr_results", sa.Column(
+        "total_characters", sa.Integer(), server_default="0",
+        nullable=False, comment="Número total de caracteres extraídos"
+    ))
+    op.add_column("ocr_results", sa.Column(
+        "total_words", sa.Integer(), server_default="0",
+        nullable=False, comment="Número total de palavras extraídas"
+    ))
+    op.execute(
+        f"UPDATE ocr_results SET total_characters = {TOTAL_CHARACTERS_EXPR}, "
+        f"total_words = {TOTAL_WORDS_EXPR}"
+    )
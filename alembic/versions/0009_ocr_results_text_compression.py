@@ -0,0 +1,40 @@
+# alembic/versions/0009_ocr_results_text_compression.py
+"""ocr_results full_text/text_blocks TOAST storage and lz4 compression
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+# Colunas grandes que vão para o TOAST
+TOASTED_COLUMNS = ("full_text", "text_blocks")
+
+
+def _supports_lz4() -> bool:
+    # SET COMPRESSION existe a partir do PostgreSQL 14
+    return op.get_bind().dialect.server_version_info >= (14,)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for column in TOASTED_COLUMNS:
+        op.execute(f"ALTER TABLE ocr_results ALTER COLUMN {column} SET STORAGE EXTENDED")
+        # lz4 descomprime mais rápido que pglz; vale para valores gravados daqui em diante
+        if _supports_lz4():
+            op.execute(f"ALTER TABLE ocr_results ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for column in TOASTED_COLUMNS:
+        if _supports_lz4():
+            op.execute(f"ALTER TABLE ocr_results ALTER COLUMN {column} SET COMPRESSION pglz")
@@ -0,0 +1,50 @@
+# alembic/versions/0010_processing_jobs_jsonb_gin.py
+"""processing_jobs processing_params/results as jsonb with GIN indexes
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+# Coluna -> índice GIN (jsonb_path_ops atende apenas @>, mas é menor e mais rápido)
+GIN_INDEXES = {
+    "processing_params": "ix_jobs_processing_params_gin",
+    "results": "ix_jobs_results_gin",
+}
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for column in GIN_INDEXES:
+        op.execute(
+            f"ALTER TABLE processing_jobs ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+        )
+    
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for column, name in GIN_INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON processing_jobs USING gin ({column} jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        for name in GIN_INDEXES.values():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    
+    for column in GIN_INDEXES:
+        op.execute(
+            f"ALTER TABLE processing_jobs ALTER COLUMN {column} TYPE json USING {column}::json"
+        )
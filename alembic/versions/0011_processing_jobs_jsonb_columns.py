@@ -0,0 +1,35 @@
+# alembic/versions/0011_processing_jobs_jsonb_columns.py
+"""processing_jobs input_dimensions/error_details as jsonb
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 19:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+# Colunas JSON restantes (processing_params e results migradas na 0010)
+JSONB_COLUMNS = ("input_dimensions", "error_details")
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for column in JSONB_COLUMNS:
+        op.execute(
+            f"ALTER TABLE processing_jobs ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for column in JSONB_COLUMNS:
+        op.execute(
+            f"ALTER TABLE processing_jobs ALTER COLUMN {column} TYPE json USING {column}::json"
+        )
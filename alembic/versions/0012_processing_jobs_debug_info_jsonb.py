@@ -0,0 +1,38 @@
+# alembic/versions/0012_processing_jobs_debug_info_jsonb.py
+"""processing_jobs debug_info as jsonb array
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Texto JSON gravado por json.dumps: listas mantidas, objeto único vira lista
+    op.execute("""
+        ALTER TABLE processing_jobs ALTER COLUMN debug_info TYPE jsonb USING
+            CASE
+                WHEN debug_info IS NULL THEN NULL
+                WHEN jsonb_typeof(debug_info::jsonb) = 'array' THEN debug_info::jsonb
+                ELSE jsonb_build_array(debug_info::jsonb)
+            END
+    """)
+    op.execute("ALTER TABLE processing_jobs ALTER COLUMN debug_info SET DEFAULT '[]'::jsonb")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute("ALTER TABLE processing_jobs ALTER COLUMN debug_info DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE processing_jobs ALTER COLUMN debug_info TYPE varchar USING debug_info::text"
+    )
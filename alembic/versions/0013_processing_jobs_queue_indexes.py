@@ -0,0 +1,49 @@
+# alembic/versions/0013_processing_jobs_queue_indexes.py
+"""processing_jobs pending queue index and status+results btree_gin index
+
+The composite GIN index also serves containment on results alone, so it
+replaces ix_jobs_results_gin (0010) instead of being a second GIN index
+to maintain on every job completion.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16 20:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_jobs_pending_created": "processing_jobs (created_at) WHERE status = 'pending'",
+    "ix_jobs_status_results_gin": "processing_jobs USING gin (status, results jsonb_path_ops)",
+}
+
+# Índice de 0010 substituído pelo composto (que também atende filtros só em results)
+REPLACED_INDEX = ("ix_jobs_results_gin", "processing_jobs USING gin (results jsonb_path_ops)")
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Classes de operador B-tree para GIN (status escalar no mesmo índice do JSONB)
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {REPLACED_INDEX[0]}")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        name, definition = REPLACED_INDEX
+        op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
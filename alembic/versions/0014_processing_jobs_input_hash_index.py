@@ -0,0 +1,34 @@
+# alembic/versions/0014_processing_jobs_input_hash_index.py
+"""processing_jobs input_hash index for completed-job deduplication
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0014'
+down_revision = '0013'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_jobs_input_hash_completed"
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Não é único: o mesmo arquivo pode ser processado com parâmetros diferentes
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON processing_jobs (input_hash) WHERE status = 'completed'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,95 @@
+# alembic/versions/0015_results_summary_generated_column.py
+"""processing_jobs results_summary as generated column
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16 21:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0015'
+down_revision = '0014'
+branch_labels = None
+depends_on = None
+
+SUMMARY_FUNCTIONS = (
+    "job_results_summary(job_type, jsonb)",
+    "job_summary_ocr(jsonb)",
+    "job_summary_barcode(jsonb)",
+    "job_summary_qrcode(jsonb)",
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION job_summary_ocr(r jsonb) RETURNS text AS $$
+            SELECT 'OCR: '
+                || COALESCE(jsonb_array_length(r->'text_blocks'), 0)::text || ' blocos, '
+                || COALESCE(char_length(r->>'full_text'), 0)::text || ' caracteres, idioma: '
+                || COALESCE(r->>'language_detected', 'desconhecido');
+        $$ LANGUAGE sql IMMUTABLE;
+
+        CREATE OR REPLACE FUNCTION job_summary_barcode(r jsonb) RETURNS text AS $$
+            SELECT CASE n
+                WHEN 0 THEN 'Barcode: Nenhum código encontrado'
+                WHEN 1 THEN 'Barcode: 1 código ' || COALESCE(r->'barcodes'->0->>'type', 'desconhecido') || ' encontrado'
+                ELSE 'Barcode: ' || n::text || ' códigos encontrados ('
+                    || (SELECT string_agg(barcode_type, ', ' ORDER BY first_seen)
+                        FROM (SELECT COALESCE(e->>'type', 'desconhecido') AS barcode_type, min(pos) AS first_seen
+                              FROM jsonb_array_elements(r->'barcodes') WITH ORDINALITY AS x(e, pos)
+                              GROUP BY 1) AS types)
+                    || ')'
+            END
+            FROM (SELECT COALESCE(jsonb_array_length(r->'barcodes'), 0) AS n) AS c;
+        $$ LANGUAGE sql IMMUTABLE;
+
+        CREATE OR REPLACE FUNCTION job_summary_qrcode(r jsonb) RETURNS text AS $$
+            SELECT CASE n
+                WHEN 0 THEN 'QR Code: Nenhum código encontrado'
+                WHEN 1 THEN 'QR Code: 1 código ' || COALESCE(r->'qr_codes'->0->>'data_type', 'texto') || ' encontrado'
+                ELSE 'QR Code: ' || n::text || ' códigos encontrados'
+            END
+            FROM (SELECT COALESCE(jsonb_array_length(r->'qr_codes'), 0) AS n) AS c;
+        $$ LANGUAGE sql IMMUTABLE;
+
+        CREATE OR REPLACE FUNCTION job_results_summary(p_job_type job_type, r jsonb) RETURNS text AS $$
+            SELECT CASE p_job_type
+                WHEN 'ocr' THEN job_summary_ocr(r)
+                WHEN 'barcode' THEN job_summary_barcode(r)
+                WHEN 'qrcode' THEN job_summary_qrcode(r)
+                WHEN 'all' THEN COALESCE(NULLIF(concat_ws(' | ',
+                    CASE WHEN r ? 'ocr' THEN job_summary_ocr(r->'ocr') END,
+                    CASE WHEN r ? 'barcodes' THEN job_summary_barcode(r->'barcodes') END,
+                    CASE WHEN r ? 'qr_codes' THEN job_summary_qrcode(r->'qr_codes') END
+                ), ''), 'Processamento combinado concluído')
+            END;
+        $$ LANGUAGE sql IMMUTABLE STRICT;
+        """
+    )
+    
+    # Coluna comum não pode virar gerada (PostgreSQL < 17): remove e recria
+    op.drop_column("processing_jobs", "results_summary")
+    op.add_column("processing_jobs", sa.Column(
+        "results_summary", sa.Text(),
+        sa.Computed("job_results_summary(job_type, results)", persisted=True),
+        nullable=True, comment="Resumo textual dos resultados principais"
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_column("processing_jobs", "results_summary")
+    op.add_column("processing_jobs", sa.Column(
+        "results_summary", sa.Text(),
+        nullable=True, comment="Resumo textual dos resultados principais"
+    ))
+    op.execute("UPDATE processing_jobs SET results_summary = job_results_summary(job_type, results)")
+    
+    for signature in SUMMARY_FUNCTIONS:
+        op.execute(f"DROP FUNCTION IF EXISTS {signature}")
@@ -0,0 +1,40 @@
+# alembic/versions/0016_processing_jobs_brin_indexes.py
+"""processing_jobs BRIN indexes on created_at/completed_at
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0016'
+down_revision = '0015'
+branch_labels = None
+depends_on = None
+
+# Índice -> coluna (min/max por faixa de 32 páginas)
+BRIN_INDEXES = {
+    "brin_jobs_created": "created_at",
+    "brin_jobs_completed": "completed_at",
+}
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for name, column in BRIN_INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON processing_jobs USING brin ({column}) WITH (pages_per_range = 32)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        for name in BRIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,34 @@
+# alembic/versions/0017_processing_jobs_results_compression.py
+"""processing_jobs results lz4 TOAST compression
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16 22:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0017'
+down_revision = '0016'
+branch_labels = None
+depends_on = None
+
+
+def _supports_lz4() -> bool:
+    # SET COMPRESSION existe a partir do PostgreSQL 14
+    return op.get_bind().dialect.server_version_info >= (14,)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Vale para valores gravados daqui em diante; os existentes seguem em pglz
+    if _supports_lz4():
+        op.execute("ALTER TABLE processing_jobs ALTER COLUMN results SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if _supports_lz4():
+        op.execute("ALTER TABLE processing_jobs ALTER COLUMN results SET COMPRESSION pglz")
@@ -0,0 +1,67 @@
+# alembic/versions/0018_job_debug_entries_table.py
+"""job_debug_entries append-only table
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-16 23:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0018'
+down_revision = '0017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "job_debug_entries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True,
+                  server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("processing_jobs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("ts", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("info", postgresql.JSONB(), nullable=True),
+        comment="Histórico de informações de debug dos jobs",
+    )
+    op.create_index("idx_job_debug_entries_job_ts", "job_debug_entries", ["job_id", "ts"])
+    
+    # Uma linha por elemento do array; entradas sem timestamp ficam com o created_at do job
+    op.execute("""
+        INSERT INTO job_debug_entries (job_id, ts, info)
+        SELECT j.id, COALESCE((e.elem->>'timestamp')::timestamptz, j.created_at), e.elem->'info'
+        FROM processing_jobs j
+        CROSS JOIN LATERAL jsonb_array_elements(j.debug_info) AS e(elem)
+        WHERE jsonb_typeof(j.debug_info) = 'array'
+    """)
+    op.drop_column("processing_jobs", "debug_info")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.add_column(
+        "processing_jobs",
+        sa.Column("debug_info", postgresql.JSONB(), nullable=True,
+                  server_default=sa.text("'[]'::jsonb"))
+    )
+    op.execute("""
+        UPDATE processing_jobs j
+        SET debug_info = d.entries
+        FROM (
+            SELECT job_id,
+                   jsonb_agg(jsonb_build_object('timestamp', ts, 'info', info) ORDER BY ts) AS entries
+            FROM job_debug_entries
+            GROUP BY job_id
+        ) d
+        WHERE d.job_id = j.id
+    """)
+    op.drop_index("idx_job_debug_entries_job_ts", table_name="job_debug_entries")
+    op.drop_table("job_debug_entries")
@@ -4,12 +4,7 @@ Módulo de rotas da API.
 Centraliza todas as rotas disponíveis.
 """
 
-# Import todas as rotas para facilitar o uso
-from . import health
-from . import ocr
-from . import barcode
-from . import qrcode
-from . import jobs
+import importlib
 
 __all__ = [
     "health",
@@ -17,4 +12,13 @@ __all__ = [
     "barcode",
     "qrcode",
     "jobs"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """
+    Importa o módulo de rota sob demanda: rotas de features desabilitadas
+    não carregam OpenCV/PaddleOCR/pyzbar no startup do worker.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
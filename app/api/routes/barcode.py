@@ -6,7 +6,6 @@ Suporta diversos tipos: EAN13, CODE128, CODE39, etc.
 import time
 import os
 from typing import Dict, Any, Optional, List
-from uuid import uuid4
 from fastapi import APIRouter, File, UploadFile, Form, Depends
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, validator
@@ -15,6 +14,7 @@ from app.config.database import get_db
 from app.config.settings import settings
 from app.core.barcode_service import BarcodeService
 from app.core.image_processor import ImageProcessor
+from app.models.database.base import uuid4, uuid7
 from app.models.database.processing_job import ProcessingJob, JobType, JobStatus
 from app.utils.exceptions import (
     OCRAPIException, ValidationError, InvalidImageFormat, 
@@ -99,7 +99,7 @@ async def read_barcodes(
         Resultados dos códigos de barras encontrados
     """
     start_time = time.time()
-    job_id = uuid4()
+    job_id = uuid7()
     temp_file_path = None
     
     # Processar tipos de barcode se fornecidos
@@ -294,7 +294,6 @@ async def read_barcodes_batch(
     
     start_time = time.time()
     batch_id = uuid4()
-    results = []
     
     # Processar tipos de barcode
     types_list = None
@@ -310,37 +309,50 @@ async def read_barcodes_batch(
         }
     )
     
+    # Validar os arquivos e criar os jobs do lote em um único INSERT
+    results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+    job_rows = []
     for i, file in enumerate(files):
-        temp_file_path = None
         try:
-            # Processar cada arquivo individualmente
-            job_id = uuid4()
-            
-            # Validar arquivo
             validate_uploaded_file(file)
-            
-            # Criar job
-            job = ProcessingJob(
-                id=job_id,
-                job_type=JobType.BARCODE,
-                status=JobStatus.PENDING,
-                input_filename=file.filename,
-                input_format=file.filename.split('.')[-1].lower() if file.filename else None,
-                processing_params={
-                    "barcode_types": types_list,
-                    "enhance_image": enhance_image,
-                    "batch_id": str(batch_id),
-                    "batch_index": i
-                }
-            )
-            
-            file.file.seek(0, 2)
-            job.input_size_bytes = file.file.tell()
-            file.file.seek(0)
-            
-            db.add(job)
-            db.commit()
-            
+        except Exception as e:
+            logger.error(f"Erro no arquivo {file.filename}: {str(e)}")
+            results[i] = {
+                "job_id": None,
+                "input_filename": file.filename,
+                "status": "failed",
+                "error": str(e)
+            }
+            continue
+        
+        file.file.seek(0, 2)
+        input_size_bytes = file.file.tell()
+        file.file.seek(0)
+        
+        job_rows.append({
+            "id": uuid7(),
+            "job_type": JobType.BARCODE,
+            "status": JobStatus.PENDING,
+            "input_filename": file.filename,
+            "input_format": file.filename.split('.')[-1].lower() if file.filename else None,
+            "input_size_bytes": input_size_bytes,
+            "processing_params": {
+                "barcode_types": types_list,
+                "enhance_image": enhance_image,
+                "batch_id": str(batch_id),
+                "batch_index": i
+            }
+        })
+    
+    jobs = ProcessingJob.create_batch(db, job_rows)
+    db.commit()
+    
+    for job in jobs:
+        i = job.processing_params["batch_index"]
+        file = files[i]
+        job_id = job.id
+        temp_file_path = None
+        try:
             # Salvar e processar arquivo
             temp_file_path = save_uploaded_file(file)
             
@@ -363,22 +375,22 @@ async def read_barcodes_batch(
             db.commit()
             
             # Adicionar aos resultados
-            results.append({
+            results[i] = {
                 "job_id": str(job_id),
                 "input_filename": file.filename,
                 "status": "completed",
                 "barcodes": barcode_results["barcodes"],
                 "count": barcode_results["count"]
-            })
+            }
             
         except Exception as e:
             logger.error(f"Erro no arquivo {file.filename}: {str(e)}")
-            results.append({
-                "job_id": str(job_id) if 'job_id' in locals() else None,
+            results[i] = {
+                "job_id": str(job_id),
                 "input_filename": file.filename,
                 "status": "failed",
                 "error": str(e)
-            })
+            }
         
         finally:
             if temp_file_path:
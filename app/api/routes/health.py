@@ -12,9 +12,6 @@ from sqlalchemy.orm import Session
 
 from app.config.database import get_db, db_manager
 from app.config.settings import settings
-from app.core.ocr_service import OCRService
-from app.core.barcode_service import BarcodeService
-from app.core.qrcode_service import QRCodeService
 from app.utils.exceptions import OCRAPIException
 
 router = APIRouter()
@@ -54,6 +51,7 @@ async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
     # VERIFICAR PADDLE OCR
     # ======================
     try:
+        from app.core.ocr_service import OCRService
         ocr_service = OCRService()
         services["paddle_ocr"] = {
             "status": "ready",
@@ -73,6 +71,7 @@ async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
     # VERIFICAR BARCODE READER
     # ======================
     try:
+        from app.core.barcode_service import BarcodeService
         barcode_service = BarcodeService()
         services["barcode_reader"] = {
             "status": "ready",
@@ -90,6 +89,7 @@ async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
     # VERIFICAR QR READER
     # ======================
     try:
+        from app.core.qrcode_service import QRCodeService
         qr_service = QRCodeService()
         services["qr_reader"] = {
             "status": "ready"
@@ -227,6 +227,7 @@ async def services_health_check() -> Dict[str, Any]:
     
     # Testar OCR Service
     try:
+        from app.core.ocr_service import OCRService
         ocr_service = OCRService()
         services_status["ocr"] = {
             "status": "ready",
@@ -241,6 +242,7 @@ async def services_health_check() -> Dict[str, Any]:
     
     # Testar Barcode Service
     try:
+        from app.core.barcode_service import BarcodeService
         barcode_service = BarcodeService()
         services_status["barcode"] = {
             "status": "ready",
@@ -254,6 +256,7 @@ async def services_health_check() -> Dict[str, Any]:
     
     # Testar QR Code Service
     try:
+        from app.core.qrcode_service import QRCodeService
         qr_service = QRCodeService()
         services_status["qrcode"] = {
             "status": "ready"
@@ -283,29 +283,35 @@ async def list_jobs(
         # Aplicar ordenação
         order_column = getattr(ProcessingJob, query_params.order_by)
         if query_params.order_dir == "desc":
-            query = query.order_by(desc(order_column))
+            order_expr = desc(order_column)
         else:
-            query = query.order_by(asc(order_column))
+            order_expr = asc(order_column)
         
-        # Aplicar paginação
+        # Aplicar paginação (projeção de colunas, sem objetos ORM)
         offset = (query_params.page - 1) * query_params.limit
-        jobs = query.offset(offset).limit(query_params.limit).all()
+        jobs = ProcessingJob.list_summary(
+            db,
+            filters=filters,
+            order_by=order_expr,
+            offset=offset,
+            limit=query_params.limit
+        )
         
         # Preparar resultados
         job_summaries = []
         for job in jobs:
             job_summaries.append({
-                "job_id": str(job.id),
-                "job_type": job.job_type.value,
-                "status": job.status.value,
-                "created_at": job.created_at.isoformat(),
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "processing_time_ms": job.processing_time_ms,
-                "input_filename": job.input_filename,
-                "input_size_bytes": job.input_size_bytes,
-                "success": job.status == JobStatus.COMPLETED,
-                "error_code": job.error_code,
-                "results_summary": job.results_summary
+                "job_id": str(job["id"]),
+                "job_type": job["job_type"].value,
+                "status": job["status"].value,
+                "created_at": job["created_at"].isoformat(),
+                "completed_at": job["completed_at"].isoformat() if job["completed_at"] else None,
+                "processing_time_ms": job["processing_time_ms"],
+                "input_filename": job["input_filename"],
+                "input_size_bytes": job["input_size_bytes"],
+                "success": job["status"] == JobStatus.COMPLETED,
+                "error_code": job["error_code"],
+                "results_summary": job["results_summary"]
             })
         
         # Calcular informações de paginação
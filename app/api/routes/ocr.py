@@ -6,8 +6,8 @@ Processa imagens para extrair texto usando PaddleOCR.
 import time
 import tempfile
 import os
+import hashlib
 from typing import Dict, Any, Optional, List
-from uuid import uuid4
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
@@ -17,6 +17,7 @@ from app.config.database import get_db
 from app.config.settings import settings
 from app.core.ocr_service import OCRService
 from app.core.image_processor import ImageProcessor
+from app.models.database.base import uuid4, uuid7
 from app.models.database.processing_job import ProcessingJob, JobType, JobStatus
 from app.utils.exceptions import (
     OCRAPIException, ValidationError, InvalidImageFormat, 
@@ -135,7 +136,7 @@ async def process_ocr(
         Resultados do OCR com job_id para tracking
     """
     start_time = time.time()
-    job_id = uuid4()
+    job_id = uuid7()
     temp_file_path = None
     
     # Criar job no banco
@@ -164,6 +165,10 @@ async def process_ocr(
         
         job.input_size_bytes = file_size
         
+        # Hash do conteúdo para deduplicação
+        job.input_hash = hashlib.sha256(file.file.read()).hexdigest()
+        file.file.seek(0)
+        
         # Salvar job no banco
         db.add(job)
         db.commit()
@@ -178,32 +183,41 @@ async def process_ocr(
             }
         )
         
-        # Salvar arquivo temporário
-        temp_file_path = save_uploaded_file(file)
-        
-        # Processar imagem (se necessário)
-        if enhance_image:
-            image_processor = ImageProcessor()
-            processed_image = image_processor.load_and_process(
-                temp_file_path, 
-                enhance=True, 
-                resize=True
-            )
-            # Salvar imagem processada
-            import cv2
-            cv2.imwrite(temp_file_path, processed_image)
-        
-        # Marcar job como em processamento
-        job.start_processing()
-        db.commit()
-        
-        # Executar OCR
-        ocr_service = OCRService()
-        ocr_results = ocr_service.process_image(
-            image_path=temp_file_path,
-            language=language,
-            return_confidence=return_confidence
+        # Mesmo arquivo já processado com os mesmos parâmetros: reaproveita os resultados
+        previous_results = ProcessingJob.find_completed_duplicate_results(
+            db, job.input_hash, JobType.OCR, job.processing_params
         )
+        if previous_results is not None:
+            job.start_processing()
+            db.commit()
+            ocr_results = previous_results
+        else:
+            # Salvar arquivo temporário
+            temp_file_path = save_uploaded_file(file)
+            
+            # Processar imagem (se necessário)
+            if enhance_image:
+                image_processor = ImageProcessor()
+                processed_image = image_processor.load_and_process(
+                    temp_file_path, 
+                    enhance=True, 
+                    resize=True
+                )
+                # Salvar imagem processada
+                import cv2
+                cv2.imwrite(temp_file_path, processed_image)
+            
+            # Marcar job como em processamento
+            job.start_processing()
+            db.commit()
+            
+            # Executar OCR
+            ocr_service = OCRService()
+            ocr_results = ocr_service.process_image(
+                image_path=temp_file_path,
+                language=language,
+                return_confidence=return_confidence
+            )
         
         # Calcular tempo de processamento
         processing_time_ms = int((time.time() - start_time) * 1000)
@@ -304,7 +318,7 @@ async def process_ocr_from_url(
     import tempfile
     
     start_time = time.time()
-    job_id = uuid4()
+    job_id = uuid7()
     temp_file_path = None
     
     # Criar job no banco
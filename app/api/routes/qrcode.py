@@ -5,15 +5,18 @@ Detecta e decodifica QR codes em imagens.
 """
 import time
 import os
-from typing import Dict, Any, List
-from uuid import uuid4
+from typing import Dict, Any, List, Optional
+from uuid import UUID
 from fastapi import APIRouter, File, UploadFile, Form, Depends
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
 from app.config.settings import settings
+from app.crud.qrcode_result import get_qrcode_result_json, stream_qrcode_results_by_job_ndjson
 from app.core.qrcode_service import QRCodeService
 from app.core.image_processor import ImageProcessor
+from app.models.database.base import uuid4, uuid7
 from app.models.database.processing_job import ProcessingJob, JobType, JobStatus
 from app.utils.exceptions import (
     OCRAPIException, ValidationError, InvalidImageFormat, 
@@ -110,7 +113,7 @@ async def read_qrcodes(
         Resultados dos códigos QR encontrados
     """
     start_time = time.time()
-    job_id = uuid4()
+    job_id = uuid7()
     temp_file_path = None
     
     # Criar job no banco
@@ -295,7 +298,7 @@ async def generate_qrcode(
     from PIL import Image
     
     start_time = time.time()
-    job_id = uuid4()
+    job_id = uuid7()
     
     # Validar parâmetros
     if len(data) > 2000:  # Limite razoável para QR codes
@@ -443,7 +446,6 @@ async def read_qrcodes_batch(
     
     start_time = time.time()
     batch_id = uuid4()
-    results = []
     
     logger.info(
         f"Iniciando processamento em lote de QR codes",
@@ -454,36 +456,50 @@ async def read_qrcodes_batch(
         }
     )
     
+    # Validar os arquivos e criar os jobs do lote em um único INSERT
+    results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+    job_rows = []
     for i, file in enumerate(files):
-        temp_file_path = None
         try:
-            job_id = uuid4()
-            
-            # Validar arquivo
             validate_uploaded_file(file)
-            
-            # Criar job
-            job = ProcessingJob(
-                id=job_id,
-                job_type=JobType.QRCODE,
-                status=JobStatus.PENDING,
-                input_filename=file.filename,
-                input_format=file.filename.split('.')[-1].lower() if file.filename else None,
-                processing_params={
-                    "multiple": multiple,
-                    "enhance_image": enhance_image,
-                    "batch_id": str(batch_id),
-                    "batch_index": i
-                }
-            )
-            
-            file.file.seek(0, 2)
-            job.input_size_bytes = file.file.tell()
-            file.file.seek(0)
-            
-            db.add(job)
-            db.commit()
-            
+        except Exception as e:
+            logger.error(f"Erro no arquivo {file.filename}: {str(e)}")
+            results[i] = {
+                "job_id": None,
+                "input_filename": file.filename,
+                "status": "failed",
+                "error": str(e)
+            }
+            continue
+        
+        file.file.seek(0, 2)
+        input_size_bytes = file.file.tell()
+        file.file.seek(0)
+        
+        job_rows.append({
+            "id": uuid7(),
+            "job_type": JobType.QRCODE,
+            "status": JobStatus.PENDING,
+            "input_filename": file.filename,
+            "input_format": file.filename.split('.')[-1].lower() if file.filename else None,
+            "input_size_bytes": input_size_bytes,
+            "processing_params": {
+                "multiple": multiple,
+                "enhance_image": enhance_image,
+                "batch_id": str(batch_id),
+                "batch_index": i
+            }
+        })
+    
+    jobs = ProcessingJob.create_batch(db, job_rows)
+    db.commit()
+    
+    for job in jobs:
+        i = job.processing_params["batch_index"]
+        file = files[i]
+        job_id = job.id
+        temp_file_path = None
+        try:
             # Salvar e processar arquivo
             temp_file_path = save_uploaded_file(file)
             
@@ -510,22 +526,22 @@ async def read_qrcodes_batch(
             db.commit()
             
             # Adicionar aos resultados
-            results.append({
+            results[i] = {
                 "job_id": str(job_id),
                 "input_filename": file.filename,
                 "status": "completed",
                 "qr_codes": qr_results["qr_codes"],
                 "count": qr_results["count"]
-            })
+            }
             
         except Exception as e:
             logger.error(f"Erro no arquivo {file.filename}: {str(e)}")
-            results.append({
-                "job_id": str(job_id) if 'job_id' in locals() else None,
+            results[i] = {
+                "job_id": str(job_id),
                 "input_filename": file.filename,
                 "status": "failed",
                 "error": str(e)
-            })
+            }
         
         finally:
             if temp_file_path:
@@ -563,6 +579,44 @@ async def read_qrcodes_batch(
         }
     }
 
+@router.get("/qrcode/jobs/{job_id}/results", tags=["QR Code"])
+async def stream_qrcode_results(job_id: UUID) -> StreamingResponse:
+    """
+    Lista os QR codes de um job em streaming (NDJSON, um resultado por linha).
+    
+    Args:
+        job_id: ID do job de processamento
+    
+    Returns:
+        StreamingResponse com os resultados serializados linha a linha
+    """
+    return StreamingResponse(
+        stream_qrcode_results_by_job_ndjson(job_id),
+        media_type="application/x-ndjson"
+    )
+
+@router.get("/qrcode/results/{result_id}", tags=["QR Code"])
+async def get_qrcode_result(result_id: UUID) -> Response:
+    """
+    Retorna um resultado de QR code pelo ID.
+    
+    Args:
+        result_id: ID do resultado
+    
+    Returns:
+        JSON do resultado (mesmo formato de QRCodeResult.to_dict)
+    """
+    payload = await get_qrcode_result_json(result_id)
+    if payload is None:
+        raise OCRAPIException(
+            message=f"Resultado de QR code não encontrado: {result_id}",
+            error_code="QRCODE_RESULT_NOT_FOUND",
+            status_code=404,
+            details={"result_id": str(result_id)}
+        )
+    
+    return Response(payload, media_type="application/json")
+
 @router.get("/qrcode/info", tags=["QR Code"])
 async def get_qrcode_info() -> Dict[str, Any]:
     """
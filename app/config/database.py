@@ -3,16 +3,23 @@ Configuração do banco de dados PostgreSQL.
 Setup do SQLAlchemy com connection pooling otimizado.
 """
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
-from typing import Generator
+from typing import AsyncGenerator, Generator
+import asyncio
 import logging
+import orjson
 
 from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+def _json_serializer(value) -> str:
+    """Serializa colunas JSON com orjson (chaves não-str convertidas como no json padrão)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 # Configuração do engine PostgreSQL
 engine = create_engine(
     settings.DATABASE_URL,
@@ -23,6 +30,10 @@ engine = create_engine(
     pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,  # Verifica conexões antes de usar
     echo=settings.DATABASE_ECHO,  # Log SQL queries se habilitado
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,  # Cache de SQL compilado
+    insertmanyvalues_page_size=1000,  # Linhas por INSERT multi-VALUES em executemany
+    json_serializer=_json_serializer,  # orjson nas colunas JSON (text_blocks etc.)
+    json_deserializer=orjson.loads,
     future=True,  # SQLAlchemy 2.0 style
     connect_args={
         "options": "-c timezone=utc"  # Força timezone UTC
@@ -37,6 +48,36 @@ SessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
+# Engine assíncrono (asyncpg) para o CRUD assíncrono (resultados de QR code)
+async_engine = create_async_engine(
+    settings.database_url_async,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=True,
+    echo=settings.DATABASE_ECHO,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=1000,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "server_settings": {"timezone": "utc"}  # Força timezone UTC
+    }
+)
+
+# Session factory assíncrona
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Sessão assíncrona com escopo de requisição (uma por task do asyncio).
+# Liberada pelo TimingMiddleware ao final de cada requisição.
+async_db_session = async_scoped_session(AsyncSessionLocal, scopefunc=asyncio.current_task)
+
 # Base declarativa para modelos
 Base = declarative_base()
 
@@ -77,6 +118,21 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency para injeção de sessão assíncrona do banco de dados.
+    
+    Yields:
+        AsyncSession: Sessão assíncrona do SQLAlchemy
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Erro na sessão assíncrona do banco: {str(e)}")
+            await db.rollback()
+            raise
+
 def create_tables():
     """
     Cria todas as tabelas no banco de dados.
@@ -248,5 +304,11 @@ def close_db():
     """
     db_manager.close_all_connections()
 
+async def close_async_db():
+    """
+    Fecha conexões do engine assíncrono na finalização da aplicação.
+    """
+    await async_engine.dispose()
+
 # Import para melhor debugging
 import time
\ No newline at end of file
@@ -5,7 +5,6 @@ Suporta EAN, CODE128, etc.
 from typing import List, Dict, Any, Optional
 import logging
 import cv2
-from pyzbar.pyzbar import decode
 import numpy as np
 from app.utils.exceptions import OCRAPIException
 
@@ -38,8 +37,10 @@ class BarcodeService:
         Raises:
             OCRAPIException: Em caso de falha na leitura.
         """
-        if barcode_types:
-            for typ in barcode_types:
+        type_filter = frozenset(barcode_types) if barcode_types else None
+        
+        if type_filter:
+            for typ in type_filter:
                 if typ not in self.supported_types:
                     raise OCRAPIException(
                         status_code=400,
@@ -48,6 +49,9 @@ class BarcodeService:
                         details=f"Tipos disponíveis: {self.supported_types}"
                     )
         
+        # Import tardio: carregar o pyzbar resolve os símbolos da libzbar
+        from pyzbar.pyzbar import decode
+        
         try:
             image = cv2.imread(image_path)
             if image is None:
@@ -57,7 +61,9 @@ class BarcodeService:
                     message="Não foi possível carregar a imagem"
                 )
             
-            decoded_objects = decode(image)
+            # Passar o buffer cru (pixels, largura, altura) direto para o ZBar
+            gray = np.ascontiguousarray(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
+            decoded_objects = decode((gray.tobytes(), gray.shape[1], gray.shape[0]))
             
             if not decoded_objects:
                 raise OCRAPIException(
@@ -68,7 +74,7 @@ class BarcodeService:
             
             barcodes = []
             for obj in decoded_objects:
-                if barcode_types and obj.type not in barcode_types:
+                if type_filter is not None and obj.type not in type_filter:
                     continue
                 barcodes.append({
                     "data": obj.data.decode('utf-8'),
@@ -4,6 +4,7 @@ Usa OpenCV para manipulação.
 """
 from typing import Optional
 import logging
+import threading
 import cv2
 import numpy as np
 from app.config.settings import settings
@@ -11,6 +12,21 @@ from app.utils.exceptions import OCRAPIException
 
 logger = logging.getLogger(__name__)
 
+# Kernel de sharpening usado em enhance_image
+_SHARPEN_KERNEL = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
+
+# Objetos CLAHE são caros de construir e mantêm buffers internos,
+# então guardamos uma instância por thread do executor
+_thread_local = threading.local()
+
+def _get_clahe() -> "cv2.CLAHE":
+    """Retorna o objeto CLAHE da thread atual, criando-o na primeira chamada."""
+    clahe = getattr(_thread_local, "clahe", None)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        _thread_local.clahe = clahe
+    return clahe
+
 class ImageProcessor:
     """
     Classe para processar e validar imagens antes do uso nos serviços.
@@ -73,7 +89,7 @@ class ImageProcessor:
     
     def enhance_image(self, image: np.ndarray) -> np.ndarray:
         """
-        Aplica melhorias básicas na imagem (contraste, sharpening).
+        Aplica melhorias básicas na imagem (contraste via CLAHE, sharpening).
         
         Args:
             image: Array NumPy da imagem.
@@ -82,12 +98,10 @@ class ImageProcessor:
             Imagem aprimorada.
         """
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        equalized = cv2.equalizeHist(gray)
+        equalized = _get_clahe().apply(gray)
         enhanced = cv2.cvtColor(equalized, cv2.COLOR_GRAY2BGR)
         
-        # Sharpening kernel
-        kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
-        sharpened = cv2.filter2D(enhanced, -1, kernel)
+        sharpened = cv2.filter2D(enhanced, -1, _SHARPEN_KERNEL)
         
         logger.info("Melhorias aplicadas na imagem")
         return sharpened
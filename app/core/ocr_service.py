@@ -5,7 +5,6 @@ Responsável por inicializar o modelo e processar imagens.
 from typing import List, Dict, Any, Optional
 import logging
 import cv2
-from paddleocr import PaddleOCR
 import numpy as np
 from app.config.settings import settings
 from app.utils.exceptions import OCRAPIException  # Assumindo que exceptions.py existe; se não, crie com classe base
@@ -24,6 +23,10 @@ class OCRService:
     def __init__(self):
         """Inicializa o serviço OCR com configurações do PaddleOCR."""
         try:
+            # Import tardio: o PaddleOCR carrega o Paddle inteiro (centenas de MB),
+            # então só pagamos esse custo quando o serviço é de fato instanciado
+            from paddleocr import PaddleOCR
+            
             self.paddle_ocr = PaddleOCR(
                 use_angle_cls=settings.PADDLE_OCR_USE_ANGLE_CLS,
                 lang=settings.PADDLE_OCR_LANG,
@@ -0,0 +1,185 @@
+# app/core/ocr_stats.py
+"""
+Estatísticas de resultados OCR.
+Um documento é processado em uma única passada (Welford); em lote, as
+confianças de todos os blocos ficam em um único array NumPy e são
+reduzidas por documento.
+"""
+import math
+import re
+from itertools import chain
+from typing import Any, Dict, List
+import numpy as np
+
+# Limite abaixo do qual um bloco é considerado de baixa confiança
+LOW_CONFIDENCE_THRESHOLD = 0.8
+
+# RE2 (google-re2, opcional) executa os padrões como DFA em tempo linear;
+# sem ele, usa o módulo re padrão com classes ASCII (mesma semântica do RE2)
+try:
+    import re2
+    
+    def _compile_scan_pattern(pattern: str):
+        return re2.compile(pattern)
+except ImportError:
+    def _compile_scan_pattern(pattern: str):
+        return re.compile(pattern, re.ASCII)
+
+# Padrões de análise de conteúdo, compilados uma única vez
+_SENTENCE_RE = re.compile(r'[.!?]+')
+_EMAIL_RE = _compile_scan_pattern(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = _compile_scan_pattern(r'(\(?\d{2}\)?\s?)?\d{4,5}-?\d{4}')  # padrão brasileiro
+_URL_RE = _compile_scan_pattern(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_NUMERIC_RE = _compile_scan_pattern(r'\b\d{4,}\b')  # 4 ou mais dígitos consecutivos
+
+def _count_matches(pattern, text: str) -> int:
+    # Conta sem montar a lista de strings que findall devolveria
+    return sum(1 for _ in pattern.finditer(text))
+
+def analyze_text(text: str) -> Dict[str, int]:
+    """
+    Conta sentenças, parágrafos, emails, telefones, URLs e sequências numéricas.
+    
+    Args:
+        text: Texto completo extraído
+    
+    Returns:
+        Dicionário com as contagens, nas chaves das colunas de OCRResult
+    """
+    return {
+        "sentences_count": sum(1 for s in _SENTENCE_RE.split(text) if s.strip()),
+        "paragraphs_count": sum(1 for p in text.split('\n\n') if p.strip()),
+        "email_addresses": _count_matches(_EMAIL_RE, text),
+        "phone_numbers": _count_matches(_PHONE_RE, text),
+        "urls_found": _count_matches(_URL_RE, text),
+        "numeric_sequences": _count_matches(_NUMERIC_RE, text)
+    }
+
+def compute_block_stats(text_blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Calcula as estatísticas de um único resultado OCR em uma passada.
+    
+    Média e desvio padrão usam o algoritmo online de Welford, sem
+    materializar a lista de confianças.
+    
+    Args:
+        text_blocks: Lista de blocos de texto do OCR
+    
+    Returns:
+        Dicionário de valores de coluna (vazio se não houver blocos)
+    """
+    if not text_blocks:
+        return {}
+    
+    text_parts = []
+    n, mean, m2, low = 0, 0.0, 0.0, 0
+    mn, mx = math.inf, -math.inf
+    for block in text_blocks:
+        text_parts.append(block.get("text", ""))
+        
+        confidence = block.get("confidence")
+        if confidence is None:
+            continue
+        
+        n += 1
+        delta = confidence - mean
+        mean += delta / n
+        m2 += delta * (confidence - mean)
+        if confidence < mn:
+            mn = confidence
+        if confidence > mx:
+            mx = confidence
+        if confidence < LOW_CONFIDENCE_THRESHOLD:
+            low += 1
+    
+    # total_characters/total_words são colunas geradas a partir de full_text
+    full_text = " ".join(text_parts).strip()
+    stats = {
+        "total_blocks": len(text_blocks),
+        "full_text": full_text
+    }
+    if full_text:
+        stats.update(analyze_text(full_text))
+    
+    if n:
+        stats["confidence_avg"] = mean
+        stats["confidence_min"] = mn
+        stats["confidence_max"] = mx
+        if n > 1:
+            stats["confidence_std"] = math.sqrt(m2 / (n - 1))
+        stats["blocks_with_low_confidence"] = low
+    
+    return stats
+
+def compute_ocr_stats(blocks_batch: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Calcula as estatísticas de vários resultados OCR de uma vez.
+    
+    Args:
+        blocks_batch: Lista de documentos, cada um com sua lista de blocos de texto
+    
+    Returns:
+        Um dicionário de valores de coluna por documento (vazio se não houver blocos),
+        pronto para atribuir ao modelo ou passar para OCRResult.bulk_create
+    """
+    results: List[Dict[str, Any]] = []
+    confidences: List[List[float]] = []
+    
+    # Uma passada por documento: texto completo e confianças
+    for text_blocks in blocks_batch:
+        if not text_blocks:
+            results.append({})
+            confidences.append([])
+            continue
+        
+        text_parts = []
+        doc_confidences = []
+        for block in text_blocks:
+            confidence = block.get("confidence")
+            
+            text_parts.append(block.get("text", ""))
+            if confidence is not None:
+                doc_confidences.append(confidence)
+        
+        # total_characters/total_words são colunas geradas a partir de full_text
+        full_text = " ".join(text_parts).strip()
+        stats = {
+            "total_blocks": len(text_blocks),
+            "full_text": full_text
+        }
+        if full_text:
+            stats.update(analyze_text(full_text))
+        
+        results.append(stats)
+        confidences.append(doc_confidences)
+    
+    # Confianças de todos os documentos em um único array, reduzidas por segmento
+    counts = np.fromiter((len(c) for c in confidences), dtype=np.int64, count=len(confidences))
+    total = int(counts.sum())
+    if total == 0:
+        return results
+    
+    values = np.fromiter(chain.from_iterable(confidences), dtype=np.float64, count=total)
+    has_values = counts > 0
+    seg_counts = counts[has_values]
+    seg_starts = (np.cumsum(counts) - counts)[has_values]
+    
+    means = np.add.reduceat(values, seg_starts) / seg_counts
+    mins = np.minimum.reduceat(values, seg_starts)
+    maxs = np.maximum.reduceat(values, seg_starts)
+    low = np.add.reduceat((values < LOW_CONFIDENCE_THRESHOLD).astype(np.int64), seg_starts)
+    
+    # Desvio padrão amostral em duas passadas (estável numericamente)
+    sq_dev = np.add.reduceat((values - np.repeat(means, seg_counts)) ** 2, seg_starts)
+    
+    for seg, doc_index in enumerate(np.flatnonzero(has_values)):
+        stats = results[doc_index]
+        n = int(seg_counts[seg])
+        stats["confidence_avg"] = float(means[seg])
+        stats["confidence_min"] = float(mins[seg])
+        stats["confidence_max"] = float(maxs[seg])
+        if n > 1:
+            stats["confidence_std"] = float(np.sqrt(sq_dev[seg] / (n - 1)))
+        stats["blocks_with_low_confidence"] = int(low[seg])
+    
+    return results
@@ -4,7 +4,6 @@ Serviço para leitura de códigos QR usando OpenCV e pyzbar.
 from typing import List, Dict, Any
 import logging
 import cv2
-from pyzbar.pyzbar import decode
 import numpy as np
 from app.utils.exceptions import OCRAPIException
 
@@ -33,6 +32,9 @@ class QRCodeService:
         Raises:
             OCRAPIException: Em caso de falha na leitura.
         """
+        # Import tardio: carregar o pyzbar resolve os símbolos da libzbar
+        from pyzbar.pyzbar import decode
+        
         try:
             image = cv2.imread(image_path)
             if image is None:
@@ -43,9 +45,10 @@ class QRCodeService:
                 )
             
             # Converter para grayscale para melhor detecção
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = np.ascontiguousarray(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
             
-            decoded_objects = decode(gray)
+            # Passar o buffer cru (pixels, largura, altura) direto para o ZBar
+            decoded_objects = decode((gray.tobytes(), gray.shape[1], gray.shape[0]))
             
             if not decoded_objects:
                 raise OCRAPIException(
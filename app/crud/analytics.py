@@ -3,24 +3,72 @@
 CRUD operations para analytics.
 Usa queries SQLAlchemy para estatísticas.
 """
-from typing import Dict, Any
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Any, Callable, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta, timezone
 
 from app.models.database.processing_job import ProcessingJob, JobType, JobStatus
 
+# Granularidade do cutoff: dentro da mesma janela as queries são idênticas
+_BUCKET_SECONDS = 60
+_CACHE_MAXSIZE = 32
+
+# Cache de resultados indexado por (função, dias, cutoff arredondado)
+_results_cache: "OrderedDict[Tuple[str, int, datetime], Dict[str, Any]]" = OrderedDict()
+
+def _bucket_cutoff(days: int, bucket_seconds: int = _BUCKET_SECONDS) -> datetime:
+    """
+    Calcula o cutoff arredondado para a janela de `bucket_seconds`.
+    
+    Args:
+        days: Período em dias
+        bucket_seconds: Tamanho da janela de arredondamento
+    
+    Returns:
+        Data de corte estável dentro da janela
+    """
+    now = datetime.now(timezone.utc)
+    ts = int(now.timestamp()) // bucket_seconds * bucket_seconds
+    return datetime.fromtimestamp(ts, tz=timezone.utc) - timedelta(days=days)
+
+def _cached_by_bucket(func: Callable[[Session, int], Dict[str, Any]]):
+    """
+    Reaproveita o resultado de uma estatística dentro da mesma janela de cutoff.
+    """
+    @wraps(func)
+    def wrapper(db: Session, days: int) -> Dict[str, Any]:
+        key = (func.__name__, days, _bucket_cutoff(days))
+        
+        cached = _results_cache.get(key)
+        if cached is not None:
+            _results_cache.move_to_end(key)
+            return dict(cached)
+        
+        result = func(db, days)
+        _results_cache[key] = result
+        while len(_results_cache) > _CACHE_MAXSIZE:
+            _results_cache.popitem(last=False)
+        return dict(result)
+    
+    return wrapper
+
+@_cached_by_bucket
 def get_api_statistics(db: Session, days: int) -> Dict[str, Any]:
     """
     Obtém estatísticas gerais.
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    query = db.query(ProcessingJob).filter(ProcessingJob.created_at >= cutoff)
-    
-    total_jobs = query.count()
-    successful = query.filter(ProcessingJob.status == JobStatus.COMPLETED).count()
-    failed = query.filter(ProcessingJob.status == JobStatus.FAILED).count()
-    avg_time = query.with_entities(func.avg(ProcessingJob.processing_time_ms)).scalar() or 0
+    cutoff = _bucket_cutoff(days)
+    # Contagens por status e tempo médio em uma única passada (COUNT FILTER)
+    total_jobs, successful, failed, avg_time = db.query(
+        func.count(ProcessingJob.id),
+        func.count(ProcessingJob.id).filter(ProcessingJob.status == JobStatus.COMPLETED),
+        func.count(ProcessingJob.id).filter(ProcessingJob.status == JobStatus.FAILED),
+        func.avg(ProcessingJob.processing_time_ms)
+    ).filter(ProcessingJob.created_at >= cutoff).one()
+    avg_time = avg_time or 0
     
     return {
         "total_jobs": total_jobs,
@@ -30,29 +78,32 @@ def get_api_statistics(db: Session, days: int) -> Dict[str, Any]:
         "avg_processing_time_ms": avg_time
     }
 
+@_cached_by_bucket
 def get_usage_by_type(db: Session, days: int) -> Dict[str, Any]:
     """
     Uso por tipo de job.
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff = _bucket_cutoff(days)
     stats = db.query(
         ProcessingJob.job_type,
         func.count(ProcessingJob.id)
-    ).filter(ProcessingJob.created_at >= cutoff).group_by(ProcessingJob.job_type).all()
+    ).filter(ProcessingJob.created_at >= cutoff).group_by(ProcessingJob.job_type).tuples().all()
     
-    return {stat[0].value: stat[1] for stat in stats}
+    return {job_type.value: count for job_type, count in stats}
 
+@_cached_by_bucket
 def get_error_stats(db: Session, days: int) -> Dict[str, Any]:
     """
     Estatísticas de erros.
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff = _bucket_cutoff(days)
     errors = db.query(
         ProcessingJob.error_code,
         func.count(ProcessingJob.id)
     ).filter(
         ProcessingJob.status == JobStatus.FAILED,
-        ProcessingJob.created_at >= cutoff
-    ).group_by(ProcessingJob.error_code).all()
+        ProcessingJob.created_at >= cutoff,
+        ProcessingJob.error_code.isnot(None)
+    ).group_by(ProcessingJob.error_code).tuples().all()
     
-    return {error[0]: error[1] for error in errors if error[0]}
\ No newline at end of file
+    return {error_code: count for error_code, count in errors if error_code}
\ No newline at end of file
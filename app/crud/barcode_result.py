@@ -4,11 +4,68 @@ CRUD para resultados de barcode.
 Assumindo modelo BarcodeResult em app/models/database/barcode_result.py.
 """
 from typing import Any, Dict, Optional, List
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from uuid import UUID
+import orjson
 
 from app.models.database.barcode_result import BarcodeResult  # Assumir existência
 
+# Colunas usadas por BarcodeResult.get_summary, lidas como tuplas (sem hidratar ORM)
+STMT_SUMMARIES_BY_JOB = select(
+    BarcodeResult.barcode_type,
+    BarcodeResult.barcode_data,
+    BarcodeResult.data_length,
+    BarcodeResult.content_type,
+    BarcodeResult.quality_score,
+    BarcodeResult.quality_description,
+    BarcodeResult.read_confidence,
+    BarcodeResult.checksum_valid,
+    BarcodeResult.format_valid,
+    BarcodeResult.data_valid,
+    BarcodeResult.center_x,
+    BarcodeResult.center_y,
+    BarcodeResult.width,
+    BarcodeResult.height,
+    BarcodeResult.area_pixels,
+    BarcodeResult.decoder_used,
+    BarcodeResult.orientation,
+    BarcodeResult.decode_attempts
+).where(BarcodeResult.job_id == bindparam("job_id"))
+
+def _summary_from_row(row: Row) -> Dict[str, Any]:
+    """Mesmo formato de BarcodeResult.get_summary, a partir de uma tupla."""
+    (barcode_type, data, data_length, content_type, quality_score, quality_description,
+     read_confidence, checksum_valid, format_valid, data_valid, center_x, center_y,
+     width, height, area_pixels, decoder_used, orientation, decode_attempts) = row
+    return {
+        "barcode_type": barcode_type,
+        "data": data,
+        "data_length": data_length,
+        "content_type": content_type,
+        "quality": {
+            "score": quality_score,
+            "description": quality_description,
+            "confidence": read_confidence
+        },
+        "validation": {
+            "checksum_valid": checksum_valid,
+            "format_valid": format_valid,
+            "data_valid": data_valid
+        },
+        "position": {
+            "center": [center_x, center_y] if center_x else None,
+            "size": [width, height] if width else None,
+            "area": area_pixels
+        },
+        "processing": {
+            "decoder": decoder_used,
+            "orientation": orientation,
+            "attempts": decode_attempts
+        }
+    }
+
 def create_barcode_result(db: Session, result: Dict[str, Any]) -> BarcodeResult:
     db_result = BarcodeResult(**result)
     db.add(db_result)
@@ -20,4 +77,12 @@ def get_barcode_result(db: Session, result_id: UUID) -> Optional[BarcodeResult]:
     return db.query(BarcodeResult).filter(BarcodeResult.id == result_id).first()
 
 def get_results_by_job(db: Session, job_id: UUID) -> List[BarcodeResult]:
-    return db.query(BarcodeResult).filter(BarcodeResult.job_id == job_id).all()
\ No newline at end of file
+    return db.query(BarcodeResult).filter(BarcodeResult.job_id == job_id).all()
+
+def get_result_summaries_by_job_json(db: Session, job_id: UUID) -> bytes:
+    """
+    Resumos dos barcodes de um job já serializados em JSON (orjson).
+    Evita hidratação ORM e o encoder JSON da stdlib em listagens grandes.
+    """
+    rows = db.execute(STMT_SUMMARIES_BY_JOB, {"job_id": job_id}).all()
+    return orjson.dumps([_summary_from_row(row) for row in rows])
\ No newline at end of file
@@ -3,14 +3,20 @@
 Operações CRUD base para todos os modelos.
 Implementa funcionalidades comuns de Create, Read, Update, Delete.
 """
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, Type
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union, Type
 from uuid import UUID
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy.orm import Session, Query
+from sqlalchemy import and_, or_, desc, asc, func, tuple_, insert, delete, inspect, select, exists, lambda_stmt, String, Text
 from fastapi.encoders import jsonable_encoder
 
 from app.models.database.base import BaseModel as DBBaseModel
+from app.utils.exceptions import ValidationError
+
+# Formato ISO 8601 gerado pelo to_char do PostgreSQL
+ISO_TIMESTAMP_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.USTZH:TZM'
 
 ModelType = TypeVar("ModelType", bound=DBBaseModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -30,6 +36,147 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: Classe do modelo SQLAlchemy
         """
         self.model = model
+        
+        # Nomes das colunas da tabela, calculados uma única vez
+        self._column_names = frozenset(c.name for c in model.__table__.columns)
+        
+        # Atributos mapeados por nome, evitando hasattr/getattr por requisição
+        self._col_attrs = {
+            attr.key: getattr(model, attr.key)
+            for attr in inspect(model).column_attrs
+        }
+        
+        # Colunas textuais (String/Text e subtipos), que usam ILIKE na busca
+        self._string_columns = frozenset(
+            key for key, attr in self._col_attrs.items()
+            if isinstance(attr.property.columns[0].type, (String, Text))
+        )
+    
+    def encode_cursor(self, obj: ModelType) -> str:
+        """
+        Gera o cursor de paginação keyset a partir de um registro.
+        
+        Args:
+            obj: Último registro da página atual
+            
+        Returns:
+            Cursor opaco (base64) com created_at e id do registro
+        """
+        raw = f"{obj.created_at.isoformat()}|{obj.id}"
+        return urlsafe_b64encode(raw.encode()).decode()
+    
+    def decode_cursor(self, cursor: str) -> Tuple[datetime, UUID]:
+        """
+        Decodifica um cursor gerado por encode_cursor.
+        
+        Args:
+            cursor: Cursor opaco recebido do cliente
+            
+        Returns:
+            Tupla (created_at, id)
+            
+        Raises:
+            ValidationError: Se o cursor for inválido
+        """
+        try:
+            created_at_raw, id_raw = urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+            return datetime.fromisoformat(created_at_raw), UUID(id_raw)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValidationError("Cursor de paginação inválido", details={"cursor": cursor}) from e
+    
+    def _apply_keyset(self, query: Query, cursor: Optional[str]) -> Query:
+        """
+        Ordena por (created_at DESC, id DESC) e, se houver cursor,
+        filtra os registros posteriores a ele.
+        """
+        query = query.order_by(None).order_by(desc(self.model.created_at), desc(self.model.id))
+        
+        if cursor:
+            created_at, id = self.decode_cursor(cursor)
+            query = query.filter(
+                tuple_(self.model.created_at, self.model.id) < tuple_(created_at, id)
+            )
+        
+        return query
+    
+    def _paginate(
+        self,
+        query: Query,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        deferred_join: bool = False
+    ) -> List[ModelType]:
+        """
+        Aplica paginação keyset quando há cursor; caso contrário usa
+        OFFSET/LIMIT (mantido por compatibilidade, custo O(skip)).
+        
+        Com deferred_join, o OFFSET percorre apenas os ids (via índice) e as
+        linhas completas são buscadas só para a página, por join com esses ids.
+        Nesse modo a ordem é sempre (created_at DESC, id DESC), dentro e fora
+        da subquery, para que as páginas sejam determinísticas.
+        """
+        if cursor:
+            return self._apply_keyset(query, cursor).limit(limit).all()
+        
+        if deferred_join:
+            query = self._apply_keyset(query, None)
+            if skip > 0:
+                # Subquery ordenada coberta por idx_jobs_created_id
+                page_ids = query.with_entities(self.model.id).offset(skip).limit(limit).subquery()
+                return query.join(page_ids, self.model.id == page_ids.c.id).all()
+        
+        return query.offset(skip).limit(limit).all()
+    
+    def paginate_keyset(
+        self,
+        query: Query,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Executa uma query com paginação keyset.
+        
+        Args:
+            query: Query base (filtros já aplicados)
+            cursor: Cursor da página anterior (None para a primeira página)
+            limit: Número máximo de registros
+            
+        Returns:
+            Dicionário com data, next_cursor e has_more
+        """
+        rows = self._apply_keyset(query, cursor).limit(limit + 1).all()
+        
+        has_more = len(rows) > limit
+        data = rows[:limit]
+        
+        return {
+            "data": data,
+            "next_cursor": self.encode_cursor(data[-1]) if has_more else None,
+            "has_more": has_more
+        }
+    
+    def get_multi_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Busca uma página de registros com paginação keyset.
+        
+        Args:
+            db: Sessão do banco de dados
+            cursor: Cursor da página anterior
+            limit: Número máximo de registros
+            
+        Returns:
+            Dicionário com data, next_cursor e has_more
+        """
+        return self.paginate_keyset(db.query(self.model), cursor=cursor, limit=limit)
     
     def get(self, db: Session, id: Union[UUID, str, int]) -> Optional[ModelType]:
         """
@@ -42,7 +189,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Registro encontrado ou None
         """
-        return db.query(self.model).filter(self.model.id == id).first()
+        # Consulta o identity map da sessão antes de ir ao banco
+        return db.get(self.model, id)
     
     def get_multi(
         self, 
@@ -51,17 +199,19 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         skip: int = 0, 
         limit: int = 100,
         order_by: str = "created_at",
-        order_dir: str = "desc"
+        order_dir: str = "desc",
+        cursor: Optional[str] = None
     ) -> List[ModelType]:
         """
         Busca múltiplos registros com paginação.
         
         Args:
             db: Sessão do banco de dados
-            skip: Número de registros para pular
+            skip: Número de registros para pular (obsoleto, prefira cursor)
             limit: Número máximo de registros
-            order_by: Campo para ordenação
+            order_by: Campo para ordenação (ignorado quando há cursor)
             order_dir: Direção da ordenação (asc/desc)
+            cursor: Cursor keyset; força ordenação (created_at DESC, id DESC)
             
         Returns:
             Lista de registros
@@ -69,14 +219,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         query = db.query(self.model)
         
         # Aplicar ordenação
-        if hasattr(self.model, order_by):
-            order_column = getattr(self.model, order_by)
+        order_column = self._col_attrs.get(order_by)
+        if order_column is not None:
             if order_dir.lower() == "desc":
                 query = query.order_by(desc(order_column))
             else:
                 query = query.order_by(asc(order_column))
         
-        return query.offset(skip).limit(limit).all()
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
     
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """
@@ -131,16 +281,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Registro atualizado
         """
-        obj_data = jsonable_encoder(db_obj)
-        
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
         
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        for field, value in update_data.items():
+            if field in self._column_names:
+                setattr(db_obj, field, value)
         
         db.add(db_obj)
         db.commit()
@@ -158,7 +306,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Registro removido ou None se não encontrado
         """
-        obj = db.query(self.model).get(id)
+        obj = db.get(self.model, id)
         if obj:
             db.delete(obj)
             db.commit()
@@ -179,8 +327,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         
         # Aplicar filtros
         for field, value in filters.items():
-            if hasattr(self.model, field) and value is not None:
-                query = query.filter(getattr(self.model, field) == value)
+            if field in self._col_attrs and value is not None:
+                query = query.filter(self._col_attrs[field] == value)
         
         return query.count()
     
@@ -195,7 +343,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             True se existe, False caso contrário
         """
-        return db.query(self.model).filter(self.model.id == id).first() is not None
+        model = self.model
+        return db.scalar(lambda_stmt(lambda: select(exists().where(model.id == id))))
     
     def get_by_field(
         self, 
@@ -214,12 +363,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Primeiro registro encontrado ou None
         """
-        if not hasattr(self.model, field_name):
+        if field_name not in self._col_attrs:
             return None
         
-        return db.query(self.model).filter(
-            getattr(self.model, field_name) == field_value
-        ).first()
+        model = self.model
+        column = self._col_attrs[field_name]
+        stmt = lambda_stmt(lambda: select(model)).add_criteria(
+            lambda s: s.where(column == field_value).limit(1)
+        )
+        return db.scalars(stmt).first()
     
     def get_multi_by_field(
         self, 
@@ -227,7 +379,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         field_name: str, 
         field_value: Any,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ModelType]:
         """
         Busca múltiplos registros por campo específico.
@@ -236,18 +389,21 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db: Sessão do banco de dados
             field_name: Nome do campo
             field_value: Valor do campo
-            skip: Registros para pular
+            skip: Registros para pular (obsoleto, prefira cursor)
             limit: Limite de registros
+            cursor: Cursor de paginação keyset
             
         Returns:
             Lista de registros encontrados
         """
-        if not hasattr(self.model, field_name):
+        if field_name not in self._col_attrs:
             return []
         
-        return db.query(self.model).filter(
-            getattr(self.model, field_name) == field_value
-        ).offset(skip).limit(limit).all()
+        query = db.query(self.model).filter(
+            self._col_attrs[field_name] == field_value
+        )
+        
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
     
     def search(
         self,
@@ -256,40 +412,46 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         search_term: str,
         search_fields: List[str],
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ModelType]:
         """
         Busca registros por termo em múltiplos campos.
         
+        Campos textuais usam ILIKE '%termo%', atendido pelos índices GIN
+        pg_trgm (migração 0005) em vez de varredura sequencial.
+        
         Args:
             db: Sessão do banco de dados
             search_term: Termo de busca
             search_fields: Campos para buscar
-            skip: Registros para pular
+            skip: Registros para pular (obsoleto, prefira cursor)
             limit: Limite de registros
+            cursor: Cursor de paginação keyset
             
         Returns:
             Lista de registros encontrados
         """
         query = db.query(self.model)
         
+        pattern = f"%{search_term}%"
+        
         # Criar condições OR para busca
         conditions = []
         for field in search_fields:
-            if hasattr(self.model, field):
-                field_attr = getattr(self.model, field)
-                # Verificar se o campo é string para usar ILIKE
-                if hasattr(field_attr.property, 'columns'):
-                    column_type = str(field_attr.property.columns[0].type)
-                    if 'VARCHAR' in column_type or 'TEXT' in column_type:
-                        conditions.append(field_attr.ilike(f"%{search_term}%"))
-                    else:
-                        conditions.append(field_attr == search_term)
+            field_attr = self._col_attrs.get(field)
+            if field_attr is None:
+                continue
+            
+            if field in self._string_columns:
+                conditions.append(field_attr.ilike(pattern))
+            else:
+                conditions.append(field_attr == search_term)
         
         if conditions:
             query = query.filter(or_(*conditions))
         
-        return query.offset(skip).limit(limit).all()
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
     
     def filter_by_date_range(
         self,
@@ -299,7 +461,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         date_from: Optional[Any] = None,
         date_to: Optional[Any] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ModelType]:
         """
         Filtra registros por intervalo de datas.
@@ -309,16 +472,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             date_field: Campo de data para filtrar
             date_from: Data inicial
             date_to: Data final
-            skip: Registros para pular
+            skip: Registros para pular (obsoleto, prefira cursor)
             limit: Limite de registros
+            cursor: Cursor de paginação keyset
             
         Returns:
             Lista de registros no intervalo
         """
         query = db.query(self.model)
         
-        if hasattr(self.model, date_field):
-            date_column = getattr(self.model, date_field)
+        date_column = self._col_attrs.get(date_field)
+        if date_column is not None:
             
             if date_from:
                 query = query.filter(date_column >= date_from)
@@ -326,7 +490,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if date_to:
                 query = query.filter(date_column <= date_to)
         
-        return query.offset(skip).limit(limit).all()
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor, deferred_join=True)
     
     def bulk_create(
         self, 
@@ -337,6 +501,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Cria múltiplos registros em lote.
         
+        Executa um único INSERT ... RETURNING; o construtor do modelo e os
+        eventos do mapper não rodam, apenas os defaults das colunas são
+        aplicados. Modelos com campos derivados expõem prepare_bulk_row.
+        
         Args:
             db: Sessão do banco de dados
             objs_in: Lista de dados para criação
@@ -344,24 +512,22 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Lista de registros criados
         """
-        db_objs = []
+        if not objs_in:
+            return []
         
-        for obj_in in objs_in:
-            if isinstance(obj_in, dict):
-                obj_data = obj_in
-            else:
-                obj_data = jsonable_encoder(obj_in)
-            
-            db_obj = self.model(**obj_data)
-            db_objs.append(db_obj)
+        rows = [
+            obj_in if isinstance(obj_in, dict) else jsonable_encoder(obj_in)
+            for obj_in in objs_in
+        ]
         
-        db.add_all(db_objs)
-        db.commit()
+        prepare_row = getattr(self.model, "prepare_bulk_row", None)
+        if prepare_row is not None:
+            rows = [prepare_row(row) for row in rows]
         
-        for db_obj in db_objs:
-            db.refresh(db_obj)
+        db_objs = db.scalars(insert(self.model).returning(self.model), rows).all()
+        db.commit()
         
-        return db_objs
+        return list(db_objs)
     
     def bulk_delete(
         self, 
@@ -379,8 +545,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Número de registros removidos
         """
-        count = db.query(self.model).filter(self.model.id.in_(ids)).count()
-        db.query(self.model).filter(self.model.id.in_(ids)).delete(synchronize_session=False)
+        result = db.execute(
+            delete(self.model)
+            .where(self.model.id.in_(ids))
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        count = len(result.scalars().all())
         db.commit()
         return count
     
@@ -394,7 +565,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Dicionário com estatísticas
         """
-        total_count = db.query(self.model).count()
+        has_created_at = 'created_at' in self._col_attrs
+        
+        # Contagem e intervalo de datas em uma única agregação
+        if has_created_at:
+            total_count, oldest, newest = db.query(
+                func.count(self.model.id),
+                func.to_char(func.min(self.model.created_at), ISO_TIMESTAMP_FORMAT),
+                func.to_char(func.max(self.model.created_at), ISO_TIMESTAMP_FORMAT)
+            ).one()
+        else:
+            total_count = db.query(func.count(self.model.id)).scalar()
         
         stats = {
             "total_records": total_count,
@@ -402,13 +583,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         }
         
         # Adicionar estatísticas de data se o modelo tem created_at
-        if hasattr(self.model, 'created_at'):
-            oldest = db.query(func.min(self.model.created_at)).scalar()
-            newest = db.query(func.max(self.model.created_at)).scalar()
-            
+        if has_created_at:
             stats.update({
-                "oldest_record": oldest.isoformat() if oldest else None,
-                "newest_record": newest.isoformat() if newest else None
+                "oldest_record": oldest,
+                "newest_record": newest
             })
         
         return stats
@@ -443,7 +621,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Registro restaurado ou None
         """
-        obj = self.get(db, id)
+        # O registro está deletado: ignora o filtro automático de soft delete
+        obj = db.get(self.model, id, execution_options={"include_deleted": True})
         if obj and hasattr(obj, 'restore'):
             obj.restore()
             db.add(obj)
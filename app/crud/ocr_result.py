@@ -3,21 +3,50 @@
 CRUD para resultados de OCR.
 Assumindo modelo OCRResult em app/models/database/ocr_result.py.
 """
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.models.database.ocr_result import OCRResult  # Assumir existência
+from app.models.database.ocr_text_block import OCRTextBlock
 
-def create_ocr_result(db: Session, result: Dict[str, Any]) -> OCRResult:
+def create_ocr_result(
+    db: Session,
+    result: Dict[str, Any],
+    store_text_blocks_json: bool = False
+) -> OCRResult:
+    """
+    Cria o resultado OCR e grava seus blocos de texto em ocr_text_blocks.
+    
+    O JSON text_blocks só é preenchido com store_text_blocks_json=True
+    (compatibilidade com leitores antigos).
+    """
+    result = dict(result)
+    text_blocks = result.get("text_blocks") if store_text_blocks_json else result.pop("text_blocks", None)
+    
     db_result = OCRResult(**result)
     db.add(db_result)
+    
+    if text_blocks:
+        db.flush()  # obtém o ID gerado no banco
+        OCRTextBlock.bulk_create(
+            db, OCRTextBlock.rows_from_blocks(db_result.id, db_result.job_id, text_blocks)
+        )
+    
     db.commit()
     db.refresh(db_result)
     return db_result
 
+def insert_ocr_results(db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    Insere vários resultados em lotes (executemany com insertmanyvalues),
+    sem construir objetos ORM.
+    """
+    if OCRResult.bulk_create(db, rows):
+        db.commit()
+
 def get_ocr_result(db: Session, result_id: UUID) -> Optional[OCRResult]:
-    return db.query(OCRResult).filter(OCRResult.id == result_id).first()
+    return OCRResult.by_id(db, result_id)
 
 def get_ocr_results_by_job(db: Session, job_id: UUID) -> List[OCRResult]:
-    return db.query(OCRResult).filter(OCRResult.job_id == job_id).all()
\ No newline at end of file
+    return OCRResult.by_job_id(db, job_id)
\ No newline at end of file
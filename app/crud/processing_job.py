@@ -6,16 +6,35 @@ Inclui funcionalidades avançadas de consulta e analytics.
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, date, timedelta, timezone
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func, text
+from sqlalchemy.orm import Session, selectinload, raiseload
+from sqlalchemy import and_, or_, desc, asc, func, text, select, lambda_stmt, table, column, union_all, DateTime, Float, Integer, String
 from pydantic import BaseModel
 
+from app.config.settings import settings
 from app.crud.base import CRUDBase
+from app.utils.exceptions import ValidationError
 from app.models.database.processing_job import ProcessingJob, JobType, JobStatus
+from app.models.database.base import JobTypeSQL, JobStatusSQL
 from app.models.database.ocr_result import OCRResult
 from app.models.database.barcode_result import BarcodeResult
 from app.models.database.qrcode_result import QRCodeResult
 
+# Materialized view com agregados diários de processing_jobs (ver migração 0002)
+STATS_MV_NAME = "mv_processing_job_daily_stats"
+
+mv_daily_stats = table(
+    STATS_MV_NAME,
+    column("day", DateTime(timezone=True)),
+    column("job_type", JobTypeSQL),
+    column("status", JobStatusSQL),
+    column("error_code", String),
+    column("job_count", Integer),
+    column("timed_count", Integer),
+    column("total_time_ms", Float),
+    column("avg_processing_time_ms", Float),
+    column("avg_input_size_bytes", Float),
+)
+
 class ProcessingJobCreate(BaseModel):
     """Schema para criação de ProcessingJob."""
     job_type: str
@@ -39,12 +58,49 @@ class ProcessingJobUpdate(BaseModel):
 class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJobUpdate]):
     """CRUD operations para ProcessingJob com funcionalidades especializadas."""
     
+    def get_multi_with_results(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[ProcessingJob]:
+        """
+        Busca jobs já com os resultados de OCR, barcode e QR code carregados.
+        
+        Cada relacionamento é carregado com um único SELECT ... IN (selectinload),
+        evitando uma query por job. Em modo DEBUG, qualquer outro lazy load
+        levanta erro para expor N+1 cedo.
+        
+        Args:
+            db: Sessão do banco
+            skip: Registros para pular (obsoleto, prefira cursor)
+            limit: Limite de registros
+            cursor: Cursor de paginação keyset
+            
+        Returns:
+            Lista de jobs com resultados carregados
+        """
+        options = [
+            selectinload(ProcessingJob.ocr_results),
+            selectinload(ProcessingJob.barcode_results),
+            selectinload(ProcessingJob.qrcode_results)
+        ]
+        if settings.DEBUG:
+            options.append(raiseload("*"))
+        
+        query = db.query(ProcessingJob).options(*options).order_by(desc(ProcessingJob.created_at))
+        
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
+    
     def get_by_session(
         self, 
         db: Session, 
         session_id: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ProcessingJob]:
         """
         Busca jobs por session_id.
@@ -52,22 +108,26 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         Args:
             db: Sessão do banco
             session_id: ID da sessão
-            skip: Registros para pular
+            skip: Registros para pular (obsoleto, prefira cursor)
             limit: Limite de registros
+            cursor: Cursor de paginação keyset
             
         Returns:
             Lista de jobs da sessão
         """
-        return db.query(ProcessingJob).filter(
+        query = db.query(ProcessingJob).filter(
             ProcessingJob.session_id == session_id
-        ).order_by(desc(ProcessingJob.created_at)).offset(skip).limit(limit).all()
+        ).order_by(desc(ProcessingJob.created_at))
+        
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
     
     def get_by_status(
         self, 
         db: Session, 
         status: JobStatus,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ProcessingJob]:
         """
         Busca jobs por status.
@@ -75,15 +135,74 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         Args:
             db: Sessão do banco
             status: Status do job
-            skip: Registros para pular
+            skip: Registros para pular (obsoleto, prefira cursor)
             limit: Limite de registros
+            cursor: Cursor de paginação keyset
             
         Returns:
             Lista de jobs com o status especificado
         """
-        return db.query(ProcessingJob).filter(
+        query = db.query(ProcessingJob).filter(
             ProcessingJob.status == status
-        ).order_by(desc(ProcessingJob.created_at)).offset(skip).limit(limit).all()
+        ).order_by(desc(ProcessingJob.created_at))
+        
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
+    
+    def get_by_params(
+        self,
+        db: Session,
+        params: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[ProcessingJob]:
+        """
+        Busca jobs cujos parâmetros de processamento contêm os pares informados
+        (ex.: {"language": "pt"}). Usa @> para aproveitar o índice GIN.
+        
+        Args:
+            db: Sessão do banco
+            params: Subconjunto de processing_params a procurar
+            skip: Registros para pular (obsoleto, prefira cursor)
+            limit: Limite de registros
+            cursor: Cursor de paginação keyset
+            
+        Returns:
+            Lista de jobs com os parâmetros especificados
+        """
+        query = db.query(ProcessingJob).filter(
+            ProcessingJob.processing_params.contains(params)
+        ).order_by(desc(ProcessingJob.created_at))
+        
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
+    
+    def get_by_results(
+        self,
+        db: Session,
+        results: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[ProcessingJob]:
+        """
+        Busca jobs cujos resultados contêm os pares informados
+        (ex.: {"language_detected": "pt"}). Usa @> para aproveitar o índice GIN.
+        
+        Args:
+            db: Sessão do banco
+            results: Subconjunto de results a procurar
+            skip: Registros para pular (obsoleto, prefira cursor)
+            limit: Limite de registros
+            cursor: Cursor de paginação keyset
+            
+        Returns:
+            Lista de jobs com os resultados especificados
+        """
+        query = db.query(ProcessingJob).filter(
+            ProcessingJob.results.contains(results)
+        ).order_by(desc(ProcessingJob.created_at))
+        
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor)
     
     def get_by_type_and_period(
         self,
@@ -92,7 +211,8 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ProcessingJob]:
         """
         Busca jobs por tipo e período.
@@ -102,8 +222,9 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
             job_type: Tipo do job (opcional)
             date_from: Data inicial (opcional)
             date_to: Data final (opcional)
-            skip: Registros para pular
+            skip: Registros para pular (obsoleto, prefira cursor)
             limit: Limite de registros
+            cursor: Cursor de paginação keyset
             
         Returns:
             Lista de jobs filtrados
@@ -119,7 +240,9 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         if date_to:
             query = query.filter(ProcessingJob.created_at <= date_to)
         
-        return query.order_by(desc(ProcessingJob.created_at)).offset(skip).limit(limit).all()
+        query = query.order_by(desc(ProcessingJob.created_at))
+        
+        return self._paginate(query, skip=skip, limit=limit, cursor=cursor, deferred_join=True)
     
     def get_pending_jobs(self, db: Session, limit: int = 10) -> List[ProcessingJob]:
         """
@@ -132,9 +255,12 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         Returns:
             Lista de jobs pendentes ordenados por data de criação
         """
-        return db.query(ProcessingJob).filter(
-            ProcessingJob.status == JobStatus.PENDING
-        ).order_by(asc(ProcessingJob.created_at)).limit(limit).all()
+        stmt = lambda_stmt(
+            lambda: select(ProcessingJob).where(
+                ProcessingJob.status == JobStatus.PENDING
+            ).order_by(asc(ProcessingJob.created_at)).limit(limit)
+        )
+        return list(db.scalars(stmt).all())
     
     def get_stuck_jobs(
         self, 
@@ -160,116 +286,208 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
             )
         ).all()
     
-    def get_job_statistics(
-        self, 
-        db: Session, 
-        period_days: int = 7
-    ) -> Dict[str, Any]:
+    def _job_statistics_statements(self, cutoff: datetime) -> Dict[str, Any]:
         """
-        Retorna estatísticas detalhadas dos jobs.
+        Monta as agregações de get_job_statistics.
+        
+        Os dias completos vêm da materialized view; o dia parcial do início
+        do período (de cutoff até a meia-noite seguinte) é agregado direto de
+        processing_jobs no mesmo formato, para respeitar o corte exato.
         
         Args:
-            db: Sessão do banco
-            period_days: Período em dias para estatísticas
+            cutoff: Início exato do período
             
         Returns:
-            Dicionário com estatísticas completas
+            Dicionário com os statements summary, queue, by_job_type, daily e top_errors
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=period_days)
-        
-        # Estatísticas gerais
-        base_query = db.query(ProcessingJob).filter(ProcessingJob.created_at >= cutoff_date)
-        
-        total_jobs = base_query.count()
-        successful_jobs = base_query.filter(ProcessingJob.status == JobStatus.COMPLETED).count()
-        failed_jobs = base_query.filter(ProcessingJob.status == JobStatus.FAILED).count()
-        pending_jobs = base_query.filter(ProcessingJob.status == JobStatus.PENDING).count()
-        processing_jobs = base_query.filter(ProcessingJob.status == JobStatus.PROCESSING).count()
+        first_full_day = cutoff.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
         
-        # Taxa de sucesso
-        success_rate = (successful_jobs / total_jobs) if total_jobs > 0 else 0
+        job_day = func.date_trunc('day', ProcessingJob.created_at, type_=DateTime(timezone=True))
+        job_error_code = func.coalesce(ProcessingJob.error_code, '')
         
-        # Tempo médio de processamento
-        avg_time = db.query(func.avg(ProcessingJob.processing_time_ms)).filter(
+        partial_day = select(
+            job_day.label('day'),
+            ProcessingJob.job_type,
+            ProcessingJob.status,
+            job_error_code.label('error_code'),
+            func.count().label('job_count'),
+            func.count(ProcessingJob.processing_time_ms).label('timed_count'),
+            func.sum(ProcessingJob.processing_time_ms).label('total_time_ms')
+        ).where(
             and_(
-                ProcessingJob.created_at >= cutoff_date,
-                ProcessingJob.processing_time_ms.isnot(None)
+                ProcessingJob.created_at >= cutoff,
+                ProcessingJob.created_at < first_full_day
             )
-        ).scalar() or 0
+        ).group_by(job_day, ProcessingJob.job_type, ProcessingJob.status, job_error_code)
         
-        # Estatísticas por tipo de job
-        job_type_stats = db.query(
-            ProcessingJob.job_type,
-            func.count(ProcessingJob.id).label('count'),
-            func.avg(ProcessingJob.processing_time_ms).label('avg_time'),
-            func.count(ProcessingJob.id).filter(ProcessingJob.status == JobStatus.COMPLETED).label('successful')
-        ).filter(
-            ProcessingJob.created_at >= cutoff_date
-        ).group_by(ProcessingJob.job_type).all()
+        full_days = select(
+            mv_daily_stats.c.day,
+            mv_daily_stats.c.job_type,
+            mv_daily_stats.c.status,
+            mv_daily_stats.c.error_code,
+            mv_daily_stats.c.job_count,
+            mv_daily_stats.c.timed_count,
+            mv_daily_stats.c.total_time_ms
+        ).where(mv_daily_stats.c.day >= first_full_day)
+        
+        mv = union_all(full_days, partial_day).subquery('period_stats').c
+        
+        def count_if(condition):
+            return func.coalesce(func.sum(mv.job_count).filter(condition), 0)
+        
+        # Média ponderada: soma dos tempos / quantidade de jobs com tempo
+        weighted_avg_time = func.sum(mv.total_time_ms) / func.nullif(func.sum(mv.timed_count), 0)
+        
+        return {
+            "summary": select(
+                func.coalesce(func.sum(mv.job_count), 0).label('total'),
+                count_if(mv.status == JobStatus.COMPLETED).label('successful'),
+                count_if(mv.status == JobStatus.FAILED).label('failed'),
+                weighted_avg_time.label('avg_time')
+            ),
+            # Fila ao vivo: a MV pode estar defasada até STATS_MV_REFRESH_MINUTES
+            "queue": select(
+                func.count().filter(ProcessingJob.status == JobStatus.PENDING).label('pending'),
+                func.count().filter(ProcessingJob.status == JobStatus.PROCESSING).label('processing')
+            ).where(
+                and_(
+                    ProcessingJob.created_at >= cutoff,
+                    ProcessingJob.status.in_([JobStatus.PENDING, JobStatus.PROCESSING])
+                )
+            ),
+            "by_job_type": select(
+                mv.job_type,
+                func.sum(mv.job_count).label('count'),
+                weighted_avg_time.label('avg_time'),
+                count_if(mv.status == JobStatus.COMPLETED).label('successful')
+            ).group_by(mv.job_type),
+            "daily": select(
+                func.to_char(mv.day, 'YYYY-MM-DD').label('date'),
+                func.sum(mv.job_count).label('total'),
+                count_if(mv.status == JobStatus.COMPLETED).label('successful'),
+                weighted_avg_time.label('avg_time')
+            ).group_by(mv.day).order_by(mv.day),
+            "top_errors": select(
+                mv.error_code,
+                func.sum(mv.job_count).label('count')
+            ).where(
+                and_(
+                    mv.status == JobStatus.FAILED,
+                    mv.error_code != ''
+                )
+            ).group_by(mv.error_code).order_by(desc(func.sum(mv.job_count))).limit(10)
+        }
+    
+    def _format_job_statistics(
+        self,
+        period_days: int,
+        cutoff: datetime,
+        now: datetime,
+        summary: Any,
+        queue: Any,
+        job_type_stats: List[Any],
+        daily_stats: List[Any],
+        top_errors: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Converte as linhas das agregações no formato de resposta.
+        """
+        total_jobs = int(summary.total)
+        successful_jobs = int(summary.successful)
+        
+        # Taxa de sucesso
+        success_rate = (successful_jobs / total_jobs) if total_jobs > 0 else 0
         
         by_job_type = {}
         for stat in job_type_stats:
             by_job_type[stat.job_type.value] = {
-                "count": stat.count,
-                "avg_processing_time_ms": round(stat.avg_time or 0, 2),
+                "count": int(stat.count),
+                "avg_processing_time_ms": round(float(stat.avg_time or 0), 2),
                 "success_rate": round((stat.successful / stat.count) if stat.count > 0 else 0, 4)
             }
         
-        # Estatísticas por dia
-        daily_stats = db.query(
-            func.date(ProcessingJob.created_at).label('date'),
-            func.count(ProcessingJob.id).label('total'),
-            func.count(ProcessingJob.id).filter(ProcessingJob.status == JobStatus.COMPLETED).label('successful'),
-            func.avg(ProcessingJob.processing_time_ms).label('avg_time')
-        ).filter(
-            ProcessingJob.created_at >= cutoff_date
-        ).group_by(func.date(ProcessingJob.created_at)).order_by(func.date(ProcessingJob.created_at)).all()
-        
         daily_data = []
         for stat in daily_stats:
             daily_data.append({
-                "date": stat.date.isoformat(),
-                "total_jobs": stat.total,
-                "successful_jobs": stat.successful,
+                "date": stat.date,
+                "total_jobs": int(stat.total),
+                "successful_jobs": int(stat.successful),
                 "success_rate": round((stat.successful / stat.total) if stat.total > 0 else 0, 4),
-                "avg_processing_time_ms": round(stat.avg_time or 0, 2)
+                "avg_processing_time_ms": round(float(stat.avg_time or 0), 2)
             })
         
-        # Top erros
-        top_errors = db.query(
-            ProcessingJob.error_code,
-            func.count(ProcessingJob.id).label('count')
-        ).filter(
-            and_(
-                ProcessingJob.created_at >= cutoff_date,
-                ProcessingJob.status == JobStatus.FAILED,
-                ProcessingJob.error_code.isnot(None)
-            )
-        ).group_by(ProcessingJob.error_code).order_by(desc(func.count(ProcessingJob.id))).limit(10).all()
-        
         return {
             "period_days": period_days,
             "date_range": {
-                "from": cutoff_date.isoformat(),
-                "to": datetime.now(timezone.utc).isoformat()
+                "from": cutoff.isoformat(),
+                "to": now.isoformat()
             },
             "summary": {
                 "total_jobs": total_jobs,
                 "successful_jobs": successful_jobs,
-                "failed_jobs": failed_jobs,
-                "pending_jobs": pending_jobs,
-                "processing_jobs": processing_jobs,
+                "failed_jobs": int(summary.failed),
+                "pending_jobs": int(queue.pending),
+                "processing_jobs": int(queue.processing),
                 "success_rate": round(success_rate, 4),
-                "avg_processing_time_ms": round(avg_time, 2)
+                "avg_processing_time_ms": round(float(summary.avg_time or 0), 2)
             },
             "by_job_type": by_job_type,
             "daily_stats": daily_data,
             "top_errors": [
-                {"error_code": error.error_code, "count": error.count} 
+                {"error_code": error.error_code, "count": int(error.count)} 
                 for error in top_errors
             ]
         }
     
+    def get_job_statistics(
+        self, 
+        db: Session, 
+        period_days: int = 7
+    ) -> Dict[str, Any]:
+        """
+        Retorna estatísticas detalhadas dos jobs.
+        
+        Os agregados do período vêm da materialized view
+        mv_processing_job_daily_stats (granularidade diária, atualizada
+        periodicamente por refresh_stats_mv), completada pelo dia parcial do
+        início do período; pending_jobs e processing_jobs são contados ao vivo
+        em processing_jobs.
+        
+        Args:
+            db: Sessão do banco
+            period_days: Período em dias para estatísticas
+            
+        Returns:
+            Dicionário com estatísticas completas
+        """
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=period_days)
+        
+        statements = self._job_statistics_statements(cutoff)
+        
+        return self._format_job_statistics(
+            period_days,
+            cutoff,
+            now,
+            db.execute(statements["summary"]).one(),
+            db.execute(statements["queue"]).one(),
+            db.execute(statements["by_job_type"]).all(),
+            db.execute(statements["daily"]).all(),
+            db.execute(statements["top_errors"]).all()
+        )
+    
+    def refresh_stats_mv(self, db: Session) -> None:
+        """
+        Atualiza a materialized view de estatísticas diárias.
+        
+        Usa REFRESH CONCURRENTLY para não bloquear leituras durante a atualização.
+        
+        Args:
+            db: Sessão do banco
+        """
+        db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STATS_MV_NAME}"))
+        db.commit()
+    
     def get_performance_metrics(
         self, 
         db: Session, 
@@ -287,35 +505,40 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         """
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=period_days)
         
-        # Query para jobs completados no período
-        completed_jobs = db.query(ProcessingJob).filter(
+        processing_time = ProcessingJob.processing_time_ms
+        
+        def percentile(fraction: float):
+            return func.percentile_cont(fraction).within_group(processing_time.asc())
+        
+        # Percentis e contagem calculados no banco em uma única agregação
+        metrics = db.query(
+            func.count(ProcessingJob.id).label('count'),
+            percentile(0.5).label('p50'),
+            percentile(0.75).label('p75'),
+            percentile(0.9).label('p90'),
+            percentile(0.95).label('p95'),
+            percentile(0.99).label('p99')
+        ).filter(
             and_(
                 ProcessingJob.created_at >= cutoff_date,
                 ProcessingJob.status == JobStatus.COMPLETED,
-                ProcessingJob.processing_time_ms.isnot(None)
+                processing_time.isnot(None)
             )
-        )
+        ).one()
         
-        # Percentis de tempo de processamento
-        processing_times = [job.processing_time_ms for job in completed_jobs.all()]
+        completed_count = metrics.count
         
-        if processing_times:
-            processing_times.sort()
-            n = len(processing_times)
-            
+        if completed_count:
             percentiles = {
-                "p50": processing_times[int(n * 0.5)],
-                "p75": processing_times[int(n * 0.75)],
-                "p90": processing_times[int(n * 0.9)],
-                "p95": processing_times[int(n * 0.95)],
-                "p99": processing_times[int(n * 0.99)] if n > 100 else processing_times[-1]
+                key: round(getattr(metrics, key), 2)
+                for key in ("p50", "p75", "p90", "p95", "p99")
             }
         else:
             percentiles = {"p50": 0, "p75": 0, "p90": 0, "p95": 0, "p99": 0}
         
         # Throughput (jobs por hora)
         total_hours = period_days * 24
-        throughput = len(processing_times) / total_hours if total_hours > 0 else 0
+        throughput = completed_count / total_hours if total_hours > 0 else 0
         
         # Tamanho médio de arquivos
         avg_file_size = db.query(func.avg(ProcessingJob.input_size_bytes)).filter(
@@ -327,7 +550,7 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         
         return {
             "period_days": period_days,
-            "completed_jobs_count": len(processing_times),
+            "completed_jobs_count": completed_count,
             "processing_time_percentiles": percentiles,
             "throughput_jobs_per_hour": round(throughput, 2),
             "avg_file_size_bytes": round(avg_file_size, 2),
@@ -351,21 +574,11 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
         """
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=period_days)
         
-        # Sessões únicas
-        unique_sessions = db.query(func.count(func.distinct(ProcessingJob.session_id))).filter(
-            and_(
-                ProcessingJob.created_at >= cutoff_date,
-                ProcessingJob.session_id.isnot(None)
-            )
-        ).scalar() or 0
-        
-        # IPs únicos
-        unique_ips = db.query(func.count(func.distinct(ProcessingJob.client_ip))).filter(
-            and_(
-                ProcessingJob.created_at >= cutoff_date,
-                ProcessingJob.client_ip.isnot(None)
-            )
-        ).scalar() or 0
+        # Sessões e IPs únicos em uma única query (COUNT DISTINCT ignora NULL)
+        unique_sessions, unique_ips = db.query(
+            func.count(func.distinct(ProcessingJob.session_id)),
+            func.count(func.distinct(ProcessingJob.client_ip))
+        ).filter(ProcessingJob.created_at >= cutoff_date).one()
         
         # Top sessões por número de jobs
         top_sessions = db.query(
@@ -404,4 +617,37 @@ class CRUDProcessingJob(CRUDBase[ProcessingJob, ProcessingJobCreate, ProcessingJ
             
         Returns:
             Número de jobs removidos
-        """
\ No newline at end of file
+            
+        Raises:
+            ValidationError: Se batch_size for menor que 1
+        """
+        # LIMIT 0 nunca remove nada e o loop não terminaria
+        if batch_size < 1:
+            raise ValidationError("batch_size deve ser maior ou igual a 1", details={"batch_size": batch_size})
+        
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        
+        # Remoção em lotes no servidor: locks curtos e memória constante.
+        # Resultados associados são removidos pelo ON DELETE CASCADE.
+        delete_batch = text(
+            "DELETE FROM processing_jobs WHERE id IN ("
+            "SELECT id FROM processing_jobs WHERE created_at < :cutoff "
+            "ORDER BY created_at LIMIT :batch_size)"
+        )
+        
+        total_deleted = 0
+        while True:
+            deleted = db.execute(
+                delete_batch,
+                {"cutoff": cutoff_date, "batch_size": batch_size}
+            ).rowcount
+            db.commit()
+            
+            total_deleted += deleted
+            if deleted < batch_size:
+                break
+        
+        return total_deleted
+
+# Instância global
+processing_job_crud = CRUDProcessingJob(ProcessingJob)
\ No newline at end of file
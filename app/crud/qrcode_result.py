@@ -2,22 +2,161 @@
 """
 CRUD para resultados de QR Code.
 Assumindo modelo QRCodeResult em app/models/database/qrcode_result.py.
+Operações assíncronas sobre a sessão com escopo de requisição (async_db_session),
+sem bloquear o event loop nem abrir uma sessão por chamada.
 """
-from typing import Any, Dict, Optional, List
-from sqlalchemy.orm import Session
+import asyncio
+import orjson
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Optional, List, Union
+from sqlalchemy import RowMapping, bindparam, select
+from sqlalchemy.orm import raiseload
 from uuid import UUID
 
+from app.config.database import AsyncSessionLocal, async_db_session
+from app.utils.request_cache import invalidate, request_cached, request_scoped
 from app.models.database.qrcode_result import QRCodeResult  # Assumir existência
 
-def create_qrcode_result(db: Session, result: Dict[str, Any]) -> QRCodeResult:
+# Statements montados uma vez; a chave de cache do SQL compilado fica estável
+STMT_GET_BY_ID = select(QRCodeResult).where(
+    QRCodeResult.id == bindparam("result_id")
+).options(raiseload(QRCodeResult.job))
+# Buscas por job_id via Core: as linhas são imutáveis e podem ser compartilhadas
+STMT_GET_BY_JOBS = select(QRCodeResult.__table__).where(
+    QRCodeResult.__table__.c.job_id.in_(bindparam("job_ids", expanding=True))
+)
+STMT_ROW_BY_ID = select(QRCodeResult.__table__).where(
+    QRCodeResult.__table__.c.id == bindparam("result_id")
+)
+STMT_STREAM_BY_JOB = (
+    select(QRCodeResult)
+    .where(QRCodeResult.job_id == bindparam("job_id"))
+    .options(raiseload(QRCodeResult.job))
+    .execution_options(yield_per=200)
+)
+
+class QRJobLoader:
+    """
+    Dataloader para resultados por job.
+    
+    Chamadas concorrentes dentro de uma janela curta (inclusive de requisições
+    diferentes) são agrupadas em um único SELECT ... WHERE job_id IN (...),
+    e os resultados são distribuídos por job_id.
+    
+    Devolve linhas Core (RowMapping), não instâncias ORM: a mesma linha pode
+    ser entregue a várias requisições sem que uma altere o que a outra lê.
+    """
+    
+    def __init__(self, window_seconds: float = 0.002):
+        self.window_seconds = window_seconds
+        self._pending: Dict[UUID, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def load(self, job_id: Union[UUID, str]) -> List[RowMapping]:
+        """
+        Retorna os resultados do job, agrupando com outras chamadas pendentes.
+        """
+        key = job_id if isinstance(job_id, UUID) else UUID(str(job_id))
+        
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_window())
+        
+        # shield: o cancelamento de um chamador não cancela os demais
+        return list(await asyncio.shield(future))
+    
+    async def _flush_after_window(self):
+        """Aguarda a janela e executa a consulta agrupada."""
+        await asyncio.sleep(self.window_seconds)
+        
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        
+        try:
+            # Sessão própria: o flush roda fora da task de qualquer requisição
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(STMT_GET_BY_JOBS, {"job_ids": list(pending)})).mappings().all()
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        grouped: Dict[UUID, List[RowMapping]] = defaultdict(list)
+        for row in rows:
+            grouped[row["job_id"]].append(row)
+        
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(grouped.get(key, []))
+
+# Instância global
+qr_job_loader = QRJobLoader()
+
+def _row_json_cache() -> Dict[UUID, bytes]:
+    """JSON já serializado por result_id, válido só na requisição atual."""
+    return request_scoped("qrcode_result_json", dict)
+
+async def create_qrcode_result(result: Dict[str, Any]) -> QRCodeResult:
     db_result = QRCodeResult(**result)
-    db.add(db_result)
-    db.commit()
-    db.refresh(db_result)
+    async_db_session.add(db_result)
+    await async_db_session.commit()
+    await async_db_session.refresh(db_result)
+    
+    # Leituras já cacheadas nesta requisição ficaram desatualizadas
+    invalidate("get_qrcode_result", db_result.id)
+    invalidate("get_qrcode_results_by_job", db_result.job_id)
+    _row_json_cache().pop(db_result.id, None)
     return db_result
 
-def get_qrcode_result(db: Session, result_id: UUID) -> Optional[QRCodeResult]:
-    return db.query(QRCodeResult).filter(QRCodeResult.id == result_id).first()
+@request_cached
+async def get_qrcode_result(result_id: UUID) -> Optional[QRCodeResult]:
+    return (await async_db_session.execute(STMT_GET_BY_ID, {"result_id": result_id})).scalar_one_or_none()
+
+async def get_qrcode_result_json(result_id: UUID) -> Optional[bytes]:
+    """
+    Retorna o resultado já serializado em JSON.
+    
+    Lê a linha via Core (sem hidratar o objeto ORM), no formato de to_dict, e
+    guarda os bytes no cache da requisição: releituras na mesma requisição não
+    tocam o banco nem o serializador, e nada fica de uma requisição para outra.
+    """
+    cache = _row_json_cache()
+    payload = cache.get(result_id)
+    if payload is not None:
+        return payload
+    
+    row = (await async_db_session.execute(STMT_ROW_BY_ID, {"result_id": result_id})).mappings().one_or_none()
+    if row is None:
+        return None
+    
+    payload = cache[result_id] = orjson.dumps(QRCodeResult.row_to_dict(row))
+    return payload
+
+@request_cached
+async def get_qrcode_results_by_job(job_id: UUID) -> List[RowMapping]:
+    return await qr_job_loader.load(job_id)
+
+async def iter_qrcode_results_by_job(job_id: UUID) -> AsyncIterator[QRCodeResult]:
+    """
+    Itera os resultados do job à medida que chegam do banco (cursor do servidor),
+    em lotes de 200, sem materializar o conjunto inteiro em memória.
+    
+    Usa sessão própria: a StreamingResponse consome o iterador em outra task,
+    fora do escopo de async_db_session da requisição.
+    """
+    async with AsyncSessionLocal() as db:
+        results = await db.stream_scalars(STMT_STREAM_BY_JOB, {"job_id": job_id})
+        async for result in results:
+            yield result
 
-def get_qrcode_results_by_job(db: Session, job_id: UUID) -> List[QRCodeResult]:
-    return db.query(QRCodeResult).filter(QRCodeResult.job_id == job_id).all()
\ No newline at end of file
+async def stream_qrcode_results_by_job_ndjson(job_id: UUID) -> AsyncIterator[bytes]:
+    """
+    Serializa os resultados do job como JSON lines, uma linha por resultado.
+    Pensado para StreamingResponse: nem as linhas nem o JSON completo ficam em memória.
+    """
+    async for result in iter_qrcode_results_by_job(job_id):
+        yield orjson.dumps(result.to_dict()) + b"\n"
\ No newline at end of file
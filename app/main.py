@@ -4,86 +4,196 @@ Aplicação principal FastAPI para OCR API Backend.
 Define a aplicação, middlewares, rotas e configurações principais.
 """
 import time
+import asyncio
+import itertools
 import logging
+import secrets
+import orjson
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Configurações e dependências locais
 from app.config.settings import settings
-from app.config.database import db_manager, check_db_connection
+from app.config.database import db_manager, check_db_connection, close_async_db, async_db_session
 from app.utils.logger import setup_logging
 from app.utils.exceptions import OCRAPIException
+from app.utils.request_cache import start_request_cache, end_request_cache
 
 # Import dos models primeiro para garantir que estejam registrados
-from app.models.database import *
+from app.models.database import (  # noqa: F401
+    ProcessingJob,
+    OCRResult,
+    BarcodeResult,
+    QRCodeResult,
+    UserSession
+)
 
-# Import das rotas
-from app.api.routes import health, ocr, barcode, qrcode, jobs
+# Import das rotas sempre ativas (as demais são importadas conforme as features)
+from app.api.routes import health, jobs
 
 # Setup de logging
 logger = setup_logging()
 
-class TimingMiddleware(BaseHTTPMiddleware):
-    """Middleware para medir tempo de resposta e adicionar headers."""
+# Configurações fixas lidas uma única vez no import (handlers e endpoints de info)
+_IS_PRODUCTION = settings.is_production
+_API_PREFIX = settings.API_PREFIX
+_API_VERSION = settings.API_VERSION
+_ENABLE_OCR = settings.ENABLE_OCR
+_ENABLE_BARCODE = settings.ENABLE_BARCODE
+_ENABLE_QRCODE = settings.ENABLE_QRCODE
+
+# Request IDs: salt aleatório por worker + contador monotônico
+_REQUEST_ID_SALT = f"{secrets.randbits(32):08x}"
+_request_counter = itertools.count(1)
+
+# Logs de requisição são enfileirados e escritos em lote fora do caminho da resposta
+_LOG_QUEUE_MAXSIZE = 10_000
+_LOG_FLUSH_SECONDS = 5
+_log_queue: Optional[asyncio.Queue] = None
+
+def _enqueue_log(level: int, msg: str, *args, extra: Dict[str, Any], exc_info=None):
+    """
+    Agenda um registro de log para o drainer.
+    Sem fila ativa (fora do lifespan) o log é escrito diretamente;
+    com a fila cheia o registro é descartado para não atrasar a requisição.
+    """
+    if _log_queue is None:
+        logger.log(level, msg, *args, extra=extra, exc_info=exc_info)
+        return
+    
+    try:
+        _log_queue.put_nowait((level, msg, args, extra, exc_info))
+    except asyncio.QueueFull:
+        pass
+
+def _flush_log_queue(queue: asyncio.Queue):
+    """Escreve todos os registros pendentes na fila."""
+    while not queue.empty():
+        level, msg, args, extra, exc_info = queue.get_nowait()
+        logger.log(level, msg, *args, extra=extra, exc_info=exc_info)
+
+async def _log_drainer(queue: asyncio.Queue, interval_seconds: float):
+    """Esvazia periodicamente a fila de logs de requisição."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        _flush_log_queue(queue)
+
+async def refresh_stats_mv_periodically(interval_minutes: int):
+    """Atualiza periodicamente a materialized view de estatísticas de jobs."""
+    from app.config.database import SessionLocal
+    from app.crud.processing_job import processing_job_crud
+    
+    def _refresh():
+        db = SessionLocal()
+        try:
+            processing_job_crud.refresh_stats_mv(db)
+        finally:
+            db.close()
+    
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval_minutes * 60)
+        try:
+            await loop.run_in_executor(None, _refresh)
+            logger.debug("📊 Materialized view de estatísticas atualizada")
+        except Exception as e:
+            logger.warning(f"⚠️ Falha ao atualizar materialized view de estatísticas: {str(e)}")
+
+class TimingMiddleware:
+    """
+    Middleware ASGI puro para medir tempo de resposta e adicionar headers.
+    
+    Evita os objetos Request/Response e a task extra do BaseHTTPMiddleware:
+    os headers são injetados direto na mensagem http.response.start.
+    """
     
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_ns = time.perf_counter_ns()
+        
+        # Adicionar Request ID único (lido via request.state.request_id)
+        request_id = f"req_{_REQUEST_ID_SALT}{next(_request_counter):x}"
+        scope.setdefault("state", {})["request_id"] = request_id
         
-        # Adicionar Request ID único
-        request_id = f"req_{int(start_time * 1000)}"
-        request.state.request_id = request_id
+        status_code = 500
         
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = (time.perf_counter_ns() - start_ns) / 1e9
+                
+                # Adicionar headers de performance
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{process_time:.3f}".encode()))
+                headers.append((b"x-request-id", request_id.encode()))
+                message["headers"] = headers
+            await send(message)
+        
+        cache_token = start_request_cache()
         try:
-            response = await call_next(request)
-            
-            # Calcular tempo de processamento
-            process_time = time.time() - start_time
-            
-            # Adicionar headers de performance
-            response.headers["X-Process-Time"] = f"{process_time:.3f}"
-            response.headers["X-Request-ID"] = request_id
-            
-            # Log da requisição
-            logger.info(
-                f"{request.method} {request.url.path} - {response.status_code}",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "process_time": process_time,
-                    "client_ip": request.client.host,
-                    "user_agent": request.headers.get("user-agent", ""),
-                }
-            )
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            process_time = time.time() - start_time
+            process_time = (time.perf_counter_ns() - start_ns) / 1e9
+            client = scope.get("client")
             
-            logger.error(
-                f"{request.method} {request.url.path} - Error: {str(e)}",
+            _enqueue_log(
+                logging.ERROR,
+                "%s %s - Error: %s", scope["method"], scope["path"], e,
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": scope["method"],
+                    "path": scope["path"],
                     "process_time": process_time,
                     "error": str(e),
-                    "client_ip": request.client.host,
+                    "client_ip": client[0] if client else None,
                 },
-                exc_info=True
+                exc_info=e
             )
             
             raise
+        finally:
+            end_request_cache(cache_token)
+            # Devolve a sessão com escopo de requisição ao pool
+            await async_db_session.remove()
+        
+        # Log da requisição, fora do caminho de envio da resposta
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        process_time = (time.perf_counter_ns() - start_ns) / 1e9
+        client = scope.get("client")
+        user_agent = next(
+            (value for name, value in scope["headers"] if name == b"user-agent"),
+            b""
+        ).decode("latin-1")
+        _enqueue_log(
+            logging.INFO,
+            "%s %s - %s", scope["method"], scope["path"], status_code,
+            extra={
+                "request_id": request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "process_time": process_time,
+                "client_ip": client[0] if client else None,
+                "user_agent": user_agent,
+            }
+        )
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -91,6 +201,8 @@ async def lifespan(app: FastAPI):
     Gerencia o ciclo de vida da aplicação.
     Startup e shutdown events.
     """
+    global _log_queue
+    
     # Startup
     logger.info("🚀 Iniciando OCR API Backend")
     logger.info(f"Ambiente: {settings.ENV}")
@@ -144,11 +256,28 @@ async def lifespan(app: FastAPI):
         if settings.is_production:
             raise
     
+    # Refresh periódico das estatísticas de jobs
+    stats_refresh_task = None
+    if settings.ENABLE_ANALYTICS and settings.STATS_MV_REFRESH_MINUTES > 0:
+        stats_refresh_task = asyncio.create_task(
+            refresh_stats_mv_periodically(settings.STATS_MV_REFRESH_MINUTES)
+        )
+    
+    # Fila de logs de requisição
+    _log_queue = asyncio.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+    log_drainer_task = asyncio.create_task(_log_drainer(_log_queue, _LOG_FLUSH_SECONDS))
+    
     yield
     
     # Shutdown
+    log_drainer_task.cancel()
+    _flush_log_queue(_log_queue)
+    _log_queue = None
     logger.info("🔄 Finalizando aplicação...")
+    if stats_refresh_task is not None:
+        stats_refresh_task.cancel()
     db_manager.close_all_connections()
+    await close_async_db()
     logger.info("✅ Aplicação finalizada")
 
 # Criar aplicação FastAPI
@@ -158,6 +287,7 @@ app = FastAPI(
     version=settings.API_VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if not settings.is_production else None,
     redoc_url="/redoc" if not settings.is_production else None,
 )
@@ -166,7 +296,11 @@ app = FastAPI(
 # MIDDLEWARES
 # ======================
 
-# Middleware de timing (deve ser o primeiro)
+# Ordem: add_middleware empilha por fora, então o último adicionado é o mais externo.
+# Timing fica mais interno (X-Process-Time mede só a aplicação) e GZip mais externo
+# (comprime a resposta final, sem entrar no tempo medido).
+
+# Middleware de timing (adicionado primeiro = mais interno)
 app.add_middleware(TimingMiddleware)
 
 # CORS Middleware
@@ -178,64 +312,64 @@ app.add_middleware(
     allow_headers=settings.CORS_HEADERS,
 )
 
-# Gzip Middleware (se habilitado)
+# Gzip Middleware (se habilitado; adicionado por último = mais externo)
 if settings.ENABLE_GZIP:
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=settings.GZIP_COMPRESS_LEVEL
+    )
 
 # ======================
 # EXCEPTION HANDLERS
 # ======================
 
-@app.exception_handler(OCRAPIException)
-async def ocr_api_exception_handler(request: Request, exc: OCRAPIException):
-    """Handler para exceções customizadas da API."""
-    return JSONResponse(
-        status_code=exc.status_code,
+def _error_response(
+    request: Request,
+    status_code: int,
+    code: str,
+    message: Any,
+    details: Any = None
+) -> ORJSONResponse:
+    """
+    Monta a resposta de erro padrão serializada com orjson.
+    
+    Args:
+        request: Requisição atual (fornece o request_id)
+        status_code: Código HTTP da resposta
+        code: Código do erro
+        message: Mensagem do erro
+        details: Detalhes adicionais (opcional)
+    
+    Returns:
+        ORJSONResponse com o envelope de erro
+    """
+    return ORJSONResponse(
+        status_code=status_code,
         content={
             "success": False,
-            "error": {
-                "code": exc.error_code,
-                "message": exc.message,
-                "details": exc.details
-            },
+            "error": {"code": code, "message": message, "details": details},
             "timestamp": time.time(),
             "request_id": getattr(request.state, "request_id", None)
         }
     )
 
+@app.exception_handler(OCRAPIException)
+async def ocr_api_exception_handler(request: Request, exc: OCRAPIException):
+    """Handler para exceções customizadas da API."""
+    return _error_response(request, exc.status_code, exc.error_code, exc.message, exc.details)
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handler para erros de validação de dados."""
-    return JSONResponse(
-        status_code=422,
-        content={
-            "success": False,
-            "error": {
-                "code": "VALIDATION_ERROR",
-                "message": "Dados de entrada inválidos",
-                "details": exc.errors()
-            },
-            "timestamp": time.time(),
-            "request_id": getattr(request.state, "request_id", None)
-        }
+    return _error_response(
+        request, 422, "VALIDATION_ERROR", "Dados de entrada inválidos", exc.errors()
     )
 
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handler para exceções HTTP padrão."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "success": False,
-            "error": {
-                "code": f"HTTP_{exc.status_code}",
-                "message": exc.detail,
-                "details": None
-            },
-            "timestamp": time.time(),
-            "request_id": getattr(request.state, "request_id", None)
-        }
-    )
+    return _error_response(request, exc.status_code, f"HTTP_{exc.status_code}", exc.detail)
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
@@ -250,18 +384,11 @@ async def general_exception_handler(request: Request, exc: Exception):
         exc_info=True
     )
     
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "error": {
-                "code": "INTERNAL_SERVER_ERROR",
-                "message": "Erro interno do servidor" if settings.is_production else str(exc),
-                "details": None
-            },
-            "timestamp": time.time(),
-            "request_id": getattr(request.state, "request_id", None)
-        }
+    return _error_response(
+        request,
+        500,
+        "INTERNAL_SERVER_ERROR",
+        "Erro interno do servidor" if _IS_PRODUCTION else str(exc)
     )
 
 # ======================
@@ -272,73 +399,86 @@ async def general_exception_handler(request: Request, exc: Exception):
 app.include_router(health.router, tags=["Health Check"])
 
 # Rotas principais da API
-if settings.ENABLE_OCR:
-    app.include_router(ocr.router, prefix=settings.API_PREFIX, tags=["OCR"])
+if _ENABLE_OCR:
+    from app.api.routes import ocr
+    app.include_router(ocr.router, prefix=_API_PREFIX, tags=["OCR"])
 
-if settings.ENABLE_BARCODE:
-    app.include_router(barcode.router, prefix=settings.API_PREFIX, tags=["Barcode"])
+if _ENABLE_BARCODE:
+    from app.api.routes import barcode
+    app.include_router(barcode.router, prefix=_API_PREFIX, tags=["Barcode"])
 
-if settings.ENABLE_QRCODE:
-    app.include_router(qrcode.router, prefix=settings.API_PREFIX, tags=["QR Code"])
+if _ENABLE_QRCODE:
+    from app.api.routes import qrcode
+    app.include_router(qrcode.router, prefix=_API_PREFIX, tags=["QR Code"])
 
 # Jobs e gerenciamento (sempre ativo)
-app.include_router(jobs.router, prefix=settings.API_PREFIX, tags=["Jobs"])
+app.include_router(jobs.router, prefix=_API_PREFIX, tags=["Jobs"])
 
 # ======================
 # ROOT ENDPOINTS
 # ======================
 
+# Corpos pré-serializados: o conteúdo só depende de configurações fixas
+_ROOT_JSON = orjson.dumps({
+    "name": "OCR API Backend",
+    "version": _API_VERSION,
+    "description": "API para processamento de OCR, Códigos de Barras e QR Codes",
+    "status": "running",
+    "docs_url": "/docs" if not _IS_PRODUCTION else "disabled",
+    "health_check": "/health",
+    "api_prefix": _API_PREFIX,
+    "endpoints": {
+        "health": "/health",
+        "ocr": f"{_API_PREFIX}/ocr/process" if _ENABLE_OCR else "disabled",
+        "barcode": f"{_API_PREFIX}/barcode/read" if _ENABLE_BARCODE else "disabled",
+        "qrcode": f"{_API_PREFIX}/qrcode/read" if _ENABLE_QRCODE else "disabled",
+        "jobs": f"{_API_PREFIX}/jobs"
+    }
+})
+
+_API_INFO_JSON = orjson.dumps({
+    "api_version": _API_VERSION,
+    "supported_formats": settings.ALLOWED_EXTENSIONS,
+    "max_file_size_mb": settings.MAX_IMAGE_SIZE_MB,
+    "max_concurrent_jobs": settings.MAX_CONCURRENT_JOBS,
+    "features": {
+        "ocr": _ENABLE_OCR,
+        "barcode": _ENABLE_BARCODE,
+        "qrcode": _ENABLE_QRCODE,
+        "analytics": settings.ENABLE_ANALYTICS,
+        "batch_processing": settings.ENABLE_BATCH_PROCESSING
+    },
+    "limits": {
+        "max_image_dimension": settings.MAX_IMAGE_DIMENSION,
+        "min_image_dimension": settings.MIN_IMAGE_DIMENSION,
+        "job_timeout_seconds": settings.JOB_TIMEOUT_SECONDS
+    }
+})
+
+# /status: só o timestamp varia, inserido entre prefixo e sufixo fixos
+_STATUS_PREFIX = b'{"status":"healthy","timestamp":'
+_STATUS_SUFFIX = b"," + orjson.dumps({
+    "version": _API_VERSION,
+    "environment": settings.ENV
+})[1:]
+
 @app.get("/", tags=["Info"])
 async def root():
     """Endpoint raiz com informações básicas da API."""
-    return {
-        "name": "OCR API Backend",
-        "version": settings.API_VERSION,
-        "description": "API para processamento de OCR, Códigos de Barras e QR Codes",
-        "status": "running",
-        "docs_url": "/docs" if not settings.is_production else "disabled",
-        "health_check": "/health",
-        "api_prefix": settings.API_PREFIX,
-        "endpoints": {
-            "health": "/health",
-            "ocr": f"{settings.API_PREFIX}/ocr/process" if settings.ENABLE_OCR else "disabled",
-            "barcode": f"{settings.API_PREFIX}/barcode/read" if settings.ENABLE_BARCODE else "disabled",
-            "qrcode": f"{settings.API_PREFIX}/qrcode/read" if settings.ENABLE_QRCODE else "disabled",
-            "jobs": f"{settings.API_PREFIX}/jobs"
-        }
-    }
+    return Response(_ROOT_JSON, media_type="application/json")
 
 @app.get("/api", tags=["Info"])
 async def api_info():
     """Informações sobre a API."""
-    return {
-        "api_version": settings.API_VERSION,
-        "supported_formats": settings.ALLOWED_EXTENSIONS,
-        "max_file_size_mb": settings.MAX_IMAGE_SIZE_MB,
-        "max_concurrent_jobs": settings.MAX_CONCURRENT_JOBS,
-        "features": {
-            "ocr": settings.ENABLE_OCR,
-            "barcode": settings.ENABLE_BARCODE,
-            "qrcode": settings.ENABLE_QRCODE,
-            "analytics": settings.ENABLE_ANALYTICS,
-            "batch_processing": settings.ENABLE_BATCH_PROCESSING
-        },
-        "limits": {
-            "max_image_dimension": settings.MAX_IMAGE_DIMENSION,
-            "min_image_dimension": settings.MIN_IMAGE_DIMENSION,
-            "job_timeout_seconds": settings.JOB_TIMEOUT_SECONDS
-        }
-    }
+    return Response(_API_INFO_JSON, media_type="application/json")
 
 @app.get("/status", tags=["Info"])
 async def status():
     """Status rápido da aplicação."""
-    return {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "version": settings.API_VERSION,
-        "environment": settings.ENV
-    }
+    return Response(
+        _STATUS_PREFIX + repr(time.time()).encode() + _STATUS_SUFFIX,
+        media_type="application/json"
+    )
 
 if __name__ == "__main__":
     import uvicorn
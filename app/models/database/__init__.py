@@ -3,11 +3,27 @@
 # Import all models to ensure they are registered with SQLAlchemy
 from .base import BaseModel, JobType, JobStatus, JobTypeSQL, JobStatusSQL, LogMixin
 from .processing_job import ProcessingJob
+from .job_debug_entry import JobDebugEntry
 from .ocr_result import OCRResult
+from .ocr_text_block import OCRTextBlock
 from .barcode_result import BarcodeResult
 from .qrcode_result import QRCodeResult
 from .user_session import UserSession
 
+from app.config.database import Base
+from app.config.settings import settings
+
+def _strip_comments() -> None:
+    """Remove os comentários de tabelas e colunas do metadata."""
+    for table in Base.metadata.tables.values():
+        table.comment = None
+        for column in table.columns:
+            column.comment = None
+
+# Sem comentários no DDL, as descrições não precisam ficar no metadata de cada worker
+if not settings.DATABASE_EMIT_COMMENTS:
+    _strip_comments()
+
 __all__ = [
     "BaseModel",
     "JobType", 
@@ -16,7 +32,9 @@ __all__ = [
     "JobStatusSQL", 
     "LogMixin",
     "ProcessingJob",
+    "JobDebugEntry",
     "OCRResult",
+    "OCRTextBlock",
     "BarcodeResult", 
     "QRCodeResult",
     "UserSession"
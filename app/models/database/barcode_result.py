@@ -3,13 +3,31 @@
 Modelo para armazenar resultados detalhados de leitura de códigos de barras.
 Complementa a tabela processing_jobs com dados específicos de barcodes.
 """
-from sqlalchemy import Column, String, Text, Integer, Float, Boolean, JSON, ForeignKey
+import uuid
+from sqlalchemy import String, Text, Integer, Float, Boolean, JSON, ForeignKey, event, inspect
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from typing import Dict, Any, List, Optional
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from operator import mul
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from app.models.database.base import BaseModel
 
+if TYPE_CHECKING:
+    from app.models.database.processing_job import ProcessingJob
+
+# Pesos do dígito verificador (posições 1..N-1)
+_EAN13_WEIGHTS = (1, 3) * 6
+_UPC_WEIGHTS = (3, 1) * 5 + (3,)
+
+def _weighted_digit_sum(digits: bytes, weights: Tuple[int, ...]) -> int:
+    """
+    Soma ponderada dos dígitos ASCII sem int() por caractere.
+    
+    sum(w * (b - 48)) == sum(w * b) - 48 * sum(w), então basta um único
+    produto escalar sobre os bytes crus.
+    """
+    return sum(map(mul, digits, weights)) - 48 * sum(weights)
+
 class BarcodeResult(BaseModel):
     """
     Modelo para resultados detalhados de leitura de códigos de barras.
@@ -24,7 +42,7 @@ class BarcodeResult(BaseModel):
     # ======================
     # RELATIONSHIP
     # ======================
-    job_id = Column(
+    job_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("processing_jobs.id", ondelete="CASCADE"),
         nullable=False,
@@ -34,25 +52,25 @@ class BarcodeResult(BaseModel):
     # ======================
     # BARCODE DATA
     # ======================
-    barcode_data = Column(
+    barcode_data: Mapped[str] = mapped_column(
         Text,
         nullable=False,
         comment="Dados decodificados do código de barras"
     )
     
-    barcode_type = Column(
+    barcode_type: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
         comment="Tipo do código: EAN13, CODE128, CODE39, etc."
     )
     
-    barcode_format = Column(
+    barcode_format: Mapped[Optional[str]] = mapped_column(
         String(20),
         nullable=True,
         comment="Formato específico detectado"
     )
     
-    data_length = Column(
+    data_length: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
         comment="Comprimento dos dados decodificados"
@@ -61,37 +79,37 @@ class BarcodeResult(BaseModel):
     # ======================
     # POSITION AND SIZE
     # ======================
-    bbox = Column(
+    bbox: Mapped[Optional[List[float]]] = mapped_column(
         JSON,
         nullable=True,
         comment="Coordenadas da bounding box [x, y, width, height]"
     )
     
-    center_x = Column(
+    center_x: Mapped[Optional[int]] = mapped_column(
         Integer,
         nullable=True,
         comment="Coordenada X do centro do código"
     )
     
-    center_y = Column(
+    center_y: Mapped[Optional[int]] = mapped_column(
         Integer,
         nullable=True,
         comment="Coordenada Y do centro do código"
     )
     
-    width = Column(
+    width: Mapped[Optional[int]] = mapped_column(
         Integer,
         nullable=True,
         comment="Largura do código em pixels"
     )
     
-    height = Column(
+    height: Mapped[Optional[int]] = mapped_column(
         Integer,
         nullable=True,
         comment="Altura do código em pixels"
     )
     
-    area_pixels = Column(
+    area_pixels: Mapped[Optional[int]] = mapped_column(
         Integer,
         nullable=True,
         comment="Área total ocupada pelo código"
@@ -100,25 +118,25 @@ class BarcodeResult(BaseModel):
     # ======================
     # QUALITY METRICS
     # ======================
-    quality_score = Column(
+    quality_score: Mapped[Optional[float]] = mapped_column(
         Float,
         nullable=True,
         comment="Score de qualidade da leitura (0-1)"
     )
     
-    quality_description = Column(
+    quality_description: Mapped[Optional[str]] = mapped_column(
         String(20),
         nullable=True,
         comment="Descrição da qualidade: excellent, good, fair, poor"
     )
     
-    read_confidence = Column(
+    read_confidence: Mapped[Optional[float]] = mapped_column(
         Float,
         nullable=True,
         comment="Confiança na leitura dos dados (0-1)"
     )
     
-    decode_attempts = Column(
+    decode_attempts: Mapped[int] = mapped_column(
         Integer,
         default=1,
         nullable=False,
@@ -128,26 +146,26 @@ class BarcodeResult(BaseModel):
     # ======================
     # VALIDATION
     # ======================
-    checksum_valid = Column(
+    checksum_valid: Mapped[Optional[bool]] = mapped_column(
         Boolean,
         nullable=True,
         comment="Se o checksum do código é válido"
     )
     
-    checksum_value = Column(
+    checksum_value: Mapped[Optional[str]] = mapped_column(
         String(10),
         nullable=True,
         comment="Valor do checksum calculado"
     )
     
-    format_valid = Column(
+    format_valid: Mapped[bool] = mapped_column(
         Boolean,
         default=True,
         nullable=False,
         comment="Se o formato do código está correto"
     )
     
-    data_valid = Column(
+    data_valid: Mapped[bool] = mapped_column(
         Boolean,
         default=True,
         nullable=False,
@@ -157,25 +175,25 @@ class BarcodeResult(BaseModel):
     # ======================
     # PROCESSING DETAILS
     # ======================
-    decoder_used = Column(
+    decoder_used: Mapped[Optional[str]] = mapped_column(
         String(50),
         nullable=True,
         comment="Biblioteca/decoder utilizado (pyzbar, etc.)"
     )
     
-    orientation = Column(
+    orientation: Mapped[Optional[float]] = mapped_column(
         Float,
         nullable=True,
         comment="Orientação do código em graus"
     )
     
-    skew_angle = Column(
+    skew_angle: Mapped[Optional[float]] = mapped_column(
         Float,
         nullable=True,
         comment="Ângulo de inclinação detectado"
     )
     
-    preprocessing_applied = Column(
+    preprocessing_applied: Mapped[Optional[List[str]]] = mapped_column(
         JSON,
         nullable=True,
         comment="Preprocessamentos aplicados para melhorar leitura"
@@ -184,31 +202,31 @@ class BarcodeResult(BaseModel):
     # ======================
     # CONTENT ANALYSIS
     # ======================
-    content_type = Column(
+    content_type: Mapped[Optional[str]] = mapped_column(
         String(30),
         nullable=True,
         comment="Tipo de conteúdo: product, isbn, serial, custom, etc."
     )
     
-    country_code = Column(
+    country_code: Mapped[Optional[str]] = mapped_column(
         String(5),
         nullable=True,
         comment="Código do país (para EAN/UPC)"
     )
     
-    manufacturer_code = Column(
+    manufacturer_code: Mapped[Optional[str]] = mapped_column(
         String(10),
         nullable=True,
         comment="Código do fabricante (para EAN/UPC)"
     )
     
-    product_code = Column(
+    product_code: Mapped[Optional[str]] = mapped_column(
         String(10),
         nullable=True,
         comment="Código do produto (para EAN/UPC)"
     )
     
-    check_digit = Column(
+    check_digit: Mapped[Optional[str]] = mapped_column(
         String(5),
         nullable=True,
         comment="Dígito verificador"
@@ -217,19 +235,19 @@ class BarcodeResult(BaseModel):
     # ======================
     # METADATA
     # ======================
-    is_gs1_compliant = Column(
+    is_gs1_compliant: Mapped[Optional[bool]] = mapped_column(
         Boolean,
         nullable=True,
         comment="Se o código segue padrões GS1"
     )
     
-    symbology_details = Column(
+    symbology_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         JSON,
         nullable=True,
         comment="Detalhes específicos da simbologia"
     )
     
-    parsing_errors = Column(
+    parsing_errors: Mapped[Optional[List[str]]] = mapped_column(
         JSON,
         nullable=True,
         comment="Erros encontrados durante parsing"
@@ -238,17 +256,12 @@ class BarcodeResult(BaseModel):
     # ======================
     # RELATIONSHIP
     # ======================
-    job = relationship(
+    job: Mapped["ProcessingJob"] = relationship(
         "ProcessingJob",
         back_populates="barcode_results",
         lazy="select"
     )
     
-    def __init__(self, **kwargs):
-        """Inicializa resultado de barcode."""
-        super().__init__(**kwargs)
-        self._calculate_derived_fields()
-    
     def _calculate_derived_fields(self) -> None:
         """Calcula campos derivados automaticamente."""
         # Calcular comprimento dos dados
@@ -267,6 +280,21 @@ class BarcodeResult(BaseModel):
         # Analisar conteúdo
         self._analyze_content()
     
+    @classmethod
+    def prepare_bulk_row(cls, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Aplica _calculate_derived_fields a uma linha de inserção em lote.
+        
+        INSERT ... RETURNING com lista de linhas não dispara os eventos do
+        mapper (before_insert), então CRUDBase.bulk_create chama este hook.
+        """
+        obj = cls(**row)
+        obj._calculate_derived_fields()
+        
+        # Todas as linhas levam as mesmas chaves (executemany exige colunas uniformes)
+        values = obj.__dict__
+        return {**row, **{name: values.get(name) for name in _DERIVED_COLUMNS}}
+    
     def _analyze_content(self) -> None:
         """Analisa o conteúdo do código para extrair informações."""
         if not self.barcode_data:
@@ -320,33 +348,31 @@ class BarcodeResult(BaseModel):
     
     def _validate_ean13_checksum(self, data: str) -> None:
         """Valida checksum de EAN13."""
-        if len(data) != 13 or not data.isdigit():
+        if len(data) != 13 or not data.isdigit() or not data.isascii():
             self.checksum_valid = False
             return
         
-        # Algoritmo de validação EAN13
-        odd_sum = sum(int(data[i]) for i in range(0, 12, 2))
-        even_sum = sum(int(data[i]) for i in range(1, 12, 2))
-        total = odd_sum + (even_sum * 3)
+        # Algoritmo de validação EAN13 (pesos 1,3,1,3,...)
+        digits = data.encode("ascii")
+        total = _weighted_digit_sum(digits, _EAN13_WEIGHTS)
         check_digit = (10 - (total % 10)) % 10
         
         self.checksum_value = str(check_digit)
-        self.checksum_valid = (check_digit == int(data[12]))
+        self.checksum_valid = (check_digit == digits[12] - 48)
     
     def _validate_upc_checksum(self, data: str) -> None:
         """Valida checksum de UPC."""
-        if len(data) != 12 or not data.isdigit():
+        if len(data) != 12 or not data.isdigit() or not data.isascii():
             self.checksum_valid = False
             return
         
-        # Algoritmo de validação UPC
-        odd_sum = sum(int(data[i]) for i in range(0, 11, 2))
-        even_sum = sum(int(data[i]) for i in range(1, 11, 2))
-        total = (odd_sum * 3) + even_sum
+        # Algoritmo de validação UPC (pesos 3,1,3,1,...)
+        digits = data.encode("ascii")
+        total = _weighted_digit_sum(digits, _UPC_WEIGHTS)
         check_digit = (10 - (total % 10)) % 10
         
         self.checksum_value = str(check_digit)
-        self.checksum_valid = (check_digit == int(data[11]))
+        self.checksum_valid = (check_digit == digits[11] - 48)
     
     def set_quality_from_score(self, score: float) -> None:
         """
@@ -441,4 +467,27 @@ class BarcodeResult(BaseModel):
     
     def __repr__(self) -> str:
         """Representação string do resultado de barcode."""
-        return f"<BarcodeResult(job_id={self.job_id}, type={self.barcode_type}, data='{self.barcode_data[:20]}...')>"
\ No newline at end of file
+        return f"<BarcodeResult(job_id={self.job_id}, type={self.barcode_type}, data='{self.barcode_data[:20]}...')>"
+
+
+# Campos que alimentam _calculate_derived_fields
+_DERIVED_SOURCE_FIELDS = ("barcode_data", "barcode_type", "bbox")
+
+# Colunas preenchidas por _calculate_derived_fields (todas sem default)
+_DERIVED_COLUMNS = (
+    "data_length", "center_x", "center_y", "width", "height", "area_pixels",
+    "content_type", "country_code", "manufacturer_code", "product_code",
+    "check_digit", "checksum_valid", "checksum_value"
+)
+
+@event.listens_for(BarcodeResult, "before_insert")
+def _derive_fields_before_insert(mapper, connection, target: BarcodeResult) -> None:
+    """Calcula campos derivados apenas na persistência, nunca na construção."""
+    target._calculate_derived_fields()
+
+@event.listens_for(BarcodeResult, "before_update")
+def _derive_fields_before_update(mapper, connection, target: BarcodeResult) -> None:
+    """Recalcula campos derivados só quando os campos de origem mudaram."""
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _DERIVED_SOURCE_FIELDS):
+        target._calculate_derived_fields()
\ No newline at end of file
@@ -2,16 +2,124 @@
 Modelo base para todos os modelos do banco de dados.
 Define funcionalidades comuns e mixins.
 """
-from sqlalchemy import Column, DateTime, String, Boolean
+from sqlalchemy import DDL, Column, DateTime, String, Boolean, Index, event, false, inspect, text
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.orm import Session, ORMExecuteState, with_loader_criteria
 from sqlalchemy.sql import func
-from uuid import uuid4
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+import os
+import threading
+import time
+from uuid import UUID as PyUUID
 from datetime import datetime, timezone
-from typing import Any, Dict
+from enum import Enum as PyEnum
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
 
 from app.config.database import Base
 
+# UUID v7 gerado no PostgreSQL: os 6 primeiros bytes de um UUID aleatório são
+# trocados pelo timestamp em ms e os bits de versão passam de 4 para 7
+UUID_V7_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid;
+$$ LANGUAGE sql VOLATILE;
+"""
+
+# create_all precisa da função antes de criar tabelas que a usam como default
+event.listen(Base.metadata, "before_create", DDL(UUID_V7_FUNCTION_SQL))
+
+@event.listens_for(Base.metadata, "after_create")
+def _apply_column_compression(target, connection, **kw) -> None:
+    """
+    Aplica Column(info={"postgresql_compression": ...}) nas tabelas criadas
+    por create_all (SET COMPRESSION existe a partir do PostgreSQL 14).
+    """
+    if connection.dialect.name != "postgresql" or connection.dialect.server_version_info < (14,):
+        return
+    
+    for table in kw.get("tables") or target.sorted_tables:
+        for column in table.columns:
+            compression = column.info.get("postgresql_compression")
+            if compression:
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ALTER COLUMN {column.name} SET COMPRESSION {compression}"
+                ))
+
+class _RandomPool:
+    """
+    Buffer de bytes do CSPRNG (os.urandom) compartilhado pelos geradores de UUID.
+    Um único urandom de 16 * k bytes atende k UUIDs, em vez de uma syscall por ID.
+    """
+    
+    __slots__ = ("_size", "_buf", "_pos", "_lock")
+    
+    def __init__(self, k: int = 1024):
+        self._size = 16 * k
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Descarta o buffer (chamado também no filho após fork)."""
+        self._buf = b""
+        self._pos = 0
+    
+    def take(self, n: int) -> bytes:
+        """Retorna n bytes aleatórios ainda não usados."""
+        with self._lock:
+            if self._pos + n > len(self._buf):
+                self._buf = os.urandom(self._size)
+                self._pos = 0
+            start = self._pos
+            self._pos = start + n
+            return self._buf[start:self._pos]
+
+_random_pool = _RandomPool()
+
+# Workers criados por fork não podem herdar o buffer: gerariam os mesmos IDs
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_random_pool.reset)
+
+def uuid4() -> PyUUID:
+    """
+    Gera um UUID versão 4 (aleatório) a partir do buffer compartilhado.
+    Substitui uuid.uuid4 onde o ID precisa ser criado em Python.
+    """
+    return PyUUID(bytes=_random_pool.take(16), version=4)
+
+def uuid7() -> PyUUID:
+    """
+    Gera um UUID versão 7 (RFC 9562): timestamp Unix em ms nos 48 bits mais
+    significativos, seguido de bits aleatórios.
+    
+    IDs gerados em sequência são crescentes, então novos registros entram no
+    fim do índice da chave primária em vez de espalhados pela B-tree.
+    Equivalente a uuid_generate_v7() para quem precisa do ID antes do INSERT.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(_random_pool.take(10), "big")
+    
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                           # versão
+    value |= (rand >> 68) << 64                  # rand_a (12 bits)
+    value |= 0b10 << 62                          # variante RFC
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF        # rand_b (62 bits)
+    return PyUUID(int=value)
+
 class TimestampMixin:
     """
     Mixin para campos de timestamp automáticos.
@@ -36,13 +144,14 @@ class TimestampMixin:
 class UUIDMixin:
     """
     Mixin para chave primária UUID.
-    Gera automaticamente UUIDs para IDs.
+    Gera automaticamente UUIDs v7 (ordenados por tempo) para IDs no próprio
+    PostgreSQL; o ID volta via RETURNING e inserts em lote não geram nada em Python.
     """
     
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        server_default=text("uuid_generate_v7()"),
         nullable=False,
         comment="Identificador único UUID"
     )
@@ -51,8 +160,36 @@ class SoftDeleteMixin:
     """
     Mixin para soft delete.
     Permite "deletar" registros sem removê-los fisicamente.
+    
+    SELECTs ORM de modelos com este mixin recebem automaticamente o filtro
+    is_deleted = false (ver _filter_soft_deleted); use a execution option
+    include_deleted=True para enxergar registros deletados. O listener só é
+    registrado quando o primeiro modelo herda o mixin. Statements lambda_stmt
+    não passam pelo filtro: devem incluir is_deleted = false por conta própria.
+    
+    Adiciona um índice parcial só com as linhas ativas. Modelos que definem o
+    próprio __table_args__ devem incluir SoftDeleteMixin.active_rows_index(__tablename__).
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Sem modelos soft delete, nenhum SELECT paga o custo do listener
+        if not event.contains(Session, "do_orm_execute", _filter_soft_deleted):
+            event.listen(Session, "do_orm_execute", _filter_soft_deleted)
+    
+    @staticmethod
+    def active_rows_index(tablename: str) -> Index:
+        """Índice parcial contendo apenas as linhas não deletadas."""
+        return Index(
+            f"ix_{tablename}_active",
+            "is_deleted",
+            postgresql_where=text("is_deleted = false")
+        )
+    
+    @declared_attr
+    def __table_args__(cls):
+        return (cls.active_rows_index(cls.__tablename__),)
+    
     is_deleted = Column(
         Boolean,
         default=False,
@@ -76,6 +213,30 @@ class SoftDeleteMixin:
         self.is_deleted = False
         self.deleted_at = None
 
+def _filter_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """
+    Aplica is_deleted = false a todo SELECT ORM de modelos com SoftDeleteMixin.
+    Registrado por SoftDeleteMixin.__init_subclass__.
+    """
+    # .options() em um StatementLambdaElement devolve uma cópia fixa do
+    # statement, com os valores da primeira chamada: lambdas nunca são alterados
+    if isinstance(execute_state.statement, StatementLambdaElement):
+        return
+    
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.execution_options.get("include_deleted", False)
+        and any(issubclass(mapper.class_, SoftDeleteMixin) for mapper in execute_state.all_mappers)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.is_deleted == false(),
+                include_aliases=True
+            )
+        )
+
 class AuditMixin:
     """
     Mixin para auditoria.
@@ -94,6 +255,14 @@ class AuditMixin:
         comment="ID do usuário que fez a última atualização"
     )
 
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+def _enum_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.value if isinstance(value, PyEnum) else str(value)
+
 class BaseModel(Base, UUIDMixin, TimestampMixin):
     """
     Modelo base para todas as entidades.
@@ -102,33 +271,98 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
     
     __abstract__ = True
     
+    @classmethod
+    def _column_names(cls) -> Tuple[str, ...]:
+        """
+        Retorna os nomes das colunas da tabela, montados uma vez por classe.
+        (Com declarative_base o __table__ só existe depois da metaclasse,
+        por isso o cache é preenchido no primeiro uso e não em __init_subclass__.)
+        """
+        names = cls.__dict__.get("_column_names_cache")
+        if names is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            cls._column_names_cache = names
+        return names
+    
+    @classmethod
+    def _column_serializers(cls) -> Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]:
+        """
+        Retorna (nome, conversor) de cada coluna, montado uma vez por classe
+        a partir do tipo da coluna: DateTime -> isoformat, Enum -> valor,
+        demais tipos sem conversão.
+        """
+        serializers = cls.__dict__.get("_serializers_cache")
+        if serializers is None:
+            entries = []
+            for column in cls.__table__.columns:
+                if isinstance(column.type, DateTime):
+                    converter = _isoformat
+                elif isinstance(column.type, SQLEnum):
+                    converter = _enum_value
+                else:
+                    converter = None
+                entries.append((column.name, converter))
+            serializers = tuple(entries)
+            cls._serializers_cache = serializers
+        return serializers
+    
+    @classmethod
+    def _deferred_column_names(cls) -> FrozenSet[str]:
+        """Nomes das colunas mapeadas com deferred(), montados uma vez por classe."""
+        names = cls.__dict__.get("_deferred_names_cache")
+        if names is None:
+            names = frozenset(prop.key for prop in inspect(cls).column_attrs if prop.deferred)
+            cls._deferred_names_cache = names
+        return names
+    
     def to_dict(self, exclude_fields: set = None) -> Dict[str, Any]:
         """
         Converte o modelo para dicionário.
         
+        Colunas deferred ainda não carregadas ficam de fora: serializar não
+        dispara um SELECT por registro (use undefer() na consulta para incluí-las).
+        
         Args:
             exclude_fields: Campos a serem excluídos
             
         Returns:
             Dict com os dados do modelo
         """
-        exclude_fields = exclude_fields or set()
+        exclude_fields = exclude_fields or ()
+        
+        deferred_names = self._deferred_column_names()
+        if deferred_names:
+            state = inspect(self)
+            if state.has_identity:
+                unloaded = deferred_names & state.unloaded
+                if unloaded:
+                    exclude_fields = unloaded.union(exclude_fields)
         
         result = {}
-        for column in self.__table__.columns:
-            if column.name not in exclude_fields:
-                value = getattr(self, column.name)
-                
-                # Converter tipos especiais para serialização
-                if isinstance(value, datetime):
-                    result[column.name] = value.isoformat()
-                elif hasattr(value, '__dict__'):
-                    result[column.name] = str(value)
-                else:
-                    result[column.name] = value
+        for name, converter in self._column_serializers():
+            if name not in exclude_fields:
+                value = getattr(self, name)
+                result[name] = converter(value) if converter else value
         
         return result
     
+    @classmethod
+    def row_to_dict(cls, row: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Converte uma linha Core da tabela (select(Model.__table__)) no mesmo
+        formato de to_dict, sem hidratar o objeto ORM.
+        
+        Args:
+            row: Linha como mapeamento (Result.mappings())
+            
+        Returns:
+            Dict com os dados da linha
+        """
+        return {
+            name: converter(row[name]) if converter else row[name]
+            for name, converter in cls._column_serializers()
+        }
+    
     def update_from_dict(self, data: Dict[str, Any], exclude_fields: set = None):
         """
         Atualiza o modelo a partir de um dicionário.
@@ -151,7 +385,7 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
     @classmethod
     def get_columns(cls) -> list:
         """Retorna lista de colunas da tabela."""
-        return [column.name for column in cls.__table__.columns]
+        return list(cls._column_names())
     
     def __repr__(self) -> str:
         """Representação string do modelo."""
@@ -163,12 +397,6 @@ class LogMixin:
     Útil para tabelas que precisam de informações extras de debug.
     """
     
-    debug_info = Column(
-        String,
-        nullable=True,
-        comment="Informações de debug em formato JSON"
-    )
-    
     processing_notes = Column(
         String,
         nullable=True,
@@ -176,7 +404,6 @@ class LogMixin:
     )
 
 # Enums customizados para o banco
-from enum import Enum as PyEnum
 from sqlalchemy import Enum
 
 class JobType(PyEnum):
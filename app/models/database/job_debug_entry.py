@@ -0,0 +1,67 @@
+# app/models/database/job_debug_entry.py
+"""
+Modelo para o histórico de debug dos jobs de processamento.
+Uma linha por entrada (append-only), fora da linha do job.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from typing import Dict, Any
+
+from app.models.database.base import BaseModel
+
+class JobDebugEntry(BaseModel):
+    """
+    Entrada de debug de um job.
+    Substitui o array debug_info que ficava na própria linha de processing_jobs.
+    """
+    
+    __tablename__ = "job_debug_entries"
+    __table_args__ = (
+        Index("idx_job_debug_entries_job_ts", "job_id", "ts"),
+        {'comment': 'Histórico de informações de debug dos jobs'}
+    )
+    
+    # ======================
+    # RELATIONSHIP
+    # ======================
+    job_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("processing_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="ID do job de processamento relacionado"
+    )
+    
+    # ======================
+    # ENTRY DATA
+    # ======================
+    ts = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="Momento em que a entrada foi registrada"
+    )
+    
+    info = Column(
+        JSONB,
+        nullable=True,
+        comment="Informações de debug"
+    )
+    
+    job = relationship(
+        "ProcessingJob",
+        back_populates="debug_entries",
+        lazy="select"
+    )
+    
+    def to_entry(self) -> Dict[str, Any]:
+        """Formato das entradas do antigo array debug_info ({timestamp, info})."""
+        return {
+            "timestamp": self.ts.isoformat() if self.ts else None,
+            "info": self.info
+        }
+    
+    def __repr__(self) -> str:
+        """Representação string da entrada de debug."""
+        return f"<JobDebugEntry(job_id={self.job_id}, ts={self.ts})>"
\ No newline at end of file
@@ -3,12 +3,55 @@
 Modelo para armazenar resultados detalhados de OCR.
 Complementa a tabela processing_jobs com dados específicos do OCR.
 """
-from sqlalchemy import Column, String, Text, Integer, Float, JSON, ForeignKey
+from dataclasses import dataclass
+from itertools import islice
+from sqlalchemy import Column, Computed, String, Text, Integer, Float, JSON, ForeignKey, bindparam, insert, lambda_stmt, select
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from typing import Dict, Any, List, Optional
+from sqlalchemy.orm import Session, deferred, relationship, undefer
+from typing import Dict, Any, Iterable, List, Optional
+from uuid import UUID as PyUUID
 
 from app.models.database.base import BaseModel
+from app.core.ocr_stats import analyze_text, compute_block_stats
+
+@dataclass(slots=True)
+class OCRResultDTO:
+    """
+    Visão somente leitura de um resultado OCR para respostas da API e analytics.
+    Sem estado do ORM e com __slots__: bem menor em memória que a instância mapeada
+    e serializada diretamente pelo orjson.
+    """
+    
+    id: PyUUID
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    job_id: PyUUID
+    full_text: Optional[str]
+    language_detected: Optional[str]
+    total_blocks: int
+    total_characters: int
+    total_words: int
+    confidence_avg: Optional[float]
+    confidence_min: Optional[float]
+    confidence_max: Optional[float]
+    confidence_std: Optional[float]
+    blocks_with_low_confidence: int
+    paddle_ocr_version: Optional[str]
+    model_version: Optional[str]
+    preprocessing_applied: Optional[List[Any]]
+    orientation_detected: Optional[float]
+    orientation_corrected: Optional[float]
+    image_quality_score: Optional[float]
+    text_density: Optional[float]
+    dominant_font_size: Optional[int]
+    language_confidence: Optional[float]
+    mixed_languages: Optional[Any]
+    sentences_count: int
+    paragraphs_count: int
+    numeric_sequences: int
+    email_addresses: int
+    phone_numbers: int
+    urls_found: int
 
 class OCRResult(BaseModel):
     """
@@ -34,11 +77,13 @@ class OCRResult(BaseModel):
     # ======================
     # TEXT CONTENT
     # ======================
-    full_text = Column(
+    # Carregado sob demanda: listagens só precisam das estatísticas
+    full_text = deferred(Column(
         Text,
         nullable=True,
+        info={"postgresql_compression": "lz4"},
         comment="Texto completo extraído da imagem"
-    )
+    ))
     
     language_detected = Column(
         String(10),
@@ -53,16 +98,21 @@ class OCRResult(BaseModel):
         comment="Número total de blocos de texto detectados"
     )
     
+    # Colunas geradas pelo PostgreSQL a partir de full_text (não são escritas pela aplicação)
     total_characters = Column(
         Integer,
-        default=0,
+        Computed("COALESCE(char_length(full_text), 0)", persisted=True),
         nullable=False,
         comment="Número total de caracteres extraídos"
     )
     
     total_words = Column(
         Integer,
-        default=0,
+        Computed(
+            "CASE WHEN full_text IS NULL OR btrim(full_text) = '' THEN 0 "
+            "ELSE array_length(regexp_split_to_array(btrim(full_text), '\\s+'), 1) END",
+            persisted=True
+        ),
         nullable=False,
         comment="Número total de palavras extraídas"
     )
@@ -97,11 +147,12 @@ class OCRResult(BaseModel):
     # ======================
     # TEXT BLOCKS DETAILS
     # ======================
-    text_blocks = Column(
+    text_blocks = deferred(Column(
         JSON,
         nullable=True,
-        comment="Array com todos os blocos de texto detectados"
-    )
+        info={"postgresql_compression": "lz4"},
+        comment="Array com todos os blocos de texto detectados (legado; ver ocr_text_blocks)"
+    ))
     
     blocks_with_low_confidence = Column(
         Integer,
@@ -233,10 +284,74 @@ class OCRResult(BaseModel):
         lazy="select"
     )
     
+    text_block_rows = relationship(
+        "OCRTextBlock",
+        back_populates="ocr_result",
+        cascade="save-update, merge",
+        passive_deletes="all",  # ON DELETE CASCADE em ocr_text_blocks.ocr_result_id
+        order_by="OCRTextBlock.block_index",
+        lazy="select"
+    )
+    
     def __init__(self, **kwargs):
         """Inicializa resultado OCR."""
         super().__init__(**kwargs)
     
+    # ======================
+    # CONSULTAS FREQUENTES
+    # ======================
+    # Statements em lambda_stmt (definidos no fim do módulo): a chave de cache é
+    # o código da lambda, sem reconstruir a cláusula WHERE a cada chamada
+    
+    @classmethod
+    def by_id(cls, session: Session, result_id: PyUUID) -> Optional["OCRResult"]:
+        """Busca um resultado pelo ID."""
+        return session.scalars(_with_full_text(_STMT_BY_ID), {"result_id": result_id}).one_or_none()
+    
+    @classmethod
+    def by_job_id(cls, session: Session, job_id: PyUUID) -> List["OCRResult"]:
+        """Lista os resultados de um job."""
+        return list(session.scalars(_STMT_BY_JOB, {"job_id": job_id}).all())
+    
+    @classmethod
+    def latest_for_job(cls, session: Session, job_id: PyUUID) -> Optional["OCRResult"]:
+        """Retorna o resultado mais recente de um job."""
+        return session.scalars(_with_full_text(_STMT_LATEST_FOR_JOB), {"job_id": job_id}).first()
+    
+    @classmethod
+    def bulk_create(
+        cls,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 1000
+    ) -> int:
+        """
+        Insere resultados em lotes com executemany (insertmanyvalues).
+        
+        O iterável é consumido em fatias de `batch_size`, então nunca é
+        materializado inteiro em memória. Não faz commit.
+        
+        Args:
+            session: Sessão do banco
+            rows: Dicionários com os valores das colunas
+            batch_size: Linhas por lote
+        
+        Returns:
+            Número de linhas inseridas
+        """
+        stmt = insert(cls)
+        iterator = iter(rows)
+        total = 0
+        
+        while True:
+            chunk = list(islice(iterator, batch_size))
+            if not chunk:
+                break
+            session.execute(stmt, chunk)
+            total += len(chunk)
+        
+        return total
+    
     def calculate_statistics(self, text_blocks: List[Dict[str, Any]]) -> None:
         """
         Calcula estatísticas automáticas baseadas nos blocos de texto.
@@ -247,72 +362,17 @@ class OCRResult(BaseModel):
         if not text_blocks:
             return
         
-        # Estatísticas básicas
-        self.total_blocks = len(text_blocks)
-        
-        # Extrair todo o texto
-        full_text = ""
-        confidences = []
-        
-        for block in text_blocks:
-            text = block.get("text", "")
-            confidence = block.get("confidence")
-            
-            full_text += text + " "
-            if confidence is not None:
-                confidences.append(confidence)
-        
-        self.full_text = full_text.strip()
-        self.total_characters = len(self.full_text)
-        self.total_words = len(self.full_text.split()) if self.full_text else 0
-        
-        # Estatísticas de confiança
-        if confidences:
-            import statistics
-            self.confidence_avg = statistics.mean(confidences)
-            self.confidence_min = min(confidences)
-            self.confidence_max = max(confidences)
-            if len(confidences) > 1:
-                self.confidence_std = statistics.stdev(confidences)
-            
-            # Blocos com baixa confiança
-            self.blocks_with_low_confidence = len([c for c in confidences if c < 0.8])
-        
-        # Análise de conteúdo
-        self._analyze_content()
+        # Um documento: passada única em Python puro, sem o custo de montar arrays NumPy
+        for field, value in compute_block_stats(text_blocks).items():
+            setattr(self, field, value)
     
     def _analyze_content(self) -> None:
         """Analisa o conteúdo do texto para extrair estatísticas."""
         if not self.full_text:
             return
         
-        import re
-        
-        text = self.full_text
-        
-        # Contar sentenças (aproximado)
-        sentences = re.split(r'[.!?]+', text)
-        self.sentences_count = len([s for s in sentences if s.strip()])
-        
-        # Contar parágrafos (aproximado)
-        paragraphs = text.split('\n\n')
-        self.paragraphs_count = len([p for p in paragraphs if p.strip()])
-        
-        # Detectar emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.email_addresses = len(re.findall(email_pattern, text))
-        
-        # Detectar telefones (padrão brasileiro)
-        phone_pattern = r'(\(?\d{2}\)?\s?)?\d{4,5}-?\d{4}'
-        self.phone_numbers = len(re.findall(phone_pattern, text))
-        
-        # Detectar URLs
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        self.urls_found = len(re.findall(url_pattern, text))
-        
-        # Detectar sequências numéricas
-        numeric_pattern = r'\b\d{4,}\b'  # 4 ou mais dígitos consecutivos
-        self.numeric_sequences = len(re.findall(numeric_pattern, text))
+        for field, value in analyze_text(self.full_text).items():
+            setattr(self, field, value)
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -344,22 +404,70 @@ class OCRResult(BaseModel):
             }
         }
     
+    def get_text_blocks(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retorna os blocos de texto na ordem de leitura.
+        
+        Lê de ocr_text_blocks; resultados antigos, sem linhas na tabela,
+        caem no JSON legado text_blocks.
+        
+        Returns:
+            Lista de blocos no formato do OCRService, ou None se não houver
+        """
+        if self.text_block_rows:
+            return [row.to_block() for row in self.text_block_rows]
+        return self.text_blocks
+    
     def to_dict(self, include_text_blocks: bool = False) -> Dict[str, Any]:
         """
         Converte para dicionário com opção de incluir blocos de texto.
         
         Args:
             include_text_blocks: Se deve incluir array completo de text_blocks
+                (ver get_text_blocks)
             
         Returns:
             Dicionário com dados do modelo
         """
-        exclude_fields = set()
-        if not include_text_blocks:
-            exclude_fields.add("text_blocks")
+        result = super().to_dict(exclude_fields={"text_blocks"})
+        if include_text_blocks:
+            result["text_blocks"] = self.get_text_blocks()
         
-        return super().to_dict(exclude_fields=exclude_fields)
+        return result
+    
+    def to_dto(self) -> OCRResultDTO:
+        """
+        Converte para OCRResultDTO (sem text_blocks).
+        
+        Returns:
+            DTO com os valores das colunas já serializados
+        """
+        # full_text fica None quando não foi carregado (coluna deferred)
+        return OCRResultDTO(**{"full_text": None, **self.to_dict()})
     
     def __repr__(self) -> str:
         """Representação string do resultado OCR."""
-        return f"<OCRResult(job_id={self.job_id}, blocks={self.total_blocks}, chars={self.total_characters})>"
\ No newline at end of file
+        return f"<OCRResult(job_id={self.job_id}, blocks={self.total_blocks}, chars={self.total_characters})>"
+
+# Statements das consultas frequentes de OCRResult
+# (buscas de um único resultado já trazem full_text; a listagem por job não)
+_STMT_BY_ID = lambda_stmt(
+    lambda: select(OCRResult).where(OCRResult.id == bindparam("result_id"))
+)
+_STMT_BY_JOB = lambda_stmt(
+    lambda: select(OCRResult).where(OCRResult.job_id == bindparam("job_id"))
+)
+_STMT_LATEST_FOR_JOB = lambda_stmt(
+    lambda: select(OCRResult)
+    .where(OCRResult.job_id == bindparam("job_id"))
+    .order_by(OCRResult.created_at.desc())
+    .limit(1)
+)
+
+def _with_full_text(stmt):
+    """
+    Acrescenta undefer(full_text) ao statement na hora da execução.
+    (A lambda de lambda_stmt roda na definição; undefer() ali configuraria os
+    mappers antes de BarcodeResult/QRCodeResult existirem.)
+    """
+    return stmt.add_criteria(lambda s: s.options(undefer(OCRResult.full_text)))
\ No newline at end of file
@@ -0,0 +1,134 @@
+# app/models/database/ocr_text_block.py
+"""
+Modelo para os blocos de texto individuais de um resultado OCR.
+Uma linha por bloco, permitindo agregações em SQL sem parsear o JSON de text_blocks.
+"""
+from sqlalchemy import Column, Text, Integer, Float, JSON, ForeignKey, Index, insert
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session, relationship
+from typing import Dict, Any, List
+from uuid import UUID as PyUUID
+
+from app.models.database.base import BaseModel
+
+class OCRTextBlock(BaseModel):
+    """
+    Bloco de texto detectado pelo OCR.
+    Normaliza OCRResult.text_blocks em colunas (texto, confiança, bbox).
+    """
+    
+    __tablename__ = "ocr_text_blocks"
+    __table_args__ = (
+        Index("idx_ocr_text_blocks_result_index", "ocr_result_id", "block_index"),
+        {'comment': 'Blocos de texto individuais dos resultados OCR'}
+    )
+    
+    # ======================
+    # RELATIONSHIP
+    # ======================
+    ocr_result_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("ocr_results.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="ID do resultado OCR ao qual o bloco pertence"
+    )
+    
+    job_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("processing_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="ID do job de processamento relacionado"
+    )
+    
+    # ======================
+    # BLOCK DATA
+    # ======================
+    block_index = Column(
+        Integer,
+        nullable=False,
+        comment="Posição do bloco na ordem de leitura"
+    )
+    
+    text = Column(
+        Text,
+        nullable=True,
+        comment="Texto reconhecido no bloco"
+    )
+    
+    confidence = Column(
+        Float,
+        nullable=True,
+        comment="Confiança do reconhecimento do bloco (0-1)"
+    )
+    
+    bbox = Column(
+        JSON,
+        nullable=True,
+        comment="Coordenadas do bloco na imagem"
+    )
+    
+    # ======================
+    # RELATIONSHIP
+    # ======================
+    ocr_result = relationship(
+        "OCRResult",
+        back_populates="text_block_rows",
+        lazy="select"
+    )
+    
+    def to_block(self) -> Dict[str, Any]:
+        """
+        Converte a linha de volta para o formato de bloco do OCRService
+        (confidence só aparece quando foi gravada).
+        """
+        block = {"text": self.text, "bbox": self.bbox}
+        if self.confidence is not None:
+            block["confidence"] = self.confidence
+        return block
+    
+    @staticmethod
+    def rows_from_blocks(
+        ocr_result_id: PyUUID,
+        job_id: PyUUID,
+        text_blocks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Converte a lista de blocos do OCR em linhas para inserção em lote.
+        
+        Args:
+            ocr_result_id: ID do resultado OCR
+            job_id: ID do job
+            text_blocks: Blocos no formato retornado pelo OCRService
+        
+        Returns:
+            Lista de dicionários com os valores das colunas
+        """
+        return [
+            {
+                "ocr_result_id": ocr_result_id,
+                "job_id": job_id,
+                "block_index": index,
+                "text": block.get("text"),
+                "confidence": block.get("confidence"),
+                "bbox": block.get("bbox")
+            }
+            for index, block in enumerate(text_blocks)
+        ]
+    
+    @classmethod
+    def bulk_create(cls, session: Session, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insere os blocos com um único executemany (INSERT multi-VALUES).
+        Não faz commit.
+        
+        Returns:
+            Número de blocos inseridos
+        """
+        if rows:
+            session.execute(insert(cls), rows)
+        return len(rows)
+    
+    def __repr__(self) -> str:
+        """Representação string do bloco de texto."""
+        return f"<OCRTextBlock(ocr_result_id={self.ocr_result_id}, index={self.block_index})>"
\ No newline at end of file
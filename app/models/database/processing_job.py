@@ -3,14 +3,98 @@
 Modelo principal para jobs de processamento.
 Armazena informações sobre cada requisição de processamento (OCR, Barcode, QRCode).
 """
-from sqlalchemy import Column, String, Integer, Text, Boolean, Float, JSON, DateTime
-from sqlalchemy.dialects.postgresql import INET
-from sqlalchemy.orm import relationship
-from typing import Dict, Any, Optional
+from sqlalchemy import DDL, Column, Computed, String, Integer, Text, Boolean, Float, DateTime, Index, bindparam, event, func, insert, inspect, select, text, update
+from sqlalchemy.dialects.postgresql import INET, JSONB
+from sqlalchemy.orm import Session, object_session, relationship, undefer
+from typing import Dict, Any, Iterable, List, Optional, Sequence
 from datetime import datetime, timezone
-import json
+from enum import Enum
+from itertools import islice
+import io
+import time
+import orjson
 
 from app.models.database.base import BaseModel, JobType, JobStatus, JobTypeSQL, JobStatusSQL, LogMixin
+from app.models.database.job_debug_entry import JobDebugEntry
+from app.models.database.ocr_result import OCRResult
+
+# Lotes com pelo menos esse número de linhas vão por COPY em vez de INSERT multi-VALUES
+COPY_MIN_ROWS = 1000
+
+# Marcador de NULL no CSV enviado ao COPY
+_COPY_NULL = "\\N"
+
+# Campos omitidos por to_dict, indexados por (include_results, include_debug);
+# debug_info não é coluna (vem de job_debug_entries), então não precisa ser excluído
+_EXCLUDE = {
+    (True, True): frozenset(),
+    (True, False): frozenset({'processing_notes'}),
+    (False, True): frozenset({'results', 'results_summary'}),
+    (False, False): frozenset({'results', 'results_summary', 'processing_notes'}),
+}
+
+def _copy_field(value: Any) -> str:
+    """
+    Formata um valor de coluna como campo do CSV enviado ao COPY.
+    Valores não nulos vão sempre entre aspas: só o marcador de NULL sem aspas
+    vira NULL, então uma string "\\N" continua sendo texto.
+    """
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, Enum):
+        value = value.value
+    elif isinstance(value, (dict, list)):
+        value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+# Resumo textual de results por tipo de job, usado pela coluna gerada results_summary
+# (funções IMMUTABLE: podem aparecer em GENERATED ALWAYS AS)
+RESULTS_SUMMARY_FUNCTIONS_SQL = """
+CREATE OR REPLACE FUNCTION job_summary_ocr(r jsonb) RETURNS text AS $$
+    SELECT 'OCR: '
+        || COALESCE(jsonb_array_length(r->'text_blocks'), 0)::text || ' blocos, '
+        || COALESCE(char_length(r->>'full_text'), 0)::text || ' caracteres, idioma: '
+        || COALESCE(r->>'language_detected', 'desconhecido');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION job_summary_barcode(r jsonb) RETURNS text AS $$
+    SELECT CASE n
+        WHEN 0 THEN 'Barcode: Nenhum código encontrado'
+        WHEN 1 THEN 'Barcode: 1 código ' || COALESCE(r->'barcodes'->0->>'type', 'desconhecido') || ' encontrado'
+        ELSE 'Barcode: ' || n::text || ' códigos encontrados ('
+            || (SELECT string_agg(barcode_type, ', ' ORDER BY first_seen)
+                FROM (SELECT COALESCE(e->>'type', 'desconhecido') AS barcode_type, min(pos) AS first_seen
+                      FROM jsonb_array_elements(r->'barcodes') WITH ORDINALITY AS x(e, pos)
+                      GROUP BY 1) AS types)
+            || ')'
+    END
+    FROM (SELECT COALESCE(jsonb_array_length(r->'barcodes'), 0) AS n) AS c;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION job_summary_qrcode(r jsonb) RETURNS text AS $$
+    SELECT CASE n
+        WHEN 0 THEN 'QR Code: Nenhum código encontrado'
+        WHEN 1 THEN 'QR Code: 1 código ' || COALESCE(r->'qr_codes'->0->>'data_type', 'texto') || ' encontrado'
+        ELSE 'QR Code: ' || n::text || ' códigos encontrados'
+    END
+    FROM (SELECT COALESCE(jsonb_array_length(r->'qr_codes'), 0) AS n) AS c;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION job_results_summary(p_job_type job_type, r jsonb) RETURNS text AS $$
+    SELECT CASE p_job_type
+        WHEN 'ocr' THEN job_summary_ocr(r)
+        WHEN 'barcode' THEN job_summary_barcode(r)
+        WHEN 'qrcode' THEN job_summary_qrcode(r)
+        WHEN 'all' THEN COALESCE(NULLIF(concat_ws(' | ',
+            CASE WHEN r ? 'ocr' THEN job_summary_ocr(r->'ocr') END,
+            CASE WHEN r ? 'barcodes' THEN job_summary_barcode(r->'barcodes') END,
+            CASE WHEN r ? 'qr_codes' THEN job_summary_qrcode(r->'qr_codes') END
+        ), ''), 'Processamento combinado concluído')
+    END;
+$$ LANGUAGE sql IMMUTABLE STRICT;
+"""
 
 class ProcessingJob(BaseModel, LogMixin):
     """
@@ -19,9 +103,28 @@ class ProcessingJob(BaseModel, LogMixin):
     """
     
     __tablename__ = "processing_jobs"
-    __table_args__ = {
-        'comment': 'Tabela principal para tracking de jobs de processamento'
-    }
+    __table_args__ = (
+        # GIN com jsonb_path_ops: atende consultas de contenção (@>) em chaves internas
+        Index("ix_jobs_processing_params_gin", "processing_params",
+              postgresql_using="gin", postgresql_ops={"processing_params": "jsonb_path_ops"}),
+        # Fila: WHERE status = 'pending' ORDER BY created_at
+        # ((status, created_at DESC) já existe como idx_pj_status_created, migração 0003)
+        Index("ix_jobs_pending_created", "created_at",
+              postgresql_where=text("status = 'pending'")),
+        # BRIN para varreduras por intervalo de tempo (inserções já chegam em ordem)
+        Index("brin_jobs_created", "created_at",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("brin_jobs_completed", "completed_at",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Deduplicação: busca de job concluído com o mesmo arquivo
+        Index("ix_jobs_input_hash_completed", "input_hash",
+              postgresql_where=text("status = 'completed'")),
+        # status + contenção em results no mesmo índice (requer btree_gin);
+        # também atende filtros só em results (get_by_results)
+        Index("ix_jobs_status_results_gin", "status", "results",
+              postgresql_using="gin", postgresql_ops={"results": "jsonb_path_ops"}),
+        {'comment': 'Tabela principal para tracking de jobs de processamento'}
+    )
     
     # ======================
     # JOB IDENTIFICATION
@@ -61,7 +164,7 @@ class ProcessingJob(BaseModel, LogMixin):
     )
     
     input_dimensions = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Dimensões da imagem: {width: int, height: int}"
     )
@@ -76,7 +179,7 @@ class ProcessingJob(BaseModel, LogMixin):
     # PROCESSING PARAMETERS
     # ======================
     processing_params = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Parâmetros específicos do processamento em JSON"
     )
@@ -85,13 +188,16 @@ class ProcessingJob(BaseModel, LogMixin):
     # RESULTS DATA
     # ======================
     results = Column(
-        JSON,
+        JSONB,
         nullable=True,
+        info={"postgresql_compression": "lz4"},
         comment="Resultados completos do processamento em JSON"
     )
     
+    # Gerada pelo PostgreSQL a partir de job_type e results (não é escrita pela aplicação)
     results_summary = Column(
         Text,
+        Computed("job_results_summary(job_type, results)", persisted=True),
         nullable=True,
         comment="Resumo textual dos resultados principais"
     )
@@ -112,7 +218,7 @@ class ProcessingJob(BaseModel, LogMixin):
     )
     
     error_details = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Detalhes técnicos do erro em JSON"
     )
@@ -204,24 +310,41 @@ class ProcessingJob(BaseModel, LogMixin):
     # ======================
     # RELATIONSHIPS
     # ======================
+    # selectin: um SELECT ... WHERE job_id IN (...) por tabela filha, qualquer que seja
+    # o número de jobs carregados (sem N+1 ao iterar jobs)
+    # Exclusão dos filhos fica com o ON DELETE CASCADE das FKs: o ORM não carrega
+    # nem apaga linha a linha
     ocr_results = relationship(
         "OCRResult", 
         back_populates="job", 
-        cascade="all, delete-orphan",
-        lazy="select"
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="selectin"
     )
     
     barcode_results = relationship(
         "BarcodeResult", 
         back_populates="job", 
-        cascade="all, delete-orphan",
-        lazy="select"
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="selectin"
     )
     
     qrcode_results = relationship(
         "QRCodeResult", 
         back_populates="job", 
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="selectin"
+    )
+    
+    # Histórico de debug em tabela própria; carregado só quando pedido
+    debug_entries = relationship(
+        "JobDebugEntry",
+        back_populates="job",
+        cascade="save-update, merge",
+        passive_deletes="all",
+        order_by="JobDebugEntry.ts",
         lazy="select"
     )
     
@@ -231,22 +354,211 @@ class ProcessingJob(BaseModel, LogMixin):
         if not self.status:
             self.status = JobStatus.PENDING
     
+    # ======================
+    # LISTAGEM
+    # ======================
+    @classmethod
+    def list_summary(
+        cls,
+        session: Session,
+        *,
+        filters: Sequence[Any] = (),
+        order_by: Any = None,
+        offset: int = 0,
+        limit: int = 100
+    ) -> Sequence[Any]:
+        """
+        Lista jobs projetando só as colunas de resumo, sem hidratar objetos ORM
+        (nem identity map, nem carregamento dos relacionamentos).
+        
+        Args:
+            session: Sessão do banco
+            filters: Condições WHERE
+            order_by: Expressão de ordenação (padrão: created_at desc)
+            offset: Registros para pular
+            limit: Limite de registros
+        
+        Returns:
+            Linhas (RowMapping) com as colunas de resumo
+        """
+        stmt = (
+            select(
+                cls.id, cls.job_type, cls.status, cls.created_at, cls.completed_at,
+                cls.processing_time_ms, cls.input_filename, cls.input_size_bytes,
+                cls.error_code, cls.results_summary
+            )
+            .where(*filters)
+            .order_by(order_by if order_by is not None else cls.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        return session.execute(stmt).mappings().all()
+    
+    # ======================
+    # DEDUPLICAÇÃO
+    # ======================
+    @classmethod
+    def find_completed_duplicate_results(
+        cls,
+        session: Session,
+        input_hash: Optional[str],
+        job_type: JobType,
+        processing_params: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Busca os resultados do job concluído mais recente com o mesmo arquivo,
+        tipo e parâmetros, para reaproveitá-los em vez de reprocessar.
+        
+        Lê apenas a coluna results: carregar a entidade traria junto (selectin)
+        todas as linhas filhas do job anterior.
+        
+        Args:
+            session: Sessão do banco
+            input_hash: Hash SHA256 do arquivo
+            job_type: Tipo do job
+            processing_params: Parâmetros do processamento
+        
+        Returns:
+            Resultados do job concluído equivalente ou None
+        """
+        if not input_hash:
+            return None
+        
+        return session.scalar(
+            select(cls.results)
+            .where(
+                cls.input_hash == input_hash,
+                cls.status == JobStatus.COMPLETED,
+                cls.job_type == job_type,
+                cls.processing_params == processing_params,
+                cls.results.isnot(None)
+            )
+            .order_by(cls.created_at.desc())
+            .limit(1)
+        )
+    
+    # ======================
+    # INSERÇÃO EM LOTE
+    # ======================
+    @classmethod
+    def bulk_create(
+        cls,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 5000
+    ) -> int:
+        """
+        Insere jobs em lotes, sem construir objetos ORM.
+        
+        Cada lote é separado pelo conjunto de chaves das linhas, para que
+        colunas ausentes recebam o default da coluna nos dois caminhos.
+        Grupos pequenos usam executemany (insertmanyvalues); grupos a partir de
+        COPY_MIN_ROWS usam COPY FROM STDIN quando o driver é psycopg2.
+        Tudo roda na transação da sessão. Não faz commit.
+        
+        Args:
+            session: Sessão do banco
+            rows: Dicionários com os valores das colunas
+            batch_size: Linhas por lote (1000-10000)
+        
+        Returns:
+            Número de linhas inseridas
+        """
+        stmt = insert(cls)
+        use_copy = session.get_bind().dialect.driver == "psycopg2"
+        iterator = iter(rows)
+        total = 0
+        
+        while True:
+            chunk = list(islice(iterator, batch_size))
+            if not chunk:
+                break
+            
+            groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+            for row in chunk:
+                groups.setdefault(frozenset(row), []).append(row)
+            
+            for group in groups.values():
+                if use_copy and len(group) >= COPY_MIN_ROWS:
+                    cls._copy_rows(session, group)
+                else:
+                    session.execute(stmt, group)
+            total += len(chunk)
+        
+        return total
+    
+    @classmethod
+    def create_batch(cls, session: Session, rows: List[Dict[str, Any]]) -> List["ProcessingJob"]:
+        """
+        Insere os jobs com bulk_create e os carrega em um único SELECT.
+        Cada linha precisa trazer o id. Não faz commit.
+        
+        Args:
+            session: Sessão do banco
+            rows: Dicionários com os valores das colunas
+        
+        Returns:
+            Jobs na mesma ordem das linhas
+        """
+        if not rows:
+            return []
+        
+        cls.bulk_create(session, rows)
+        ids = [row["id"] for row in rows]
+        jobs = {job.id: job for job in session.scalars(select(cls).where(cls.id.in_(ids)))}
+        return [jobs[job_id] for job_id in ids]
+    
+    @classmethod
+    def _copy_rows(cls, session: Session, rows: List[Dict[str, Any]]) -> None:
+        """
+        Envia as linhas por COPY (CSV). Todas as linhas têm as mesmas chaves;
+        colunas ausentes com default Python escalar recebem esse default, as
+        demais ficam de fora do COPY (e usam o server default).
+        """
+        keys = rows[0].keys()
+        defaults = {}
+        for column in cls.__table__.columns:
+            if column.name in keys:
+                defaults[column.name] = None
+            elif column.default is not None and column.default.is_scalar:
+                defaults[column.name] = column.default.arg
+        
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(_copy_field(row.get(name, default)) for name, default in defaults.items()))
+            buffer.write("\n")
+        buffer.seek(0)
+        
+        column_list = ", ".join(defaults)
+        sql = (
+            f"COPY {cls.__tablename__} ({column_list}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+        )
+        with session.connection().connection.cursor() as cursor:
+            cursor.copy_expert(sql, buffer)
+    
     def start_processing(self):
         """Marca o job como iniciado."""
         self.status = JobStatus.PROCESSING
         self.started_at = datetime.now(timezone.utc)
+        # Relógio monotônico para a duração; started_at/completed_at ficam para persistência
+        self._perf_start_ns = time.perf_counter_ns()
         if self.created_at:
             self.queue_time_ms = int((self.started_at - self.created_at).total_seconds() * 1000)
     
-    def complete_successfully(self, results: Dict[str, Any], processing_time_ms: int):
+    def _elapsed_ms(self) -> Optional[int]:
+        """Duração desde start_processing em ms (None se não iniciado nesta instância)."""
+        perf_start_ns = getattr(self, "_perf_start_ns", None)
+        if perf_start_ns is None:
+            return None
+        return (time.perf_counter_ns() - perf_start_ns) // 1_000_000
+    
+    def complete_successfully(self, results: Dict[str, Any], processing_time_ms: Optional[int] = None):
         """Marca o job como concluído com sucesso."""
         self.status = JobStatus.COMPLETED
         self.completed_at = datetime.now(timezone.utc)
         self.results = results
-        self.processing_time_ms = processing_time_ms
-        
-        # Gerar resumo automático dos resultados
-        self.results_summary = self._generate_results_summary(results)
+        self.processing_time_ms = processing_time_ms if processing_time_ms is not None else self._elapsed_ms()
     
     def fail_with_error(self, error_code: str, error_message: str, error_details: Dict[str, Any] = None):
         """Marca o job como falhou."""
@@ -256,7 +568,11 @@ class ProcessingJob(BaseModel, LogMixin):
         self.error_message = error_message
         self.error_details = error_details or {}
         
-        if self.started_at:
+        elapsed_ms = self._elapsed_ms()
+        if elapsed_ms is not None:
+            self.processing_time_ms = elapsed_ms
+        elif self.started_at:
+            # Job iniciado em outra instância (ex.: recarregado do banco)
             self.processing_time_ms = int((self.completed_at - self.started_at).total_seconds() * 1000)
     
     def cancel(self, reason: str = None):
@@ -294,32 +610,51 @@ class ProcessingJob(BaseModel, LogMixin):
             self.quality_score = max(0.0, min(1.0, quality))
     
     def update_processing_params(self, params: Dict[str, Any]):
-        """Atualiza parâmetros de processamento."""
-        if self.processing_params:
-            self.processing_params.update(params)
-        else:
-            self.processing_params = params
+        """
+        Atualiza parâmetros de processamento.
+        
+        Para jobs já persistidos o merge é feito no PostgreSQL
+        (processing_params || params), atômico e sem reserializar as chaves existentes.
+        """
+        session = object_session(self)
+        if session is None or self.id is None or self in session.new:
+            self.processing_params = {**(self.processing_params or {}), **params}
+            return
+        
+        cls = type(self)
+        current = func.coalesce(cls.processing_params, text("'{}'::jsonb"))
+        patch = bindparam("params_patch", params, type_=JSONB)
+        session.execute(
+            update(cls)
+            .where(cls.id == self.id)
+            .values(processing_params=current.op("||", return_type=JSONB)(patch))
+            .execution_options(synchronize_session=False)
+        )
+        # Recarrega os parâmetros do banco no próximo acesso
+        session.expire(self, ["processing_params"])
     
     def add_debug_info(self, info: Dict[str, Any]):
-        """Adiciona informações de debug."""
-        debug_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "info": info
-        }
+        """
+        Adiciona informações de debug.
         
-        if self.debug_info:
-            try:
-                existing = json.loads(self.debug_info)
-                if isinstance(existing, list):
-                    existing.append(debug_data)
-                else:
-                    existing = [existing, debug_data]
-            except (json.JSONDecodeError, TypeError):
-                existing = [debug_data]
-        else:
-            existing = [debug_data]
+        Cada entrada é uma linha nova em job_debug_entries: nada é lido
+        nem regravado na linha do job.
+        """
+        entry = JobDebugEntry(ts=datetime.now(timezone.utc), info=info)
+        
+        session = object_session(self)
+        if session is None or self.id is None or self in session.new:
+            # Job ainda não persistido: a coleção está vazia e vai junto no flush
+            self.debug_entries.append(entry)
+            return
         
-        self.debug_info = json.dumps(existing)
+        entry.job_id = self.id
+        session.add(entry)
+    
+    @property
+    def debug_info(self) -> List[Dict[str, Any]]:
+        """Histórico de debug no formato [{timestamp, info}, ...]."""
+        return [entry.to_entry() for entry in self.debug_entries]
     
     def get_detailed_results(self) -> Dict[str, Any]:
         """
@@ -328,6 +663,19 @@ class ProcessingJob(BaseModel, LogMixin):
         Returns:
             Dicionário com todos os resultados do job
         """
+        # full_text é deferred: carrega de uma vez para todos os resultados OCR
+        # do job (instâncias já no identity map só recebem o atributo que faltava),
+        # em vez de deixá-lo fora da resposta ou buscar linha a linha
+        session = object_session(self)
+        if session is not None and any(
+            "full_text" in inspect(result).unloaded for result in self.ocr_results
+        ):
+            session.scalars(
+                select(OCRResult)
+                .where(OCRResult.job_id == self.id)
+                .options(undefer(OCRResult.full_text))
+            ).all()
+        
         detailed_results = {
             "job_info": self.to_dict(include_results=True, include_debug=False),
             "ocr_results": [result.to_dict() for result in self.ocr_results],
@@ -351,79 +699,6 @@ class ProcessingJob(BaseModel, LogMixin):
             "total_results": len(self.ocr_results) + len(self.barcode_results) + len(self.qrcode_results)
         }
     
-    def _generate_results_summary(self, results: Dict[str, Any]) -> str:
-        """Gera um resumo textual dos resultados."""
-        try:
-            if self.job_type == JobType.OCR:
-                return self._summarize_ocr_results(results)
-            elif self.job_type == JobType.BARCODE:
-                return self._summarize_barcode_results(results)
-            elif self.job_type == JobType.QRCODE:
-                return self._summarize_qrcode_results(results)
-            elif self.job_type == JobType.ALL:
-                return self._summarize_combined_results(results)
-            else:
-                return f"Processamento {self.job_type.value} concluído"
-        except Exception:
-            return "Resumo não disponível"
-    
-    def _summarize_ocr_results(self, results: Dict[str, Any]) -> str:
-        """Resumo para resultados OCR."""
-        text_blocks = results.get('text_blocks', [])
-        full_text = results.get('full_text', '')
-        language = results.get('language_detected', 'desconhecido')
-        
-        char_count = len(full_text)
-        block_count = len(text_blocks)
-        
-        return f"OCR: {block_count} blocos, {char_count} caracteres, idioma: {language}"
-    
-    def _summarize_barcode_results(self, results: Dict[str, Any]) -> str:
-        """Resumo para resultados de Barcode."""
-        barcodes = results.get('barcodes', [])
-        count = len(barcodes)
-        
-        if count == 0:
-            return "Barcode: Nenhum código encontrado"
-        elif count == 1:
-            barcode_type = barcodes[0].get('type', 'desconhecido')
-            return f"Barcode: 1 código {barcode_type} encontrado"
-        else:
-            types = [b.get('type', 'desconhecido') for b in barcodes]
-            unique_types = list(set(types))
-            return f"Barcode: {count} códigos encontrados ({', '.join(unique_types)})"
-    
-    def _summarize_qrcode_results(self, results: Dict[str, Any]) -> str:
-        """Resumo para resultados de QR Code."""
-        qr_codes = results.get('qr_codes', [])
-        count = len(qr_codes)
-        
-        if count == 0:
-            return "QR Code: Nenhum código encontrado"
-        elif count == 1:
-            data_type = qr_codes[0].get('data_type', 'texto')
-            return f"QR Code: 1 código {data_type} encontrado"
-        else:
-            return f"QR Code: {count} códigos encontrados"
-    
-    def _summarize_combined_results(self, results: Dict[str, Any]) -> str:
-        """Resumo para processamento combinado."""
-        summaries = []
-        
-        if 'ocr' in results:
-            ocr_summary = self._summarize_ocr_results(results['ocr'])
-            summaries.append(ocr_summary)
-        
-        if 'barcodes' in results:
-            barcode_summary = self._summarize_barcode_results(results['barcodes'])
-            summaries.append(barcode_summary)
-        
-        if 'qr_codes' in results:
-            qr_summary = self._summarize_qrcode_results(results['qr_codes'])
-            summaries.append(qr_summary)
-        
-        return " | ".join(summaries) if summaries else "Processamento combinado concluído"
-    
     def to_dict(self, include_results: bool = True, include_debug: bool = False, 
                 include_relationships: bool = False) -> Dict[str, Any]:
         """
@@ -434,22 +709,11 @@ class ProcessingJob(BaseModel, LogMixin):
             include_debug: Se deve incluir informações de debug
             include_relationships: Se deve incluir dados dos relacionamentos
         """
-        exclude_fields = set()
-        
-        if not include_results:
-            exclude_fields.update(['results', 'results_summary'])
-        
-        if not include_debug:
-            exclude_fields.update(['debug_info', 'processing_notes'])
-        
-        data = super().to_dict(exclude_fields=exclude_fields)
-        
-        # Converter enums para strings
-        if 'job_type' in data and data['job_type']:
-            data['job_type'] = data['job_type'].value if hasattr(data['job_type'], 'value') else str(data['job_type'])
+        # job_type/status já saem como valor do enum (conversor por coluna em BaseModel)
+        data = super().to_dict(exclude_fields=_EXCLUDE[(bool(include_results), bool(include_debug))])
         
-        if 'status' in data and data['status']:
-            data['status'] = data['status'].value if hasattr(data['status'], 'value') else str(data['status'])
+        if include_debug:
+            data['debug_info'] = self.debug_info
         
         # Incluir relacionamentos se solicitado
         if include_relationships:
@@ -465,3 +729,5 @@ class ProcessingJob(BaseModel, LogMixin):
         """Representação string do job."""
         return f"<ProcessingJob(id={self.id}, type={self.job_type}, status={self.status})>"
 
+# create_all precisa das funções antes de criar a coluna gerada
+event.listen(ProcessingJob.__table__, "before_create", DDL(RESULTS_SUMMARY_FUNCTIONS_SQL))
@@ -6,16 +6,100 @@ Complementa a tabela processing_jobs com dados específicos de QR codes.
 from sqlalchemy import Column, String, Text, Integer, Float, Boolean, JSON, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
+from urllib.parse import urlparse
 import re
 import json
 
 from app.models.database.base import BaseModel
 
+# Padrões de conteúdo suspeito em uma única alternação: uma varredura por registro,
+# e o grupo nomeado (lastgroup) indica qual família casou
+_SUSPICIOUS_RE = re.compile(
+    r"(?P<executable_download>(?:download|install|update)[^\n]*?(?:exe|apk|dmg))"
+    r"|(?P<urgency>urgent|immediate|click now|act fast)"
+    r"|(?P<money_scam>free money|earn \$|make money fast)"
+    r"|(?P<malware_alert>virus|malware|security alert)",
+    re.IGNORECASE
+)
+
+# Capacidade em caracteres alfanuméricos por versão (1-40) e nível de correção
+_VERSION_CAPACITIES: Mapping[int, Mapping[str, int]] = MappingProxyType({
+    version: MappingProxyType({"L": low, "M": medium, "Q": quartile, "H": high})
+    for version, low, medium, quartile, high in (
+        (1, 25, 20, 16, 10),
+        (2, 47, 38, 29, 20),
+        (3, 77, 61, 47, 35),
+        (4, 114, 90, 67, 50),
+        (5, 154, 122, 87, 64),
+        (6, 195, 154, 108, 84),
+        (7, 224, 178, 125, 93),
+        (8, 279, 221, 157, 122),
+        (9, 335, 262, 189, 143),
+        (10, 395, 311, 221, 174),
+        (11, 468, 366, 259, 200),
+        (12, 535, 419, 296, 227),
+        (13, 619, 483, 352, 259),
+        (14, 667, 528, 376, 283),
+        (15, 758, 600, 426, 321),
+        (16, 854, 656, 470, 365),
+        (17, 938, 734, 531, 408),
+        (18, 1046, 816, 574, 452),
+        (19, 1153, 909, 644, 493),
+        (20, 1249, 970, 702, 557),
+        (21, 1352, 1035, 742, 587),
+        (22, 1460, 1134, 823, 640),
+        (23, 1588, 1248, 890, 672),
+        (24, 1704, 1326, 963, 744),
+        (25, 1853, 1451, 1041, 779),
+        (26, 1990, 1542, 1094, 864),
+        (27, 2132, 1637, 1172, 910),
+        (28, 2223, 1732, 1263, 958),
+        (29, 2369, 1839, 1322, 1016),
+        (30, 2520, 1994, 1429, 1080),
+        (31, 2677, 2113, 1499, 1150),
+        (32, 2840, 2238, 1618, 1226),
+        (33, 3009, 2369, 1700, 1307),
+        (34, 3183, 2506, 1787, 1394),
+        (35, 3351, 2632, 1867, 1431),
+        (36, 3537, 2780, 1966, 1530),
+        (37, 3729, 2894, 2071, 1591),
+        (38, 3927, 3054, 2181, 1658),
+        (39, 4087, 3220, 2298, 1774),
+        (40, 4296, 3391, 2420, 1852),
+    )
+})
+
+# Tipo de conteúdo pelo prefixo (em minúsculas): (prefixos, data_type, método de análise)
+_TYPE_DISPATCH = (
+    (("http://", "https://", "www."), "url", "_analyze_url"),
+    (("mailto:",), "email", None),
+    (("tel:",), "phone", None),
+    (("sms:",), "sms", None),
+    (("wifi:",), "wifi", "_analyze_wifi"),
+    (("geo:",), "geo", "_analyze_geo"),
+    (("begin:vcard",), "vcard", "_analyze_vcard"),
+)
+
+# Maior prefixo de _TYPE_DISPATCH: só esse trecho dos dados é normalizado
+_TYPE_PREFIX_LENGTH = max(len(p) for prefixes, _, _ in _TYPE_DISPATCH for p in prefixes)
+
+# Domínios de encurtadores de URL, comparados com o host da URL
+_SHORTENERS = frozenset({
+    "bit.ly", "tinyurl.com", "t.co", "goo.gl", "short.link",
+    "ow.ly", "buff.ly", "is.gd", "tiny.cc"
+})
+
 class QRCodeResult(BaseModel):
     """
     Modelo para resultados detalhados de leitura de códigos QR.
     Armazena informações específicas sobre cada QR code encontrado.
+    
+    O relacionamento job é lazy="select": carregar um único resultado não
+    dispara SELECTs extras. Listas que precisam do job devem usar
+    selectinload(QRCodeResult.job); consultas por id ou job_id usam
+    raiseload(QRCodeResult.job).
     """
     
     __tablename__ = "qrcode_results"
@@ -312,26 +396,15 @@ class QRCodeResult(BaseModel):
         
         # Calcular utilização de capacidade
         if self.version and self.data_length:
-            capacities = self._get_version_capacities()
-            if self.version in capacities:
-                max_capacity = capacities[self.version].get(self.error_correction_level, 0)
-                if max_capacity > 0:
-                    self.data_utilization = min(1.0, self.data_length / max_capacity)
+            capacities = _VERSION_CAPACITIES.get(self.version)
+            max_capacity = capacities.get(self.error_correction_level, 0) if capacities else 0
+            if max_capacity > 0:
+                self.data_utilization = min(1.0, self.data_length / max_capacity)
         
         # Analisar conteúdo
         self._analyze_content()
         self._analyze_security()
     
-    def _get_version_capacities(self) -> Dict[int, Dict[str, int]]:
-        """Retorna capacidades por versão e nível de correção."""
-        # Capacidades para caracteres alfanuméricos (simplificado)
-        return {
-            1: {"L": 25, "M": 20, "Q": 16, "H": 10},
-            2: {"L": 47, "M": 38, "Q": 29, "H": 20},
-            3: {"L": 77, "M": 61, "Q": 47, "H": 35},
-            # ... mais versões conforme necessário
-        }
-    
     def _analyze_content(self) -> None:
         """Analisa o conteúdo do QR code para extrair informações."""
         if not self.qr_data:
@@ -339,60 +412,21 @@ class QRCodeResult(BaseModel):
         
         data = self.qr_data.strip()
         
-        # Determinar tipo de conteúdo
-        if self._is_url(data):
-            self.data_type = "url"
-            self._analyze_url(data)
-        elif self._is_email(data):
-            self.data_type = "email"
-        elif self._is_phone(data):
-            self.data_type = "phone"
-        elif self._is_wifi(data):
-            self.data_type = "wifi"
-            self._analyze_wifi(data)
-        elif self._is_geo(data):
-            self.data_type = "geo"
-            self._analyze_geo(data)
-        elif self._is_vcard(data):
-            self.data_type = "vcard"
-            self._analyze_vcard(data)
-        elif self._is_sms(data):
-            self.data_type = "sms"
-        else:
-            self.data_type = "text"
-    
-    def _is_url(self, data: str) -> bool:
-        """Verifica se é uma URL."""
-        return data.lower().startswith(('http://', 'https://', 'www.'))
-    
-    def _is_email(self, data: str) -> bool:
-        """Verifica se é um email."""
-        return data.startswith('mailto:') or '@' in data and '.' in data
-    
-    def _is_phone(self, data: str) -> bool:
-        """Verifica se é um telefone."""
-        return data.startswith('tel:') or data.startswith('sms:')
-    
-    def _is_wifi(self, data: str) -> bool:
-        """Verifica se é configuração WiFi."""
-        return data.upper().startswith('WIFI:')
-    
-    def _is_geo(self, data: str) -> bool:
-        """Verifica se é localização geográfica."""
-        return data.lower().startswith('geo:')
-    
-    def _is_vcard(self, data: str) -> bool:
-        """Verifica se é um vCard."""
-        return data.upper().startswith('BEGIN:VCARD')
-    
-    def _is_sms(self, data: str) -> bool:
-        """Verifica se é SMS."""
-        return data.startswith('sms:')
+        # Determinar tipo de conteúdo: só o prefixo é convertido para minúsculas
+        prefix = data[:_TYPE_PREFIX_LENGTH].lower()
+        for prefixes, data_type, analyzer in _TYPE_DISPATCH:
+            if prefix.startswith(prefixes):
+                self.data_type = data_type
+                if analyzer:
+                    getattr(self, analyzer)(data)
+                return
+        
+        # Sem prefixo conhecido: endereço de email solto ou texto
+        self.data_type = "email" if "@" in data and "." in data else "text"
     
     def _analyze_url(self, data: str) -> None:
         """Analisa URL para extrair informações."""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(data)
             
             self.url_info = {
@@ -470,34 +504,28 @@ class QRCodeResult(BaseModel):
         security_flags = []
         
         # Verificar URL encurtadoras
-        if self.data_type == "url":
-            shorteners = [
-                "bit.ly", "tinyurl.com", "t.co", "goo.gl", "short.link",
-                "ow.ly", "buff.ly", "is.gd", "tiny.cc"
-            ]
-            
-            for shortener in shorteners:
-                if shortener in self.qr_data.lower():
-                    self.url_shortener_detected = True
-                    security_flags.append("url_shortener")
-                    break
+        if self.data_type == "url" and self._url_host() in _SHORTENERS:
+            self.url_shortener_detected = True
+            security_flags.append("url_shortener")
         
         # Verificar conteúdo suspeito
-        suspicious_patterns = [
-            r"(?i)(download|install|update).*(exe|apk|dmg)",
-            r"(?i)(urgent|immediate|click now|act fast)",
-            r"(?i)(free money|earn \$|make money fast)",
-            r"(?i)(virus|malware|security alert)"
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, self.qr_data):
-                self.suspicious_content = True
-                security_flags.append("suspicious_content")
-                break
+        match = _SUSPICIOUS_RE.search(self.qr_data)
+        if match:
+            self.suspicious_content = True
+            security_flags.extend(("suspicious_content", match.lastgroup))
         
         self.security_flags = security_flags if security_flags else None
     
+    def _url_host(self) -> str:
+        """Host da URL em minúsculas, sem porta, credenciais nem 'www.'."""
+        domain = (self.url_info or {}).get("domain")
+        if not domain:
+            # URLs sem esquema ('www.bit.ly/x') não têm netloc no urlparse
+            domain = urlparse("//" + self.qr_data.strip()).netloc
+        
+        host = domain.rpartition("@")[2].split(":", 1)[0].lower()
+        return host[4:] if host.startswith("www.") else host
+    
     def set_quality_from_score(self, score: float) -> None:
         """
         Define descrição de qualidade baseada no score.
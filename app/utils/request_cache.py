@@ -0,0 +1,85 @@
+# app/utils/request_cache.py
+"""
+Cache de consultas com escopo de requisição.
+O dicionário vive em uma ContextVar ativada pelo TimingMiddleware, então
+resultados nunca vazam entre requisições nem entre sessões.
+"""
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_request_cache: ContextVar[Optional[Dict[Tuple[Hashable, ...], Any]]] = ContextVar(
+    "request_cache", default=None
+)
+
+def start_request_cache() -> Token:
+    """
+    Ativa um cache vazio para a requisição atual.
+    
+    Returns:
+        Token para restaurar o estado anterior com end_request_cache
+    """
+    return _request_cache.set({})
+
+def end_request_cache(token: Token) -> None:
+    """
+    Descarta o cache da requisição atual.
+    
+    Args:
+        token: Token retornado por start_request_cache
+    """
+    _request_cache.reset(token)
+
+def invalidate(func_name: str, *args: Hashable) -> None:
+    """
+    Remove uma entrada do cache da requisição atual, se houver.
+    
+    Args:
+        func_name: Nome da função cacheada
+        *args: Argumentos usados na chamada
+    """
+    cache = _request_cache.get()
+    if cache is not None:
+        cache.pop((func_name, *args), None)
+
+def request_scoped(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Retorna o objeto da requisição atual associado a `key`, criando-o com
+    `factory` no primeiro uso. Fora de uma requisição, cria um novo a cada chamada.
+    
+    Args:
+        key: Identificador do objeto no cache da requisição
+        factory: Construtor chamado quando o objeto ainda não existe
+    """
+    cache = _request_cache.get()
+    if cache is None:
+        return factory()
+    
+    cache_key = ("__scoped__", key)
+    obj = cache.get(cache_key)
+    if obj is None:
+        obj = cache[cache_key] = factory()
+    return obj
+
+def request_cached(func: Callable) -> Callable:
+    """
+    Decorator para corrotinas de leitura: chamadas repetidas com os mesmos
+    argumentos na mesma requisição fazem uma única ida ao banco.
+    Fora de uma requisição (sem cache ativo) a função é chamada normalmente.
+    """
+    @wraps(func)
+    async def wrapper(*args: Hashable):
+        cache = _request_cache.get()
+        if cache is None:
+            return await func(*args)
+        
+        key = (func.__name__, *args)
+        if key in cache:
+            result = cache[key]
+        else:
+            result = cache[key] = await func(*args)
+        
+        # Cópia rasa para que o chamador não altere a lista em cache
+        return list(result) if isinstance(result, list) else result
+    
+    return wrapper
\ No newline at end of file
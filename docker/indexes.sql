@@ -12,6 +12,16 @@ CREATE INDEX idx_processing_jobs_session_id ON processing_jobs (session_id);
 CREATE INDEX idx_jobs_type_status ON processing_jobs (job_type, status);
 CREATE INDEX idx_jobs_created_status ON processing_jobs (created_at, status);
 
+-- Paginação keyset (created_at DESC, id DESC)
+CREATE INDEX idx_jobs_created_id ON processing_jobs (created_at DESC, id DESC);
+
+-- Predicados quentes de CRUDProcessingJob
+CREATE INDEX idx_pj_status_created ON processing_jobs (status, created_at DESC);
+CREATE INDEX idx_pj_session_created ON processing_jobs (session_id, created_at DESC);
+CREATE INDEX idx_pj_type_created ON processing_jobs (job_type, created_at DESC);
+CREATE INDEX idx_pj_processing_started ON processing_jobs (started_at) WHERE status = 'processing';
+CREATE INDEX idx_pj_failed_error_code ON processing_jobs (created_at, error_code) WHERE status = 'failed' AND error_code IS NOT NULL;
+
 -- Para resultados (assumindo tabelas)
 -- Para barcode_results (se existir)
 CREATE INDEX idx_barcode_results_job_id ON barcode_results (job_id);
@@ -24,5 +34,12 @@ CREATE INDEX idx_ocr_results_language ON ocr_results (language);
 -- Para qrcode_results (se existir)
 CREATE INDEX idx_qrcode_results_job_id ON qrcode_results (job_id);
 
+-- Busca textual (ILIKE '%termo%') via trigramas
+CREATE INDEX idx_pj_input_filename_trgm ON processing_jobs USING GIN (input_filename gin_trgm_ops);
+CREATE INDEX idx_pj_error_message_trgm ON processing_jobs USING GIN (error_message gin_trgm_ops);
+CREATE INDEX idx_ocr_results_full_text_trgm ON ocr_results USING GIN (full_text gin_trgm_ops);
+CREATE INDEX idx_barcode_results_data_trgm ON barcode_results USING GIN (barcode_data gin_trgm_ops);
+CREATE INDEX idx_qrcode_results_data_trgm ON qrcode_results USING GIN (qr_data gin_trgm_ops);
+
 -- Otimização de queries de analytics
 ANALYZE processing_jobs;
\ No newline at end of file
@@ -0,0 +1,46 @@
+# tests/test_cursor.py
+"""
+Cursores da paginação keyset: encode_cursor/decode_cursor devem ser inversos
+e cursores malformados viram ValidationError.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer
+from sqlalchemy.orm import declarative_base
+
+from app.crud.base import CRUDBase
+from app.models.database.base import uuid7
+from app.utils.exceptions import ValidationError
+
+ModelBase = declarative_base()
+
+class Item(ModelBase):
+    __tablename__ = "cursor_items"
+    
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime)
+
+crud = CRUDBase(Item)
+
+@pytest.mark.parametrize("created_at", [
+    datetime(2024, 5, 17, 12, 30, 45, 123456, tzinfo=timezone.utc),
+    datetime(2024, 5, 17, 12, 30, 45),
+])
+def test_round_trip(created_at):
+    obj = SimpleNamespace(created_at=created_at, id=uuid7())
+    cursor = crud.encode_cursor(obj)
+    assert crud.decode_cursor(cursor) == (created_at, obj.id)
+    assert isinstance(crud.decode_cursor(cursor)[1], UUID)
+
+def test_cursor_is_urlsafe():
+    obj = SimpleNamespace(created_at=datetime(2024, 1, 1, tzinfo=timezone.utc), id=uuid7())
+    cursor = crud.encode_cursor(obj)
+    assert not set(cursor) & {"+", "/"}
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "eHx5", ""])
+def test_invalid_cursor_raises_validation_error(cursor):
+    with pytest.raises(ValidationError):
+        crud.decode_cursor(cursor)
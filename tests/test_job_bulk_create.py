@@ -0,0 +1,161 @@
+# tests/test_job_bulk_create.py
+"""
+ProcessingJob.bulk_create: o caminho COPY (psycopg2) deve gravar as mesmas
+linhas que o caminho executemany, inclusive com NULLs, a string "\\N",
+aspas, vírgulas, quebras de linha, JSON e linhas com chaves diferentes.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.models.database import processing_job as processing_job_module
+from app.models.database.base import uuid7
+from app.models.database.processing_job import JobStatus, JobType, ProcessingJob
+
+class FakeSession:
+    """Registra o que bulk_create envia ao banco em cada caminho."""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.executed = []
+        self.copied = []
+    
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(driver=self.driver))
+    
+    def execute(self, stmt, rows):
+        self.executed.extend(rows)
+    
+    def connection(self):
+        session = self
+        
+        class Cursor:
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc):
+                return False
+            
+            def copy_expert(self, sql, buffer):
+                session.copied.append((sql, buffer.read()))
+        
+        return SimpleNamespace(connection=SimpleNamespace(cursor=Cursor))
+
+def parse_copy_csv(data):
+    """Lê o CSV como o COPY do PostgreSQL: só \\N sem aspas vira NULL."""
+    records, record, i = [], [], 0
+    while i < len(data):
+        if data[i] == '"':
+            i += 1
+            value = []
+            while True:
+                if data[i] == '"':
+                    if data[i + 1:i + 2] == '"':
+                        value.append('"')
+                        i += 2
+                        continue
+                    i += 1
+                    break
+                value.append(data[i])
+                i += 1
+            record.append("".join(value))
+        else:
+            end = i
+            while data[end] not in ",\n":
+                end += 1
+            raw = data[i:end]
+            record.append(None if raw == "\\N" else raw)
+            i = end
+        if data[i] == "\n":
+            records.append(record)
+            record = []
+        i += 1
+    return records
+
+def as_copy_text(value):
+    """Valor que o PostgreSQL recebe no caminho executemany, como texto."""
+    if value is None:
+        return None
+    if isinstance(value, (JobStatus, JobType)):
+        return value.value
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def make_rows(count):
+    texts = [None, "\\N", "", 'aspas "duplas"', "vírgula, no meio", "linha\nquebrada", "simples"]
+    rows = []
+    for i in range(count):
+        row = {
+            "id": uuid7(),
+            "job_type": JobType.OCR,
+            "input_filename": texts[i % len(texts)],
+            "input_size_bytes": i if i % 3 else None,
+            "processing_params": {"batch_index": i, "note": texts[i % len(texts)]},
+            "completed_at": datetime(2024, 1, 1, tzinfo=timezone.utc) if i % 2 else None
+        }
+        # Metade das linhas não traz status: recebe o default da coluna (pending)
+        if i % 2:
+            row["status"] = JobStatus.COMPLETED
+        rows.append(row)
+    return rows
+
+def inserted_by_executemany(session):
+    status_default = ProcessingJob.__table__.c.status.default.arg
+    return {
+        row["id"]: {
+            name: as_copy_text(row.get(name, status_default if name == "status" else None))
+            for name in ("status", "job_type", "input_filename", "input_size_bytes",
+                         "processing_params", "completed_at")
+        }
+        for row in session.executed
+    }
+
+def inserted_by_copy(session):
+    inserted = {}
+    for sql, data in session.copied:
+        columns = sql.split("(", 1)[1].split(")", 1)[0].split(", ")
+        for record in parse_copy_csv(data):
+            values = dict(zip(columns, record))
+            inserted[values.pop("id")] = values
+    return inserted
+
+def test_copy_matches_executemany(monkeypatch):
+    monkeypatch.setattr(processing_job_module, "COPY_MIN_ROWS", 5)
+    rows = make_rows(40)
+    
+    via_copy = FakeSession("psycopg2")
+    via_executemany = FakeSession("psycopg")
+    assert ProcessingJob.bulk_create(via_copy, rows, batch_size=20) == 40
+    assert ProcessingJob.bulk_create(via_executemany, rows, batch_size=20) == 40
+    
+    assert via_copy.executed == [] and via_executemany.copied == []
+    expected = {str(job_id): values for job_id, values in inserted_by_executemany(via_executemany).items()}
+    assert inserted_by_copy(via_copy) == expected
+
+def test_literal_backslash_n_is_not_null(monkeypatch):
+    monkeypatch.setattr(processing_job_module, "COPY_MIN_ROWS", 1)
+    session = FakeSession("psycopg2")
+    ProcessingJob.bulk_create(session, [{"id": uuid7(), "job_type": JobType.OCR, "input_filename": "\\N"}])
+    
+    (record,) = inserted_by_copy(session).values()
+    assert record["input_filename"] == "\\N"
+    assert record["status"] == "pending"
+
+def test_mixed_keys_are_grouped(monkeypatch):
+    monkeypatch.setattr(processing_job_module, "COPY_MIN_ROWS", 2)
+    session = FakeSession("psycopg2")
+    rows = make_rows(6)
+    rows[0].pop("completed_at")
+    
+    ProcessingJob.bulk_create(session, rows)
+    
+    # A linha sem completed_at vai sozinha (executemany); as demais formam dois grupos COPY
+    assert [row["id"] for row in session.executed] == [rows[0]["id"]]
+    assert len(session.copied) == 2
+    assert all("completed_at" in sql for sql, _ in session.copied)
+    assert "created_at" not in session.copied[0][0]
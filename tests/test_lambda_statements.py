@@ -0,0 +1,89 @@
+# tests/test_lambda_statements.py
+"""
+Regressão dos statements lambda_stmt (CRUDBase.exists, CRUDBase.get_by_field,
+CRUDProcessingJob.get_pending_jobs): cada chamada deve usar os próprios
+argumentos, mesmo com o listener de soft delete registrado.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, DateTime, Enum, Integer, String, create_engine, event
+from sqlalchemy.orm import Session, declarative_base
+
+from app.crud import processing_job as processing_job_module
+from app.crud.base import CRUDBase
+from app.crud.processing_job import CRUDProcessingJob
+from app.models.database.base import JobStatus, SoftDeleteMixin, _filter_soft_deleted
+
+ModelBase = declarative_base()
+
+class Item(ModelBase):
+    __tablename__ = "items"
+    
+    id = Column(Integer, primary_key=True)
+    name = Column(String(20))
+    created_at = Column(DateTime)
+
+class ArchivedItem(ModelBase, SoftDeleteMixin):
+    """Herdar o mixin registra o listener de soft delete."""
+    __tablename__ = "archived_items"
+    
+    id = Column(Integer, primary_key=True)
+
+class Job(ModelBase):
+    """Substitui ProcessingJob (tipos PostgreSQL) nas lambdas de get_pending_jobs."""
+    __tablename__ = "jobs"
+    
+    id = Column(Integer, primary_key=True)
+    status = Column(Enum(JobStatus, values_callable=lambda obj: [e.value for e in obj], native_enum=False))
+    created_at = Column(DateTime)
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ModelBase.metadata.create_all(engine)
+    
+    base = datetime(2026, 1, 1)
+    with Session(engine) as session:
+        session.add_all(
+            Item(id=i, name=f"n{i}", created_at=base + timedelta(minutes=i))
+            for i in range(1, 6)
+        )
+        session.add_all(
+            Job(id=i, status=JobStatus.PENDING, created_at=base + timedelta(minutes=i))
+            for i in range(1, 6)
+        )
+        session.add_all([
+            ArchivedItem(id=1, is_deleted=False),
+            ArchivedItem(id=2, is_deleted=True)
+        ])
+        session.commit()
+        yield session
+
+def test_soft_delete_listener_registered():
+    assert event.contains(Session, "do_orm_execute", _filter_soft_deleted)
+
+def test_soft_deleted_rows_filtered(db):
+    assert [row.id for row in db.query(ArchivedItem).all()] == [1]
+    assert len(db.query(ArchivedItem).execution_options(include_deleted=True).all()) == 2
+
+def test_get_by_field_uses_each_call_value(db):
+    crud = CRUDBase(Item)
+    
+    assert crud.get_by_field(db, "name", "n2").id == 2
+    assert crud.get_by_field(db, "name", "n4").id == 4
+    assert crud.get_by_field(db, "name", "missing") is None
+
+def test_exists_uses_each_call_id(db):
+    crud = CRUDBase(Item)
+    
+    assert crud.exists(db, 1) is True
+    assert crud.exists(db, 99) is False
+    assert crud.exists(db, 3) is True
+
+def test_get_pending_jobs_uses_each_call_limit(db, monkeypatch):
+    monkeypatch.setattr(processing_job_module, "ProcessingJob", Job)
+    crud = CRUDProcessingJob(Job)
+    
+    assert [job.id for job in crud.get_pending_jobs(db, limit=1)] == [1]
+    assert [job.id for job in crud.get_pending_jobs(db, limit=3)] == [1, 2, 3]
@@ -0,0 +1,83 @@
+# tests/test_ocr_stats.py
+"""
+Paridade entre compute_block_stats (Welford, um documento) e
+compute_ocr_stats (NumPy, em lote), e dos dois com o cálculo anterior
+baseado no módulo statistics.
+"""
+import random
+import statistics
+
+import pytest
+
+from app.core.ocr_stats import LOW_CONFIDENCE_THRESHOLD, compute_block_stats, compute_ocr_stats
+
+CONFIDENCE_KEYS = ("confidence_avg", "confidence_min", "confidence_max", "confidence_std")
+
+def _blocks(confidences):
+    return [
+        {"text": f"bloco {i}", "confidence": confidence}
+        for i, confidence in enumerate(confidences)
+    ]
+
+def _reference_stats(text_blocks):
+    """Estatísticas de confiança como eram calculadas antes (statistics)."""
+    confidences = [b["confidence"] for b in text_blocks if b.get("confidence") is not None]
+    if not confidences:
+        return {}
+    stats = {
+        "confidence_avg": statistics.mean(confidences),
+        "confidence_min": min(confidences),
+        "confidence_max": max(confidences),
+        "blocks_with_low_confidence": sum(1 for c in confidences if c < LOW_CONFIDENCE_THRESHOLD)
+    }
+    if len(confidences) > 1:
+        stats["confidence_std"] = statistics.stdev(confidences)
+    return stats
+
+def _assert_matches(actual, expected):
+    assert actual.keys() >= expected.keys()
+    for key, value in expected.items():
+        if key in CONFIDENCE_KEYS:
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-12)
+        else:
+            assert actual[key] == value
+
+rng = random.Random(42)
+BATCH = [
+    [],
+    _blocks([0.95]),
+    _blocks([0.5, 0.99]),
+    _blocks([0.8, 0.8, 0.8]),
+    _blocks([0.79999, 0.8, 0.80001]),
+    [{"text": "sem confiança"}, {"text": "também não", "confidence": None}],
+    [{"text": "misto", "confidence": 0.7}, {"text": "sem"}, {"text": "x", "confidence": 0.9}],
+    _blocks([rng.random() for _ in range(500)]),
+    _blocks([0.999999 + rng.random() * 1e-7 for _ in range(200)]),
+]
+
+@pytest.mark.parametrize("text_blocks", BATCH)
+def test_block_stats_match_statistics(text_blocks):
+    _assert_matches(compute_block_stats(text_blocks), _reference_stats(text_blocks))
+
+def test_batch_matches_statistics():
+    for stats, text_blocks in zip(compute_ocr_stats(BATCH), BATCH):
+        _assert_matches(stats, _reference_stats(text_blocks))
+
+def test_batch_matches_single_document():
+    batch = compute_ocr_stats(BATCH)
+    assert len(batch) == len(BATCH)
+    for stats, text_blocks in zip(batch, BATCH):
+        single = compute_block_stats(text_blocks)
+        assert stats.keys() == single.keys()
+        _assert_matches(stats, single)
+
+def test_empty_document():
+    assert compute_block_stats([]) == {}
+    assert compute_ocr_stats([[]]) == [{}]
+    assert compute_ocr_stats([]) == []
+
+def test_single_confidence_has_no_std():
+    stats = compute_block_stats(_blocks([0.9]))
+    assert "confidence_std" not in stats
+    assert stats["total_blocks"] == 1
+    assert stats["full_text"] == "bloco 0"
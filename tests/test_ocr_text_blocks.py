@@ -0,0 +1,35 @@
+# tests/test_ocr_text_blocks.py
+"""
+OCRResult.to_dict(include_text_blocks=True) monta os blocos a partir de
+ocr_text_blocks; o JSON legado text_blocks só é usado quando não há linhas.
+"""
+from app.models.database.base import uuid7
+from app.models.database.ocr_result import OCRResult
+from app.models.database.ocr_text_block import OCRTextBlock
+
+BLOCKS = [
+    {"text": "Nota fiscal", "bbox": [[0, 0], [10, 0], [10, 5], [0, 5]], "confidence": 0.97},
+    {"text": "Total: 10,00", "bbox": [[0, 6], [12, 6], [12, 11], [0, 11]], "confidence": 0.71},
+    {"text": "sem confiança", "bbox": [[0, 12], [9, 12], [9, 17], [0, 17]]},
+]
+
+def _result_with_rows(blocks):
+    result = OCRResult(id=uuid7(), job_id=uuid7())
+    result.text_block_rows = [
+        OCRTextBlock(**row)
+        for row in OCRTextBlock.rows_from_blocks(result.id, result.job_id, blocks)
+    ]
+    return result
+
+def test_text_blocks_built_from_rows():
+    result = _result_with_rows(BLOCKS)
+    assert result.text_blocks is None
+    assert result.to_dict(include_text_blocks=True)["text_blocks"] == BLOCKS
+
+def test_legacy_json_used_without_rows():
+    result = OCRResult(id=uuid7(), job_id=uuid7(), text_blocks=BLOCKS)
+    assert result.to_dict(include_text_blocks=True)["text_blocks"] == BLOCKS
+
+def test_text_blocks_excluded_by_default():
+    result = _result_with_rows(BLOCKS)
+    assert "text_blocks" not in result.to_dict()
@@ -0,0 +1,39 @@
+# tests/test_qrcode_security.py
+"""
+Análise de segurança de QRCodeResult: security_flags recebe
+"suspicious_content" seguido da família do padrão (match.lastgroup).
+"""
+import pytest
+
+from app.models.database.qrcode_result import QRCodeResult
+
+@pytest.mark.parametrize("qr_data, family", [
+    ("Download our app now from the store at example.com/app.apk", "executable_download"),
+    ("install the update.exe", "executable_download"),
+    ("UPDATE required: " + "x" * 200 + " setup.dmg", "executable_download"),
+    ("URGENT: confirm your account", "urgency"),
+    ("Click now to claim", "urgency"),
+    ("Earn $500 a day", "money_scam"),
+    ("Make money fast!", "money_scam"),
+    ("Security alert on your device", "malware_alert"),
+    ("Your phone has a virus", "malware_alert"),
+])
+def test_suspicious_content_flags_family(qr_data, family):
+    result = QRCodeResult(qr_data=qr_data, data_type="text")
+    assert result.suspicious_content is True
+    assert result.security_flags == ["suspicious_content", family]
+
+@pytest.mark.parametrize("qr_data", [
+    "Hello, world",
+    "download the manual\nopen file.apk",
+    "https://example.com/docs",
+])
+def test_clean_content_has_no_flags(qr_data):
+    result = QRCodeResult(qr_data=qr_data, data_type="text")
+    assert not result.suspicious_content
+    assert result.security_flags is None
+
+def test_shortener_and_suspicious_flags_combined():
+    result = QRCodeResult(qr_data="https://bit.ly/urgent", data_type="url")
+    assert result.url_shortener_detected is True
+    assert result.security_flags == ["url_shortener", "suspicious_content", "urgency"]
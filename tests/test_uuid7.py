@@ -0,0 +1,37 @@
+# tests/test_uuid7.py
+"""
+Layout de bits do uuid7() (RFC 9562): timestamp em ms nos 48 bits mais
+significativos, versão 7 e variante RFC.
+"""
+import time
+import uuid
+
+from app.models.database import base as base_module
+from app.models.database.base import uuid7
+
+def test_version_and_variant():
+    for _ in range(100):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        assert (value.int >> 76) & 0xF == 0x7
+        assert (value.int >> 62) & 0b11 == 0b10
+
+def test_timestamp_in_leading_bits():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+def test_ordered_across_milliseconds(monkeypatch):
+    clock = iter(range(1_700_000_000_000, 1_700_000_000_050))
+    monkeypatch.setattr(base_module.time, "time_ns", lambda: next(clock) * 1_000_000)
+    ids = [uuid7() for _ in range(50)]
+    assert ids == sorted(ids)
+    assert ids == sorted(ids, key=str)
+
+def test_unique_within_same_millisecond(monkeypatch):
+    monkeypatch.setattr(base_module.time, "time_ns", lambda: 1_700_000_000_000 * 1_000_000)
+    ids = {uuid7() for _ in range(1000)}
+    assert len(ids) == 1000
+    assert {value.int >> 80 for value in ids} == {1_700_000_000_000}